@@ -44,6 +44,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/x-rst",
     install_requires=requirements,
+    extras_require={"orjson": ["orjson>=3.8"]},
     setup_requires=["wheel"],
     entry_points={
         "console_scripts": [
@@ -20,6 +20,7 @@ from superannotate.lib.app.input_converters import export_annotation
 from superannotate.lib.app.input_converters import import_annotation
 from superannotate.lib.app.interface.sdk_interface import SAClient
 from superannotate.lib.app.interface.sdk_interface import ItemContext
+from superannotate.lib.app.interface.async_sdk_interface import AsyncSAClient
 
 SESSIONS = {}
 
@@ -27,6 +28,7 @@ SESSIONS = {}
 __all__ = [
     "__version__",
     "SAClient",
+    "AsyncSAClient",
     "ItemContext",
     # Utils
     "enums",
@@ -1,11 +1,11 @@
 import copy
-import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
 
 import lib.core as constances
 import pandas as pd
+from lib.core import json
 from lib.core import VECTOR_ANNOTATION_POSTFIX
 from lib.core.exceptions import AppException
 
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import warnings
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from typing import Literal
+
+from lib.app.interface.responses import QueryResult
+from lib.app.interface.sdk_interface import SAClient
+from lib.core.exceptions import AppException
+from lib.core.utils import finalize_loop
+
+
+class AsyncSAClient:
+    """Create AsyncSAClient instance to use the SDK from asyncio applications.
+    It exposes awaitable versions of the most used SAClient methods, the arguments,
+    results and errors are the same as of the corresponding SAClient methods.
+
+    get_annotations and upload_annotations run in the calling event loop, only their
+    blocking requests (e.g. the listing of the items) are made in threads.
+    The other methods are the synchronous methods executed by at most max_workers
+    threads. Any number of the calls can be awaited concurrently.
+
+    :param token: team token
+    :type token: str
+
+    :param config_path: path to config file
+    :type config_path: path-like (str or Path)
+
+    :param max_workers: the maximum number of calls executed at once, defaults to 16
+    :type max_workers: int
+
+    Request Example:
+    ::
+
+        async with AsyncSAClient() as sa_client:
+            annotations = await asyncio.gather(
+                *[sa_client.get_annotations(f"project/{name}") for name in folders]
+            )
+    """
+
+    MAX_WORKERS = 16
+
+    def __init__(
+        self,
+        token: str | None = None,
+        config_path: str | None = None,
+        max_workers: int | None = None,
+    ):
+        self._client = SAClient(token=token, config_path=config_path)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.MAX_WORKERS,
+            thread_name_prefix="sa-async-client",
+        )
+
+    @property
+    def client(self) -> SAClient:
+        """The synchronous client the calls are delegated to."""
+        return self._client
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def close(self):
+        """Waits for the running calls to finish and releases the worker threads
+        and the connections pooled for the running event loop."""
+        await asyncio.to_thread(self._executor.shutdown)
+        await finalize_loop()
+
+    async def __aenter__(self) -> AsyncSAClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def get_annotations(
+        self,
+        project: str | int | tuple[int, int] | tuple[str, str],
+        items: list[str] | list[int] | None = None,
+        *,
+        data_spec: Literal["default", "multimodal"] = "default",
+        since: datetime | str | None = None,
+    ) -> list[dict]:
+        """Awaitable version of :meth:`SAClient.get_annotations`."""
+        project, folder = await self._run(
+            self._client.controller.get_project_folder, project
+        )
+        response = await self._client.controller.annotations.list_async(
+            project,
+            folder,
+            items,
+            transform_version="llmJsonV2" if data_spec == "multimodal" else None,
+            since=since,
+        )
+        if response.errors:
+            raise AppException(response.errors)
+        return response.data
+
+    async def upload_annotations(
+        self,
+        project: str | int | tuple[int, int] | tuple[str, str],
+        annotations: list[dict],
+        keep_status: bool | None = None,
+        *,
+        data_spec: Literal["default", "multimodal"] = "default",
+    ) -> dict:
+        """Awaitable version of :meth:`SAClient.upload_annotations`."""
+        if keep_status is not None:
+            warnings.warn(
+                DeprecationWarning(
+                    "The “keep_status” parameter is deprecated. "
+                    "Please use the “set_annotation_statuses” function instead."
+                )
+            )
+        project, folder = await self._run(
+            self._client.controller.get_project_folder, project
+        )
+        response = await self._client.controller.annotations.upload_multiple_async(
+            project=project,
+            folder=folder,
+            annotations=annotations,
+            keep_status=keep_status,
+            user=self._client.controller.current_user,
+            output_format=data_spec,
+        )
+        if response.errors:
+            raise AppException(response.errors)
+        return response.data
+
+    async def list_items(
+        self,
+        project: str | int,
+        folder: str | int | None = None,
+        *,
+        include: list[Literal["custom_metadata", "categories"]] | None = None,
+        **filters,
+    ) -> list[dict]:
+        """Awaitable version of :meth:`SAClient.list_items`."""
+        return await self._run(
+            self._client.list_items, project, folder, include=include, **filters
+        )
+
+    async def query(
+        self,
+        project: str | int | tuple[int, int] | tuple[str, str],
+        query: str | None = None,
+        subset: str | None = None,
+    ) -> QueryResult:
+        """Awaitable version of :meth:`SAClient.query`.
+        Unlike SAClient.query, the items are fetched before the result is returned,
+        so iterating it doesn't make requests. Its count() method is synchronous."""
+
+        def _query() -> QueryResult:
+            result = self._client.query(project, query, subset)
+            result.data()
+            return result
+
+        return await self._run(_query)
+
+    async def attach_items(
+        self,
+        project: str | int | tuple[int, int] | tuple[str, str],
+        attachments: str | Path | list[dict],
+        annotation_status: str | None = None,
+    ) -> tuple[list[str], list[str], list[str]]:
+        """Awaitable version of :meth:`SAClient.attach_items`."""
+        return await self._run(
+            self._client.attach_items, project, attachments, annotation_status
+        )
+
+    async def set_annotation_statuses(
+        self,
+        project: str | int | tuple[int, int] | tuple[str, str],
+        annotation_status: str,
+        items: list[str] | None = None,
+    ):
+        """Awaitable version of :meth:`SAClient.set_annotation_statuses`."""
+        return await self._run(
+            self._client.set_annotation_statuses, project, annotation_status, items
+        )
@@ -76,15 +76,53 @@ class QueryResult(BaseResult[dict]):
     compatibility with list-like operations (iteration, indexing, len()).
     Data is fetched lazily - only when accessed. Calling .count() does not
     trigger data fetching.
+
+    Iterating the result streams it page by page, the next pages are fetched in
+    the background, so a loop can start on the first page and stop early.
+    The streamed items are kept, the later iterations and list operations
+    (len(), indexing, etc.) reuse them and fetch only the remaining pages.
+    iter_pages() yields the pages without keeping them.
     """
 
+    PREFETCH_PAGES = 4
+
     def __init__(
         self,
-        data_fetcher: Callable[[], list[dict]],
+        pages_fetcher: Callable[[int], Iterator[list[dict]]],
         count_fetcher: Callable[[], int],
     ) -> None:
-        super().__init__(data_fetcher)
+        super().__init__(list)
+        self._pages_fetcher = pages_fetcher
         self._count_fetcher = count_fetcher
+        self._pages: Iterator[list[dict]] | None = None
+
+    def _fetch_page(self) -> bool:
+        """Keeps the next streamed page, returns False if there are no more pages."""
+        if self._pages is None:
+            self._pages = self._pages_fetcher(self.PREFETCH_PAGES)
+        try:
+            page = next(self._pages, None)
+        except BaseException:
+            # the pages can't be resumed after a failure, the next access starts over
+            self._pages = None
+            list.clear(self)
+            raise
+        if page is None:
+            self._pages = None
+            self._loaded = True
+            return False
+        list.extend(self, page)
+        return True
+
+    def _ensure_data(self) -> None:
+        while not self._loaded and self._fetch_page():
+            pass
+
+    def _iter_streamed(self) -> Iterator[dict]:
+        index = 0
+        while index < list.__len__(self) or (not self._loaded and self._fetch_page()):
+            yield list.__getitem__(self, index)
+            index += 1
 
     def count(self) -> int:
         """Return the count of items matching the query from the server.
@@ -93,3 +131,19 @@ class QueryResult(BaseResult[dict]):
         lightweight API call to get only the count.
         """
         return self._count_fetcher()
+
+    def iter_pages(self, prefetch: int = PREFETCH_PAGES) -> Iterator[list[dict]]:
+        """Lazily yield the items page by page without keeping them.
+
+        :param prefetch: the number of pages requested ahead in the background,
+            0 fetches each page only when it's reached.
+        """
+        if self._loaded:
+            yield list(self)
+        else:
+            yield from self._pages_fetcher(prefetch)
+
+    def __iter__(self) -> Iterator[dict]:
+        if self._loaded:
+            return list.__iter__(self)
+        return self._iter_streamed()
@@ -11,6 +11,9 @@ import typing
 import warnings
 from collections.abc import Callable
 from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import closing
+from datetime import datetime
 from functools import partial
 from pathlib import Path
 from typing import Annotated
@@ -4239,6 +4242,7 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
         items: list[NotEmptyStr] | list[int] | None = None,
         *,
         data_spec: Literal["default", "multimodal"] = "default",
+        since: datetime | str | None = None,
     ):
         """Returns annotations for the given list of items.
 
@@ -4257,6 +4261,12 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
 
         :type data_spec: str, optional
 
+        :param since: returns only the annotations of the items updated since the given time
+         (datetime or ISO 8601 string, the ones without a timezone are taken as UTC). If "last", the time of the latest item update seen by
+         the previous call with since="last" on the same project folder is used and moved forward,
+         so a periodic job fetches only the changed annotations.
+        :type since: datetime or str, optional
+
         Example Usage of Multimodal Projects::
 
             from superannotate import SAClient
@@ -4280,6 +4290,66 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
             folder,
             items,
             transform_version="llmJsonV2" if data_spec == "multimodal" else None,
+            since=since,
+        )
+        if response.errors:
+            raise AppException(response.errors)
+        return response.data
+
+    def iter_annotations(
+        self,
+        project: NotEmptyStr | int | tuple[int, int] | tuple[str, str],
+        items: list[NotEmptyStr] | list[int] | None = None,
+        *,
+        data_spec: Literal["default", "multimodal"] = "default",
+        since: datetime | str | None = None,
+    ) -> Iterator[dict]:
+        """Returns a generator over the annotations of the given list of items.
+
+        Unlike get_annotations, the annotations are yielded as soon as they are received
+        and only a bounded number of them is kept in memory, so the whole project
+        can be processed without loading all of its annotations at once.
+        The annotations are yielded in the order they are received, not in the order of the items.
+
+        :param project: Accepts a project as a string ("project" or "project/folder") or as a tuple (project_id, folder_id), where the folder is optional.”
+        :type project: Union[str, int, Tuple[int, int], Tuple[str, str]]
+
+        :param items:  item names. If None, all the items in the specified directory will be used.
+        :type items: list of strs or list of ints
+
+        :param data_spec: Specifies the format for processing and transforming annotations before upload.
+
+            Options are:
+                    - default: Retains the annotations in their original format.
+                    - multimodal: Converts annotations for multimodal projects, optimizing for
+                                     compact and multimodal-specific data representation.
+
+        :type data_spec: str, optional
+
+        :param since: returns only the annotations of the items updated since the given time
+         (datetime or ISO 8601 string, the ones without a timezone are taken as UTC). If "last", the time of the latest item update seen by
+         the previous call with since="last" on the same project folder is used and moved forward,
+         so a periodic job fetches only the changed annotations.
+        :type since: datetime or str, optional
+
+        Request Example:
+        ::
+
+            sa_client = SAClient()
+
+            for annotation in sa_client.iter_annotations("project1/folder1"):
+                print(annotation["metadata"]["name"])
+
+        :return: generator of annotations
+        :rtype: generator of dicts
+        """
+        project, folder = self.controller.get_project_folder(project)
+        response = self.controller.annotations.iterate(
+            project,
+            folder,
+            items,
+            transform_version="llmJsonV2" if data_spec == "multimodal" else None,
+            since=since,
         )
         if response.errors:
             raise AppException(response.errors)
@@ -4469,6 +4539,11 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
         Query syntax should be in SuperAnnotate query language(https://doc.superannotate.com/docs/explore-overview).
 
         The returned QueryResult behaves like a list of dicts, and additionally exposes a .count() method.
+        Iterating it streams the items page by page, so the loop can start on the first page
+        and be stopped early. The streamed items are kept, iterating the result again doesn't repeat
+        the query. Use iter_pages() to process large results with bounded memory.
+        If a later page fails to load, the exception is raised in the middle of the iteration,
+        after the items of the earlier pages were already yielded.
 
         :param project: Accepts a project as a string ("project" or "project/folder") or as a tuple (project_id, folder_id), where the folder is optional.”
         :type project: Union[str, int, Tuple[int, int], Tuple[str, str]]
@@ -4495,6 +4570,13 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
             for item in queried_items:
                 print(item["name"])
 
+        .. py:method:: query.iter_pages(prefetch=4) -> Iterator[list[dict]]
+
+            Yields the matching items page by page without keeping them in memory.
+
+            :param prefetch: the number of pages requested ahead in the background
+            :type prefetch: int
+
         .. py:method:: query.count() -> int
 
             Returns the total number of items matching the query.
@@ -4514,13 +4596,18 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
                 print(f"Total matching items: {total}")
         """
         project, folder = self.controller.get_project_folder(project)
-        fetch_entities = partial(
-            self.controller.query_entities, project, folder, query, subset
-        )
+
+        def fetch_pages(prefetch: int):
+            with closing(
+                self.controller.iter_query_entities(
+                    project, folder, query, subset, prefetch=prefetch
+                )
+            ) as pages:
+                for items in pages:
+                    yield BaseSerializer.serialize_iterable(items, exclude={"meta"})
+
         return QueryResult(
-            data_fetcher=lambda: BaseSerializer.serialize_iterable(
-                fetch_entities(), exclude={"meta"}
-            ),
+            pages_fetcher=fetch_pages,
             count_fetcher=partial(
                 self.controller.query_items_count,
                 project=project,
@@ -5388,6 +5475,9 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
 
         :param items:  item names. If None, all the items in the specified directory will be used.
         :type items: list of strs
+
+        The items are updated in chunks, if any of the chunks fails, an exception listing
+        the names of its items is raised, the items of the other chunks stay updated.
         """
 
         project, folder = self.controller.get_project_folder(project)
@@ -5409,6 +5499,8 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
         recursive: bool = False,
         callback: Callable | None = None,
         data_spec: Literal["default", "multimodal"] = "default",
+        resume: bool = False,
+        since: datetime | str | None = None,
     ):
         """Downloads annotation JSON files of the selected items to the local directory.
 
@@ -5443,6 +5535,19 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
 
         :type data_spec: str, optional
 
+        :param resume: if True, keeps a manifest of the downloaded files in the destination
+         and skips the items whose annotations are already downloaded and unchanged since,
+         so an interrupted download can be continued by calling the function again.
+         The files on disk are checked against the recorded size and checksum,
+         the missing, truncated or edited ones are downloaded again.
+        :type resume: bool
+
+        :param since: downloads only the annotations of the items updated since the given time
+         (datetime or ISO 8601 string, the ones without a timezone are taken as UTC). If "last", the time of the latest item update downloaded
+         to the same path by the previous call with since="last" is used, and the new one
+         is recorded in the path, so a periodic export transfers only the changed annotations.
+        :type since: datetime or str, optional
+
         :return: local path of the downloaded annotations folder.
         :rtype: str
 
@@ -5473,6 +5578,8 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
             item_names=items,
             callback=callback,
             transform_version="llmJsonV2" if data_spec == "multimodal" else None,
+            resume=resume,
+            since=since,
         )
         if response.errors:
             raise AppException(response.errors)
@@ -5679,10 +5786,11 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
     def upload_custom_values(
         self,
         project: NotEmptyStr | int | tuple[int, int] | tuple[str, str],
-        items: Annotated[list[dict[str, dict]], Field(min_length=1)],
+        items: Iterable[dict[str, dict]],
     ):
         """
         Attach custom metadata to items.
+        The items are uploaded in chunks of 5000, several chunks at a time.
         SAClient.get_item_metadata(), SAClient.search_items(), SAClient.query() methods
         will return the item metadata and custom metadata.
 
@@ -5692,7 +5800,11 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
         :param items:  list of name-data pairs.
             The key of each dict indicates an existing item name and the value represents the custom metadata dict.
             The values for the corresponding keys will be added to an item or will be overridden.
-        :type items: list of dicts
+            Any iterable is accepted, a generator (e.g. of the rows of a CSV file) is read one chunk at a time.
+            The rows that don't map item names to dicts are skipped with a warning listing their positions.
+            If a chunk fails to upload, no more rows are read and an exception is raised once the chunks in flight
+            are finished, the values uploaded before it stay uploaded and are counted in a warning.
+        :type items: iterable of dicts
 
         :return: dictionary with succeeded and failed item names.
         :rtype: dict
@@ -5754,7 +5866,7 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
     def delete_custom_values(
         self,
         project: NotEmptyStr | int | tuple[int, int] | tuple[str, str],
-        items: Annotated[list[dict[str, list[str]]], Field(min_length=1)],
+        items: Iterable[dict[str, list[str]]],
     ):
         """
         Remove custom data from items
@@ -5769,7 +5881,11 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
             Please note, that the function removes pointed metadata from a given item.
             To delete metadata for all items you should delete it from the custom metadata schema.
             To override values for existing fields, use SAClient.upload_custom_values()
-        :type items: list of dicts
+            Any iterable is accepted, a generator is read one chunk at a time.
+            The rows that don't map item names to lists of field names are skipped with a warning listing their positions.
+            If a chunk fails, no more rows are read and an exception is raised once the chunks in flight
+            are finished, the values deleted before it stay deleted and are counted in a warning.
+        :type items: iterable of dicts
 
         Request Example:
         ::
@@ -5891,6 +6007,9 @@ class SAClient(BaseInterfaceFacade, metaclass=TrackableMeta):
 
         :param items:  item names to set the mentioned status for. If None, all the items in the project will be used.
         :type items: list of strs
+
+        The items are updated in chunks, if any of the chunks fails, an exception listing
+        the names of its items is raised, the items of the other chunks stay updated.
         """
         project, folder = self.controller.get_project_folder(project)
         response = self.controller.items.set_approval_statuses(
@@ -26,6 +26,7 @@ CONFIG_JSON_FILE_LOCATION = CONFIG_JSON_PATH
 CONFIG_INI_FILE_LOCATION = CONFIG_INI_PATH
 
 LOG_FILE_LOCATION = f"{HOME_PATH}/logs"
+SYNC_STATE_FILE_LOCATION = f"{HOME_PATH}/sync_state.json"
 DEFAULT_LOGGING_LEVEL = "INFO"
 
 
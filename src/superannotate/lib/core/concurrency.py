@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from itertools import islice
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("sa")
+
+THROTTLING_STATUS_CODES = (429, 502, 503, 504)
+
+
+def is_throttling_error(e: BaseException) -> bool:
+    """Whether the request failed because the backend is overloaded."""
+    return isinstance(e, asyncio.TimeoutError) or (
+        getattr(e, "status", None) in THROTTLING_STATUS_CODES
+    )
+
+
+class ConcurrencyLimit:
+    """
+    Semaphore shared between threads and event loops. Threads block in
+    ``acquire_blocking``, coroutines wait in ``acquire`` and are woken in their own loops.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = float(max(limit, 1))
+        self._active = 0
+        self._waiters: deque[asyncio.Future | Future] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def _try_acquire(self, waiter_factory: Callable):
+        with self._lock:
+            if not self._waiters and self._active < self.limit:
+                self._active += 1
+                return None
+            waiter = waiter_factory()
+            self._waiters.append(waiter)
+            return waiter
+
+    async def acquire(self):
+        waiter = self._try_acquire(asyncio.get_running_loop().create_future)
+        if waiter is None:
+            return
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over, otherwise _hand_over releases it
+                self.release()
+            raise
+
+    def acquire_blocking(self, timeout: float = None) -> bool:
+        """Returns False if no slot was free within the timeout."""
+        waiter = self._try_acquire(Future)
+        if waiter is None:
+            return True
+        try:
+            waiter.result(timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    return False
+            # the slot was handed over meanwhile
+        return True
+
+    def _hand_over(self, waiter: asyncio.Future):
+        if waiter.done():
+            # cancelled while the slot was being handed over
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    def _wake_up_waiters(self):
+        while self._waiters and self._active < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._active += 1
+            if not isinstance(waiter, asyncio.Future):
+                waiter.set_result(None)
+                continue
+            try:
+                waiter.get_loop().call_soon_threadsafe(self._hand_over, waiter)
+            except RuntimeError:
+                # the waiter's loop is closed
+                self._active -= 1
+
+    def release(self):
+        with self._lock:
+            self._active -= 1
+            self._wake_up_waiters()
+
+
+class AdaptiveConcurrencyLimit(ConcurrencyLimit):
+    """
+    Concurrency limit with additive increase and multiplicative decrease (AIMD).
+
+    The limit grows by one per ``limit`` completed requests while their latency stays
+    within ``LATENCY_TOLERANCE`` times the baseline latency, and is halved when
+    the backend throttles. Requests started before the last decrease don't decrease it
+    again, so a burst of failures backs off once.
+    """
+
+    LATENCY_TOLERANCE = 2.0
+    BASELINE_DRIFT = 0.01
+    BACKOFF_FACTOR = 0.5
+
+    def __init__(self, initial: int, maximum: int = None, minimum: int = 1):
+        self._minimum = max(minimum, 1)
+        self._maximum = max(maximum or initial, self._minimum)
+        super().__init__(min(max(initial, self._minimum), self._maximum))
+        self._baseline_latency: float | None = None
+        self._last_decrease = 0.0
+
+    @property
+    def maximum(self) -> int:
+        return self._maximum
+
+    def release(
+        self, started_at: float = None, latency: float = None, throttled: bool = False
+    ):
+        with self._lock:
+            self._active -= 1
+            if throttled:
+                if started_at is None or started_at >= self._last_decrease:
+                    self._limit = max(
+                        self._limit * self.BACKOFF_FACTOR, float(self._minimum)
+                    )
+                    self._last_decrease = time.monotonic()
+                    logger.debug(f"Concurrency limit decreased to {self.limit}.")
+            elif latency is not None:
+                if self._baseline_latency is None or latency < self._baseline_latency:
+                    self._baseline_latency = latency
+                else:
+                    # follow slowly changing payloads
+                    self._baseline_latency += (
+                        latency - self._baseline_latency
+                    ) * self.BASELINE_DRIFT
+                if latency <= self._baseline_latency * self.LATENCY_TOLERANCE:
+                    self._limit = min(self._limit + 1 / self._limit, self._maximum)
+            self._wake_up_waiters()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Holds a slot while the block runs and adjusts the limit on its outcome."""
+        await self.acquire()
+        started_at = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.release(started_at, throttled=is_throttling_error(e))
+            raise
+        self.release(started_at, latency=time.monotonic() - started_at)
+
+
+async def call_adaptive(
+    func: Callable[[], Awaitable],
+    limit: AdaptiveConcurrencyLimit,
+    retries: int = 0,
+    retry_delay: float = 0.5,
+):
+    """
+    Awaits func in a slot of the limit. Throttled calls are retried
+    up to ``retries`` times with an exponential delay.
+    """
+    for attempt in range(retries + 1):
+        try:
+            async with limit.slot():
+                return await func()
+        except Exception as e:
+            if attempt >= retries or not is_throttling_error(e):
+                raise
+            logger.debug(f"Retrying the throttled request: {e}")
+            await asyncio.sleep(retry_delay * 2**attempt)
+
+
+async def gather_adaptive(
+    func: Callable[[Any], Awaitable],
+    jobs: Iterable | AsyncIterable,
+    limit: AdaptiveConcurrencyLimit,
+    retries: int = 0,
+    retry_delay: float = 0.5,
+) -> list:
+    """
+    Runs func for each job as a work queue, keeping as many of them in flight as the
+    limit allows, so a slow job doesn't hold back the others.
+    Async iterables are consumed lazily, so the jobs can be produced while the
+    previous ones run. The results are returned in the order of the jobs.
+    """
+    results: list = []
+    if isinstance(jobs, AsyncIterable):
+        iterator = aiter(jobs)
+        workers_count = limit.maximum
+    else:
+        jobs = list(jobs)
+        iterator = _iterate_async(jobs)
+        workers_count = min(limit.maximum, len(jobs))
+    lock = asyncio.Lock()
+
+    async def _worker():
+        while True:
+            async with lock:
+                job = await anext(iterator, _NO_JOB)
+                if job is _NO_JOB:
+                    return
+                index = len(results)
+                results.append(None)
+            results[index] = await call_adaptive(
+                partial(func, job), limit, retries=retries, retry_delay=retry_delay
+            )
+
+    workers = [asyncio.create_task(_worker()) for _ in range(workers_count)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
+        # the iterator can be closed once no worker is pulling from it
+        await asyncio.gather(*workers, return_exceptions=True)
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+    return results
+
+
+_NO_JOB = object()
+
+
+async def _iterate_async(jobs: Iterable) -> AsyncIterator:
+    for job in jobs:
+        yield job
+
+
+def imap_bounded(
+    func: Callable[[Any], Any], jobs: Iterable, max_in_flight: int
+) -> Iterator[tuple[Any, Any]]:
+    """
+    Calls func for each job in up to max_in_flight threads and yields the jobs with
+    their results in the order of completion. The jobs are consumed lazily, a new job
+    is read only when a thread is free, so generators are never materialized.
+    The not started calls are cancelled when the consumer stops early or raises.
+    """
+    iterator = iter(jobs)
+    with ThreadPoolExecutor(max(max_in_flight, 1)) as executor:
+        pending = {
+            executor.submit(func, job): job for job in islice(iterator, max_in_flight)
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    for next_job in islice(iterator, 1):
+                        pending[executor.submit(func, next_job)] = next_job
+                    yield job, future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def iter_poll_delays(
+    initial: float = 0.5,
+    maximum: float = 15.0,
+    factor: float = 2.0,
+    timeout: float = None,
+) -> Iterator[float]:
+    """
+    Yields exponentially growing delays with jitter for polling, so the
+    short jobs are noticed early and concurrent pollers don't synchronize.
+    With a timeout, stops before a delay that would end after timeout seconds.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = initial
+    while True:
+        jittered = delay * random.uniform(0.5, 1.0)
+        if deadline is not None and time.monotonic() + jittered > deadline:
+            return
+        yield jittered
+        delay = min(delay * factor, maximum)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait according to a Retry-After header value."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """
+    Token bucket shared between threads and event loops. Callers reserve
+    a token and sleep the returned delay, so waiting is left to the caller.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self._rate = rate
+        self._capacity = capacity or max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> float:
+        # the bucket isn't refilled during a pause
+        start = max(now, self._updated)
+        self._tokens = min(
+            self._tokens + (start - self._updated) * self._rate, self._capacity
+        )
+        self._updated = start
+        return start
+
+    def reserve(self) -> float:
+        """Takes a token and returns the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            start = self._refill(now)
+            self._tokens -= 1
+            return start - now + max(-self._tokens, 0.0) / self._rate
+
+    def pause(self, seconds: float):
+        """Empties the bucket and doesn't refill it for the given seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+
+class RateLimiter:
+    """
+    Client-side request rate and concurrency limits per endpoint family.
+
+    ``families`` maps a family name to a URL pattern, the first matching
+    family is used and ``default`` otherwise. ``limits`` maps a family to its
+    requests per second and the number of requests waiting for a response at once.
+    Throttled responses pause the family for their Retry-After.
+    """
+
+    DEFAULT_FAMILY = "default"
+    THROTTLING_PAUSE = 1.0
+    MAX_PAUSE = 60.0
+    LOOP_SLOT_TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        families: dict[str, str],
+        limits: dict[str, tuple[float, int]],
+    ):
+        self._families = [
+            (name, re.compile(pattern)) for name, pattern in families.items()
+        ]
+        self._buckets = {name: TokenBucket(rate) for name, (rate, _) in limits.items()}
+        self._concurrency = {
+            name: ConcurrencyLimit(concurrency)
+            for name, (_, concurrency) in limits.items()
+        }
+
+    def get_family(self, url: str) -> str:
+        path = urlsplit(url).path
+        for name, pattern in self._families:
+            if pattern.search(path):
+                return name
+        return self.DEFAULT_FAMILY
+
+    @contextmanager
+    def limit(self, family: str):
+        """
+        Limits a request of a synchronous caller. A caller in an event loop thread
+        blocks the loop while it waits, as its request does, and waits for the slot
+        at most ``LOOP_SLOT_TIMEOUT`` seconds, as the slots can be held by the coroutines
+        of the blocked loop. The coroutines should use ``limit_async``.
+        """
+        time.sleep(self._buckets[family].reserve())
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            timeout = None
+        else:
+            timeout = self.LOOP_SLOT_TIMEOUT
+        concurrency = self._concurrency[family]
+        if not concurrency.acquire_blocking(timeout):
+            logger.debug(
+                f"No free {family} slot in {timeout}s for a request of an event loop thread."
+            )
+            yield
+            return
+        try:
+            yield
+        finally:
+            concurrency.release()
+
+    @asynccontextmanager
+    async def limit_async(self, family: str):
+        await asyncio.sleep(self._buckets[family].reserve())
+        concurrency = self._concurrency[family]
+        await concurrency.acquire()
+        try:
+            yield
+        finally:
+            concurrency.release()
+
+    def handle_response(self, family: str, status: int, headers) -> float:
+        """
+        Pauses the family if the response is throttled.
+        Returns the pause in seconds, 0 if the response isn't throttled.
+        """
+        retry_after = parse_retry_after(headers.get("Retry-After") if headers else None)
+        if status != 429 and not (status == 503 and retry_after is not None):
+            return 0.0
+        pause = min(
+            retry_after if retry_after is not None else self.THROTTLING_PAUSE,
+            self.MAX_PAUSE,
+        )
+        logger.debug(f"Requests to {family} endpoints are paused for {pause}s.")
+        self._buckets[family].pause(pause)
+        return pause
@@ -129,3 +129,9 @@ class ConfigEntity(BaseModel):
     ITEM_CHUNK_SIZE: int = 2000
     MAX_THREAD_COUNT: int = 4
     MAX_COROUTINE_COUNT: int = 8
+    MAX_ADAPTIVE_COROUTINE_COUNT: int = 32
+    ANNOTATION_UPLOAD_PROCESS_COUNT: int = 0
+    HTTP_POOL_SIZE: int = 100
+    HTTP_POOL_SIZE_PER_HOST: int = 0
+    HTTP_KEEPALIVE_TIMEOUT: float = 30
+    ITEM_NAME_CACHE_TTL: float = 0
@@ -18,6 +18,10 @@ class BackendError(AppException):
     Backend Error
     """
 
+    def __init__(self, message, status: int = None):
+        super().__init__(message)
+        self.status = status
+
 
 class AppValidationException(AppException):
     """
@@ -0,0 +1,136 @@
+"""
+JSON encoding and decoding used by the SDK.
+
+orjson is used when it's installed (pip install superannotate[orjson]), otherwise
+the standard library json. The functions mirror the standard library ones, so the
+module can be imported in place of it. Both backends write compact UTF-8 and encode
+the same types (pydantic models, enums, dates, UUIDs, dataclasses and numpy values),
+the output differs only in the spelling of the floats written in exponent
+notation (1e-07 and 1e-7).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import io
+import json as _json
+import math
+from datetime import date
+from datetime import time
+from enum import Enum
+from typing import Any
+from typing import IO
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = _json.JSONDecodeError
+JSONEncoder = _json.JSONEncoder
+
+BACKEND = "orjson" if orjson else "json"
+
+# the dates are encoded by default, so both backends write them the same way
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson
+    else None
+)
+
+
+def default(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(exclude_none=True, mode="json")
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "tolist"):
+        # numpy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+class PydanticEncoder(JSONEncoder):
+    def default(self, obj):
+        return default(obj)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def dumpb(obj: Any, *, allow_nan: bool = True, indent: int = None) -> bytes:
+    """
+    Encodes the object to UTF-8 JSON bytes.
+
+    orjson encodes NaN and Infinity as null, so the objects containing them are
+    encoded by the standard library, which writes NaN and Infinity, or raises
+    ValueError with allow_nan=False. They are looked for only if orjson wrote a null.
+    """
+    if orjson and allow_nan and not indent:
+        try:
+            content = orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+            if b"null" not in content or not _has_non_finite(obj):
+                return content
+        except orjson.JSONEncodeError:
+            # e.g. integers out of the 64-bit range, let the standard library try
+            pass
+    content = _json.dumps(
+        obj,
+        cls=PydanticEncoder,
+        allow_nan=allow_nan,
+        indent=indent,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    )
+    return content.encode("utf-8")
+
+
+def dumps(obj: Any, *, allow_nan: bool = True, indent: int = None) -> str:
+    return dumpb(obj, allow_nan=allow_nan, indent=indent).decode("utf-8")
+
+
+def dump(obj: Any, fp: IO, *, allow_nan: bool = True, indent: int = None):
+    """Writes the object to a text or binary file."""
+    content = dumpb(obj, allow_nan=allow_nan, indent=indent)
+    if isinstance(fp, io.TextIOBase):
+        fp.write(content.decode("utf-8"))
+    else:
+        fp.write(content)
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # the standard library also accepts NaN and Infinity
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return _json.loads(data)
+
+
+def load(fp: IO) -> Any:
+    return loads(fp.read())
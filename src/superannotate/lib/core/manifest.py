@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+
+logger = logging.getLogger("sa")
+
+
+class DownloadManifest:
+    """
+    Append-only record of the annotation files written to a download destination.
+
+    Every stored file adds a JSON line with the item id, the item's ``updatedAt``,
+    the relative file path, its byte size and checksum. The latest line of an item wins,
+    so an interrupted download leaves a valid manifest behind and a rerun can skip
+    the items that are already on disk and have not changed since.
+    With verify_checksums the files on disk are also checked against the recorded
+    checksum, so a truncated or edited file of the same size is downloaded again.
+    """
+
+    FILE_NAME = ".sa_download_manifest.jsonl"
+    READ_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, destination: str | Path, verify_checksums: bool = True):
+        self._destination = Path(destination)
+        self._verify_checksums = verify_checksums
+        self._path = self._destination / self.FILE_NAME
+        self._entries: dict[int, dict] = {}
+        self._lock = threading.Lock()
+        self._file = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> DownloadManifest:
+        if self._path.is_file():
+            with open(self._path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry["id"]] = entry
+                    except (ValueError, KeyError, TypeError):
+                        # the last line can be incomplete if the previous run was interrupted
+                        logger.debug(f"Skipping invalid manifest line: {line}")
+        return self
+
+    def is_up_to_date(
+        self,
+        item_id: int,
+        updated_at: str | None,
+        file_path: str | Path,
+        transform_version: str = None,
+    ) -> bool:
+        entry = self._entries.get(item_id)
+        if (
+            not entry
+            or not updated_at
+            or entry.get("updatedAt") != updated_at
+            or entry.get("transform_version") != transform_version
+            or entry.get("path") != self._relative(file_path)
+        ):
+            return False
+        try:
+            if os.path.getsize(file_path) != entry.get("size"):
+                return False
+            if self._verify_checksums:
+                return self._get_checksum(file_path) == entry.get("checksum")
+        except OSError:
+            return False
+        return True
+
+    @classmethod
+    def _get_checksum(cls, file_path: str | Path) -> str:
+        checksum = hashlib.md5(usedforsecurity=False)
+        with open(file_path, "rb") as file:
+            while chunk := file.read(cls.READ_CHUNK_SIZE):
+                checksum.update(chunk)
+        return checksum.hexdigest()
+
+    def add(
+        self,
+        item_id: int,
+        updated_at: str | None,
+        file_path: str | Path,
+        size: int,
+        checksum: str,
+        transform_version: str = None,
+    ):
+        entry = {
+            "id": item_id,
+            "updatedAt": updated_at,
+            "path": self._relative(file_path),
+            "size": size,
+            "checksum": checksum,
+            "transform_version": transform_version,
+        }
+        with self._lock:
+            self._entries[item_id] = entry
+            if self._file is None:
+                self._destination.mkdir(parents=True, exist_ok=True)
+                self._file = open(self._path, "a", encoding="utf-8")
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    def close(self):
+        """Rewrites the manifest keeping only the latest entry of each item."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            tmp_path = self._path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                for entry in self._entries.values():
+                    file.write(json.dumps(entry) + "\n")
+            os.replace(tmp_path, self._path)
+
+    def _relative(self, file_path: str | Path) -> str:
+        return Path(os.path.relpath(file_path, self._destination)).as_posix()
+
+
+_STRING_DATE_SUFFIX = re.compile(r"(\.\d+)\.000Z$")
+_ISO_FRACTION = re.compile(r"\.(\d+)")
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parses an ISO 8601 string, also the ones fromisoformat rejects before Python 3.11:
+    a Z suffix, fractions of other than 3 or 6 digits and the StringDate values
+    of the entities, which append ".000Z" to a fraction (e.g. "10:00:00.123000.000Z").
+    """
+    value = _STRING_DATE_SUFFIX.sub(r"\1Z", value.strip())
+    if value[-1:] in ("Z", "z"):
+        value = value[:-1] + "+00:00"
+    value = _ISO_FRACTION.sub(
+        lambda match: "." + match.group(1)[:6].ljust(6, "0"), value, count=1
+    )
+    return datetime.fromisoformat(value)
+
+
+def to_timestamp(value: datetime | str) -> str:
+    """
+    Converts a datetime or an ISO 8601 string to the backend's UTC timestamp format.
+    The values without a timezone are taken as UTC.
+    """
+    if isinstance(value, str):
+        value = parse_timestamp(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="milliseconds") + "Z"
+
+
+class HighWaterMarkStore:
+    """
+    JSON file with the latest item ``updatedAt`` exported from each project folder.
+
+    The marks are taken from the server's timestamps rather than the local clock,
+    so the next incremental export can ask only for the items updated since then.
+    """
+
+    FILE_NAME = ".sa_sync_state.json"
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @staticmethod
+    def get_key(project_id: int, folder_id: int | None) -> str:
+        return f"{project_id}/{folder_id or ''}"
+
+    def _read(self) -> dict[str, str]:
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"Ignoring the invalid sync state file {self._path}.")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, key: str) -> str | None:
+        return self._read().get(key)
+
+    def update(self, key: str, updated_at: str | None):
+        """Moves the mark of the key forward, an older timestamp is ignored."""
+        if not updated_at:
+            return
+        updated_at = to_timestamp(updated_at)
+        with self._lock:
+            data = self._read()
+            if data.get(key) and data[key] >= updated_at:
+                return
+            data[key] = updated_at
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=4)
+            os.replace(tmp_path, self._path)
@@ -120,6 +120,12 @@ class Reporter:
     def finish_progress(self):
         self.progress_bar.close()
 
+    def extend_progress(self, value: int):
+        """Grows the total of the progress bar started before the total was known."""
+        if self.progress_bar:
+            self.progress_bar.total = (self.progress_bar.total or 0) + value
+            self.progress_bar.refresh()
+
     def update_progress(self, value: int = 1):
         if self.progress_bar:
             self.progress_bar.update(value)
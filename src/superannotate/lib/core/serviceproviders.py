@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import io
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from collections.abc import Callable
+from collections.abc import Iterator
 from typing import Any
 from typing import Literal
 
@@ -65,6 +66,10 @@ class BaseClient(ABC):
     def request(self, method: str, url: str, **kwargs) -> ServiceResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_aio_connector(self):
+        raise NotImplementedError
+
     @abstractmethod
     def paginate(
         self,
@@ -76,6 +81,28 @@ class BaseClient(ABC):
     ) -> ServiceResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_paginate(
+        self,
+        url: str,
+        chunk_size: int = 2000,
+        query_params: dict[str, Any] = None,
+        headers: dict = None,
+    ) -> Iterator[ServiceResponse]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_jsx_paginate(
+        self,
+        url: str,
+        method: str = Literal["get", "post"],
+        body_query: Query = None,
+        query_params: dict = None,
+        headers: dict = None,
+        chunk_size: int = 100,
+    ) -> Iterator[ServiceResponse]:
+        raise NotImplementedError
+
     @abstractmethod
     def jsx_paginate(
         self,
@@ -573,6 +600,18 @@ class BaseAnnotationService(SuperannotateServiceProvider):
     ) -> list[dict]:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_small_annotations(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        item_ids: list[int],
+        reporter: Reporter,
+        callback: Callable = None,
+        transform_version: str = None,
+    ) -> AsyncIterator[dict]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_upload_chunks(
         self,
@@ -582,6 +621,15 @@ class BaseAnnotationService(SuperannotateServiceProvider):
     ) -> dict[str, list]:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_upload_chunks(
+        self,
+        project: entities.ProjectEntity,
+        item_ids: list[int],
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[dict[str, list]]:
+        raise NotImplementedError
+
     @abstractmethod
     async def download_big_annotation(
         self,
@@ -590,6 +638,7 @@ class BaseAnnotationService(SuperannotateServiceProvider):
         item: entities.BaseItemEntity,
         callback: Callable = None,
         transform_version: str = None,
+        store_callback: Callable = None,
     ):
         raise NotImplementedError
 
@@ -603,6 +652,7 @@ class BaseAnnotationService(SuperannotateServiceProvider):
         item_ids: list[int],
         callback: Callable = None,
         transform_version: str = None,
+        store_callback: Callable = None,
     ):
         raise NotImplementedError
 
@@ -611,18 +661,41 @@ class BaseAnnotationService(SuperannotateServiceProvider):
         self,
         project: entities.ProjectEntity,
         folder: entities.FolderEntity,
-        items_name_data_map: dict[str, dict],
+        items_name_data_map: dict[str, dict | bytes],
         transform_version: str = None,
     ) -> UploadAnnotationsResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    async def send_big_annotation(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        item_id: int,
+        data: bytes,
+        chunk_size: int,
+        transform_version: str = None,
+    ) -> str | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def wait_big_annotation_sync(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        item_id: int,
+        upload_id: str,
+        transform_version: str = None,
+    ) -> bool:
+        raise NotImplementedError
+
     @abstractmethod
     async def upload_big_annotation(
         self,
         project: entities.ProjectEntity,
         folder: entities.FolderEntity,
         item_id: int,
-        data: io.StringIO,
+        data: bytes,
         chunk_size: int,
         transform_version: str = None,
     ) -> bool:
@@ -762,6 +835,17 @@ class BaseExploreService(SuperannotateServiceProvider):
     ) -> ServiceResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_saqul_query(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity = None,
+        query: str = None,
+        subset_id: int = None,
+        prefetch: int = 0,
+    ) -> Iterator[list[dict]]:
+        raise NotImplementedError
+
     @abstractmethod
     def query_item_count(
         self,
@@ -824,6 +908,33 @@ class BaseServiceProvider:
     ) -> str:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_items_by_name(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        names: list[str],
+    ) -> dict[str, entities.BaseItemEntity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_item_names(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity | None = None,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    def validate_saqul_query(
+        self, project: entities.ProjectEntity, query: str
+    ) -> ServiceResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_saqul_queries(self, project: entities.ProjectEntity):
+        raise NotImplementedError
+
     @abstractmethod
     def get_team(self, team_id: int) -> TeamResponse:
         raise NotImplementedError
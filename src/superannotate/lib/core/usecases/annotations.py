@@ -4,18 +4,22 @@ import asyncio
 import copy
 import io
 import itertools
-import json
 import logging
+import multiprocessing
 import os
 import platform
 import re
 import traceback
 from collections import defaultdict
+from collections import deque
+from collections.abc import AsyncIterator
 from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import datetime
 from itertools import islice
-from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +27,10 @@ import aiofiles
 import boto3
 import lib.core as constants
 import superannotate_schemas
+from lib.core import json
+from lib.core.concurrency import AdaptiveConcurrencyLimit
+from lib.core.concurrency import call_adaptive
+from lib.core.concurrency import gather_adaptive
 from lib.core.conditions import Condition
 from lib.core.conditions import CONDITION_EQ as EQ
 from lib.core.entities import AttachmentEntity
@@ -33,9 +41,14 @@ from lib.core.entities import ImageEntity
 from lib.core.entities import ProjectEntity
 from lib.core.entities import UserEntity
 from lib.core.exceptions import AppException
+from lib.core.exceptions import AppValidationException
 from lib.core.jsx_conditions import EmptyQuery
 from lib.core.jsx_conditions import Filter
 from lib.core.jsx_conditions import OperatorEnum
+from lib.core.jsx_conditions import Query
+from lib.core.manifest import DownloadManifest
+from lib.core.manifest import HighWaterMarkStore
+from lib.core.manifest import to_timestamp
 from lib.core.reporter import Reporter
 from lib.core.response import Response
 from lib.core.service_types import UploadAnnotationAuthData
@@ -45,6 +58,8 @@ from lib.core.types import PriorityScoreEntity
 from lib.core.usecases.base import BaseReportableUseCase
 from lib.core.usecases.folders import CreateFolderUseCase
 from lib.core.usecases.items import AttachItems
+from lib.core.usecases.items import run_item_chunks
+from lib.core.utils import iter_async
 from lib.core.utils import run_async
 from lib.core.utils import set_last_action
 from lib.core.video_convertor import VideoFrameGenerator
@@ -60,6 +75,7 @@ if platform.system().lower() == "windows":
 BIG_FILE_THRESHOLD = 15 * 1024 * 1024
 ANNOTATION_CHUNK_SIZE_MB = 10 * 1024 * 1024
 URI_THRESHOLD = 4 * 1024 - 120
+SINCE_LAST_SYNC = "last"
 
 
 @dataclass
@@ -95,11 +111,23 @@ class ItemToUpload(BaseModel):
 
     item: BaseItemEntity
     annotation_json: dict | None = None
+    content: bytes | None = None
     path: str | None = None
     file_size: int | None = None
     mask: io.BytesIO | None = None
 
 
+def validate_since(since: datetime | str | None) -> str | None:
+    if since is None or since == SINCE_LAST_SYNC:
+        return since
+    try:
+        return to_timestamp(since)
+    except (TypeError, ValueError):
+        raise AppValidationException(
+            f"Invalid since value {since}. Use a datetime, an ISO 8601 string or '{SINCE_LAST_SYNC}'."
+        )
+
+
 def set_annotation_statuses_in_progress(
     service_provider: BaseServiceProvider,
     project: ProjectEntity,
@@ -107,20 +135,25 @@ def set_annotation_statuses_in_progress(
     item_names: list[str],
     chunk_size=500,
 ) -> bool:
-    failed_on_chunk = False
-    for i in range(0, len(item_names), chunk_size):
-        status_changed = service_provider.items.set_statuses(
+    annotation_status = service_provider.get_annotation_status_value(
+        project, "InProgress"
+    )
+    results = run_item_chunks(
+        lambda chunk: service_provider.items.set_statuses(
             project=project,
             folder=folder,
-            item_names=item_names[i : i + chunk_size],  # noqa: E203
-            annotation_status=service_provider.get_annotation_status_value(
-                project, "InProgress"
-            ),
-        )
-        if not status_changed.ok:
-            failed_on_chunk = True
-            logger.debug(status_changed.error)
-    return not failed_on_chunk
+            item_names=chunk,
+            annotation_status=annotation_status,
+        ),
+        item_names,
+        chunk_size,
+    )
+    failed = False
+    for chunk, response in results:
+        if not response.ok:
+            failed = True
+            logger.debug(f"Failed to change the status of {chunk}: {response.error}")
+    return not failed
 
 
 async def upload_small_annotations(
@@ -132,7 +165,14 @@ async def upload_small_annotations(
     report: Report,
     callback: Callable = None,
     transform_version: str = None,
+    concurrency_limit: AdaptiveConcurrencyLimit = None,
 ):
+    """
+    Uploads the queued annotations in chunks, as many chunks at once
+    as the concurrency limit allows (one at a time by default).
+    """
+    concurrency_limit = concurrency_limit or AdaptiveConcurrencyLimit(1)
+
     async def upload(_chunk: list[ItemToUpload]):
         failed_annotations, missing_classes, missing_attr_groups, missing_attrs = (
             [],
@@ -141,14 +181,21 @@ async def upload_small_annotations(
             [],
         )
         try:
-            items_name_data_map = {i.item.name: i.annotation_json for i in chunk}
+            items_name_data_map = {
+                i.item.name: i.content if i.content is not None else i.annotation_json
+                for i in _chunk
+            }
             if not items_name_data_map:
                 return
-            response = await service_provider.annotations.upload_small_annotations(
-                project=project,
-                folder=folder,
-                items_name_data_map=items_name_data_map,
-                transform_version=transform_version,
+            response = await call_adaptive(
+                lambda: service_provider.annotations.upload_small_annotations(
+                    project=project,
+                    folder=folder,
+                    items_name_data_map=items_name_data_map,
+                    transform_version=transform_version,
+                ),
+                concurrency_limit,
+                retries=3,
             )
             if response.ok:
                 if response.data.failed_items:  # noqa
@@ -157,19 +204,29 @@ async def upload_small_annotations(
                 missing_attr_groups = response.data.missing_resources.attribute_groups
                 missing_attrs = response.data.missing_resources.attributes
             else:
-                failed_annotations.extend([i.item.name for i in chunk])
+                failed_annotations.extend([i.item.name for i in _chunk])
             if callback:
-                for i in chunk:
+                for i in _chunk:
                     callback(i)
         except Exception:
             logger.debug(traceback.print_exc())
-            failed_annotations.extend([i.item.name for i in chunk])
+            failed_annotations.extend([i.item.name for i in _chunk])
         finally:
             report.failed_annotations.extend(failed_annotations)
             report.missing_classes.extend(missing_classes)
             report.missing_attr_groups.extend(missing_attr_groups)
             report.missing_attrs.extend(missing_attrs)
-            reporter.update_progress(len(chunk))
+            reporter.update_progress(len(_chunk))
+
+    uploads: set[asyncio.Task] = set()
+
+    async def dispatch(_chunk: list[ItemToUpload]):
+        nonlocal uploads
+        if len(uploads) >= concurrency_limit.maximum:
+            _, uploads = await asyncio.wait(
+                uploads, return_when=asyncio.FIRST_COMPLETED
+            )
+        uploads.add(asyncio.create_task(upload(_chunk)))
 
     _size = 0
     chunk: list[ItemToUpload] = []
@@ -184,7 +241,7 @@ async def upload_small_annotations(
             or sum([len(i.item.name) for i in chunk])
             >= URI_THRESHOLD - (len(chunk) + 1) * 14
         ):
-            await upload(chunk)
+            await dispatch(chunk)
             chunk = []
             _size = 0
         if not chunk:
@@ -192,7 +249,9 @@ async def upload_small_annotations(
         chunk.append(item_data)
         _size += item_data.file_size
     if chunk:
-        await upload(chunk)
+        await dispatch(chunk)
+    if uploads:
+        await asyncio.wait(uploads)
 
 
 async def upload_big_annotations(
@@ -203,36 +262,128 @@ async def upload_big_annotations(
     reporter: Reporter,
     report: Report,
     callback: Callable = None,
+    workers: int = 3,
 ):
-    async def _upload_big_annotation(item_data: ItemToUpload) -> tuple[str, bool]:
+    """
+    Uploads the queued big annotations in two stages. The workers send the
+    annotations and start their server-side sync, then the sync of each sent
+    annotation is awaited separately, so the workers move on once the data is sent.
+    """
+    syncs: set[asyncio.Task] = set()
+
+    async def _await_sync(item_data: ItemToUpload, upload_id: str):
         try:
-            buff = io.StringIO()
-            json.dump(item_data.annotation_json, buff, allow_nan=False)
-            buff.seek(0)
-            is_uploaded = await service_provider.annotations.upload_big_annotation(
+            is_uploaded = await service_provider.annotations.wait_big_annotation_sync(
                 project=project,
                 folder=folder,
                 item_id=item_data.item.id,
-                data=buff,
-                chunk_size=5 * 1024 * 1024,
+                upload_id=upload_id,
             )
             if is_uploaded and callback:
                 callback(item_data)
-            return item_data.item.name, is_uploaded
         except Exception as e:
             logger.debug(e)
             report.failed_annotations.append(item_data.item.name)
         finally:
             reporter.update_progress()
 
-    while True:
-        item: ItemToUpload = await queue.get()
-        queue.task_done()
-        if item:
-            await _upload_big_annotation(item)
-        else:
-            queue.put_nowait(None)
-            break
+    async def _send_big_annotation(item_data: ItemToUpload):
+        try:
+            content = item_data.content
+            if content is None:
+                content = json.dumpb(item_data.annotation_json, allow_nan=False)
+            upload_id = await service_provider.annotations.send_big_annotation(
+                project=project,
+                folder=folder,
+                item_id=item_data.item.id,
+                data=content,
+                chunk_size=5 * 1024 * 1024,
+            )
+        except Exception as e:
+            logger.debug(e)
+            report.failed_annotations.append(item_data.item.name)
+            reporter.update_progress()
+            return
+        if upload_id is None:
+            reporter.update_progress()
+            return
+        # the data is sent, don't hold it while the sync is awaited
+        item_data.content = None
+        syncs.add(asyncio.create_task(_await_sync(item_data, upload_id)))
+
+    async def _worker():
+        while True:
+            item: ItemToUpload = await queue.get()
+            queue.task_done()
+            if item:
+                await _send_big_annotation(item)
+            else:
+                queue.put_nowait(None)
+                break
+
+    try:
+        await asyncio.gather(*[_worker() for _ in range(workers)])
+        if syncs:
+            await asyncio.gather(*syncs)
+    finally:
+        for task in syncs:
+            task.cancel()
+
+
+_worker_schemas: dict[str, dict] = {}
+_worker_validators: dict[str, superannotate_schemas.Draft7Validator] = {}
+
+
+async def iter_annotation_jobs(
+    service_provider: BaseServiceProvider,
+    project: ProjectEntity,
+    items: list[BaseItemEntity],
+) -> AsyncIterator[tuple[bool, Any]]:
+    """
+    Yields (True, item) for the large items and (False, chunk) for the chunks
+    of small items as soon as their batch is classified.
+    """
+    id_item_map = {i.id: i for i in items}
+    async for groups in service_provider.annotations.iter_upload_chunks(
+        project=project, item_ids=list(id_item_map)
+    ):
+        for large in groups["large"]:
+            item = id_item_map.get(large["id"])
+            if item:
+                yield True, item
+        for chunk in groups["small"]:
+            yield False, chunk
+
+
+def _init_annotation_worker(schemas: dict[str, dict]):
+    _worker_schemas.update(schemas)
+
+
+def _get_worker_context() -> multiprocessing.context.BaseContext:
+    # forking the threads of the SDK (the event loop, the pools) can deadlock the workers
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def serialize_annotation(
+    annotation: dict, validate: bool
+) -> tuple[bytes, list[tuple[str, str]]]:
+    """
+    Encodes the annotation and validates it if it's not uploaded as a big file.
+    Runs in the annotation upload worker processes, the schemas are set by the pool initializer.
+    """
+    content = json.dumpb(annotation, allow_nan=False)
+    if not validate or len(content) > BIG_FILE_THRESHOLD:
+        return content, []
+    version = ValidateAnnotationUseCase.get_version(annotation)
+    validator = _worker_validators.get(version)
+    if not validator:
+        if version not in _worker_schemas:
+            raise AppException(f"Schema {version} does not exist.")
+        validator = ValidateAnnotationUseCase.build_validator(_worker_schemas[version])
+        _worker_validators[version] = validator
+    return content, ValidateAnnotationUseCase.collect_errors(validator, annotation)
 
 
 class UploadAnnotationsUseCase(BaseReportableUseCase):
@@ -249,6 +400,8 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
         user: UserEntity,
         keep_status: bool = False,
         transform_version: str = None,
+        process_count: int = 0,
+        concurrency_limit: AdaptiveConcurrencyLimit = None,
     ):
         super().__init__(reporter)
         self._project = project
@@ -259,9 +412,28 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
         self._report = Report([], [], [], [])
         self._user = user
         self._transform_version = transform_version
+        self._process_count = process_count
+        self._concurrency_limit = concurrency_limit
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self, schemas: dict[str, dict]) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._process_count,
+                mp_context=_get_worker_context(),
+                initializer=_init_annotation_worker,
+                initargs=(schemas,),
+            )
+        return self._executor
+
+    async def _shutdown_executor(self):
+        executor, self._executor = self._executor, None
+        if executor:
+            # waiting for the workers to exit would block the other coroutines of the loop
+            await asyncio.to_thread(executor.shutdown, cancel_futures=True)
 
     def _validate_json(self, json_data: dict) -> list:
-        if self._project.type >= int(constants.ProjectType.PIXEL):
+        if not self._validation_required:
             return []
         use_case = ValidateAnnotationUseCase(
             reporter=self.reporter,
@@ -273,65 +445,117 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
         return use_case.execute().data
 
     def list_existing_items(self, item_names: list[str]) -> list[BaseItemEntity]:
-        existing_items = []
-        for i in range(0, len(item_names), self.CHUNK_SIZE):
-            items_to_check = item_names[i : i + self.CHUNK_SIZE]  # noqa: E203
-            data = self._service_provider.item_service.list(
-                self._project.id,
-                self._folder.id,
-                Filter("name", items_to_check, OperatorEnum.IN),
+        return list(
+            self._service_provider.get_items_by_name(
+                self._project, self._folder, item_names
+            ).values()
+        )
+
+    @property
+    def _validation_required(self) -> bool:
+        return self._project.type < int(constants.ProjectType.PIXEL)
+
+    def _get_schemas(self, items_to_upload: list[ItemToUpload]) -> dict[str, dict]:
+        schemas = {}
+        versions = {
+            ValidateAnnotationUseCase.get_version(i.annotation_json)
+            for i in items_to_upload
+        }
+        for version in versions:
+            response = self._service_provider.annotations.get_schema(
+                self._project.type.value, version
             )
-            existing_items.extend(data)
-        return existing_items
+            if response.ok and response.data:
+                schemas[version] = response.data
+        return schemas
+
+    def _fail(self, item_to_upload: ItemToUpload, e: Exception):
+        name = item_to_upload.annotation_json["metadata"]["name"]
+        if isinstance(e, ValueError):
+            logger.debug(f"Invalid annotation {name}: {e}")
+        else:
+            logger.debug(traceback.format_exc())
+        self._report.failed_annotations.append(name)
+        self.reporter.update_progress()
+
+    async def _serialize_in_loop(
+        self, items_to_upload: list[ItemToUpload]
+    ) -> AsyncIterator[tuple[ItemToUpload, list]]:
+        for item_to_upload in items_to_upload:
+            try:
+                content = json.dumpb(item_to_upload.annotation_json, allow_nan=False)
+                errors = []
+                if len(content) <= BIG_FILE_THRESHOLD:
+                    # the validation can fetch the schema synchronously
+                    errors = await asyncio.to_thread(
+                        self._validate_json, item_to_upload.annotation_json
+                    )
+            except Exception as e:
+                self._fail(item_to_upload, e)
+                continue
+            item_to_upload.content = content
+            yield item_to_upload, errors
+            # let the upload workers run between the CPU bound serializations
+            await asyncio.sleep(0)
+
+    async def _serialize_in_processes(
+        self, items_to_upload: list[ItemToUpload]
+    ) -> AsyncIterator[tuple[ItemToUpload, list]]:
+        loop = asyncio.get_running_loop()
+        validate = self._validation_required
+        schemas = (
+            await asyncio.to_thread(self._get_schemas, items_to_upload)
+            if validate
+            else {}
+        )
+        pending = deque()
+        executor = self._get_executor(schemas)
+        try:
+            items = iter(items_to_upload)
+            while True:
+                # keep a bounded number of annotations in flight to limit the memory
+                for item_to_upload in islice(
+                    items, self._process_count * 2 - len(pending)
+                ):
+                    future = loop.run_in_executor(
+                        executor,
+                        serialize_annotation,
+                        item_to_upload.annotation_json,
+                        validate,
+                    )
+                    pending.append((item_to_upload, future))
+                if not pending:
+                    break
+                item_to_upload, future = pending.popleft()
+                try:
+                    content, errors = await future
+                except Exception as e:
+                    self._fail(item_to_upload, e)
+                    continue
+                item_to_upload.content = content
+                yield item_to_upload, errors
+        finally:
+            for _, future in pending:
+                future.cancel()
+            await self._shutdown_executor()
 
     async def distribute_queues(self, items_to_upload: list[ItemToUpload]):
-        data: list[list[ItemToUpload, bool]] = [[i, False] for i in items_to_upload]
-        items_count = len(items_to_upload)
-        processed_count = 0
-        while processed_count < items_count:
-            for idx, (item_to_upload, processed) in enumerate(data):
-                if not processed:
-                    try:
-                        file = io.StringIO()
-                        json.dump(
-                            item_to_upload.annotation_json,
-                            file,
-                            allow_nan=False,
-                        )
-                        file.seek(0, os.SEEK_END)
-                        item_to_upload.file_size = file.tell()
-                        while True:
-                            if item_to_upload.file_size > BIG_FILE_THRESHOLD:
-                                if self._big_files_queue.qsize() > 32:
-                                    await asyncio.sleep(3)
-                                    continue
-                                self._big_files_queue.put_nowait(item_to_upload)
-                                break
-                            else:
-                                errors = self._validate_json(
-                                    item_to_upload.annotation_json
-                                )
-                                if errors:
-                                    self._report.failed_annotations.append(
-                                        item_to_upload.annotation_json["metadata"][
-                                            "name"
-                                        ]
-                                    )
-                                    break
-                                self._small_files_queue.put_nowait(item_to_upload)
-                                break
-                    except Exception as e:
-                        name = item_to_upload.annotation_json["metadata"]["name"]
-                        if isinstance(e, ValueError):
-                            logger.debug(f"Invalid annotation {name}: {e}")
-                        else:
-                            logger.debug(traceback.format_exc())
-                        self._report.failed_annotations.append(name)
-                        self.reporter.update_progress()
-                        data[idx][1] = True  # noqa
-                        processed_count += 1
-                    data[idx][1] = True  # noqa
-                    processed_count += 1
+        if self._process_count > 0 and len(items_to_upload) > 1:
+            serialized = self._serialize_in_processes(items_to_upload)
+        else:
+            serialized = self._serialize_in_loop(items_to_upload)
+        async for item_to_upload, errors in serialized:
+            item_to_upload.file_size = len(item_to_upload.content)
+            if item_to_upload.file_size > BIG_FILE_THRESHOLD:
+                while self._big_files_queue.qsize() > 32:
+                    await asyncio.sleep(3)
+                self._big_files_queue.put_nowait(item_to_upload)
+            elif errors:
+                self._report.failed_annotations.append(
+                    item_to_upload.annotation_json["metadata"]["name"]
+                )
+            else:
+                self._small_files_queue.put_nowait(item_to_upload)
         self._big_files_queue.put_nowait(None)
         self._small_files_queue.put_nowait(None)
 
@@ -341,32 +565,34 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
             asyncio.Queue(),
         )
         await asyncio.gather(
-            self.distribute_queues(items_to_upload),
-            *[
-                upload_big_annotations(
-                    project=self._project,
-                    folder=self._folder,
-                    queue=self._big_files_queue,
-                    service_provider=self._service_provider,
-                    report=self._report,
-                    reporter=self.reporter,
-                )
-                for _ in range(3)
-            ],
-        )
-        await asyncio.gather(
-            upload_small_annotations(
+            self._upload_small_annotations(items_to_upload),
+            upload_big_annotations(
                 project=self._project,
                 folder=self._folder,
-                queue=self._small_files_queue,
+                queue=self._big_files_queue,
                 service_provider=self._service_provider,
-                reporter=self.reporter,
                 report=self._report,
-                transform_version=self._transform_version,
-            )
+                reporter=self.reporter,
+            ),
         )
 
-    def execute(self):
+    async def _upload_small_annotations(self, items_to_upload: list[ItemToUpload]):
+        # the small annotations are chunked once all of them are queued
+        await self.distribute_queues(items_to_upload)
+        await upload_small_annotations(
+            project=self._project,
+            folder=self._folder,
+            queue=self._small_files_queue,
+            service_provider=self._service_provider,
+            reporter=self.reporter,
+            report=self._report,
+            transform_version=self._transform_version,
+            concurrency_limit=self._concurrency_limit,
+        )
+
+    async def execute_async(self):
+        """Runs the use case in the running event loop,
+        the blocking requests are made with asyncio.to_thread."""
         if self.is_valid():
             failed, skipped = [], []
             name_annotation_map = {}
@@ -380,7 +606,9 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
                 f"Uploading {len(name_annotation_map)}/{len(self._annotations)} "
                 f"annotations to the project {self._project.name}."
             )
-            existing_items = self.list_existing_items(list(name_annotation_map.keys()))
+            existing_items = await asyncio.to_thread(
+                self.list_existing_items, list(name_annotation_map.keys())
+            )
             name_item_map = {i.name: i for i in existing_items}
             len_existing, len_provided = len(existing_items), len(name_annotation_map)
             if len_existing < len_provided:
@@ -405,7 +633,7 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
                 len(items_to_upload), description="Uploading Annotations"
             )
             try:
-                run_async(self.run_workers(items_to_upload))
+                await self.run_workers(items_to_upload)
             except Exception:
                 logger.debug(traceback.format_exc())
                 self._response.errors = AppException("Can't upload annotations.")
@@ -417,12 +645,14 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
                 {i.item.name for i in items_to_upload}
                 - set(self._report.failed_annotations).union(set(skipped))
             )
-            workflow = self._service_provider.work_management.get_workflow(
-                self._project.workflow_id
+            workflow = await asyncio.to_thread(
+                self._service_provider.work_management.get_workflow,
+                self._project.workflow_id,
             )
             if workflow.is_system():
                 if uploaded_annotations and not self._keep_status:
-                    statuses_changed = set_annotation_statuses_in_progress(
+                    statuses_changed = await asyncio.to_thread(
+                        set_annotation_statuses_in_progress,
                         service_provider=self._service_provider,
                         project=self._project,
                         folder=self._folder,
@@ -436,7 +666,10 @@ class UploadAnnotationsUseCase(BaseReportableUseCase):
                 "failed": failed,
                 "skipped": skipped,
             }
-            return self._response
+        return self._response
+
+    def execute(self):
+        return run_async(self.execute_async())
 
 
 class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
@@ -457,6 +690,7 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
         client_s3_bucket=None,
         folder_path: str = None,
         keep_status=False,
+        concurrency_limit: AdaptiveConcurrencyLimit = None,
     ):
         super().__init__(reporter)
         self._project = project
@@ -477,6 +711,7 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
         self.missing_classes = set()
         self.missing_attributes = set()
         self._folder_path = folder_path
+        self._concurrency_limit = concurrency_limit
         if "classes/classes.json" in self._annotation_paths:
             self._annotation_paths.remove("classes/classes.json")
         self._annotation_upload_data = None
@@ -561,7 +796,10 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
     ) -> (tuple[io.StringIO] | None, io.BytesIO | None):
 
         if self._client_s3_bucket:
-            content = self.get_annotation_from_s3(self._client_s3_bucket, path).read()
+            file = await asyncio.to_thread(
+                self.get_annotation_from_s3, self._client_s3_bucket, path
+            )
+            content = file.read()
         else:
             async with aiofiles.open(path, encoding="utf-8") as file:
                 content = await file.read()
@@ -571,7 +809,8 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
         file.seek(0)
         size = file.getbuffer().nbytes
         annotation = json.load(file)
-        annotation = self.prepare_annotation(annotation, size)
+        # the validation can fetch the schema synchronously
+        annotation = await asyncio.to_thread(self.prepare_annotation, annotation, size)
         if not annotation:
             self.reporter.store_message("invalid_jsons", path)
             raise AppException("Invalid json")
@@ -594,17 +833,9 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
     def get_existing_name_item_mapping(
         self, name_path_mappings: dict[str, str]
     ) -> dict:
-        item_names = list(name_path_mappings.keys())
-        existing_name_item_mapping = {}
-        for i in range(0, len(item_names), self.CHUNK_SIZE):
-            items_to_check = item_names[i : i + self.CHUNK_SIZE]  # noqa: E203
-            data = self._service_provider.item_service.list(
-                self._project.id,
-                self._folder.id,
-                Filter("name", items_to_check, OperatorEnum.IN),
-            )
-            existing_name_item_mapping.update({i.name: i for i in data})
-        return existing_name_item_mapping
+        return self._service_provider.get_items_by_name(
+            self._project, self._folder, list(name_path_mappings.keys())
+        )
 
     @property
     def annotation_upload_data(self) -> UploadAnnotationAuthData:
@@ -685,28 +916,28 @@ class UploadAnnotationsFromFolderUseCase(BaseReportableUseCase):
             asyncio.Queue(),
         )
         await asyncio.gather(
-            self.distribute_queues(items_to_upload),
-            *[
-                upload_big_annotations(
-                    project=self._project,
-                    folder=self._folder,
-                    queue=self._big_files_queue,
-                    service_provider=self._service_provider,
-                    report=self._report,
-                    reporter=self.reporter,
-                )
-                for _ in range(3)
-            ],
-        )
-        await asyncio.gather(
-            upload_small_annotations(
+            self._upload_small_annotations(items_to_upload),
+            upload_big_annotations(
                 project=self._project,
                 folder=self._folder,
-                queue=self._small_files_queue,
+                queue=self._big_files_queue,
                 service_provider=self._service_provider,
-                reporter=self.reporter,
                 report=self._report,
-            )
+                reporter=self.reporter,
+            ),
+        )
+
+    async def _upload_small_annotations(self, items_to_upload: list[ItemToUpload]):
+        # the small annotations are chunked once all of them are queued
+        await self.distribute_queues(items_to_upload)
+        await upload_small_annotations(
+            project=self._project,
+            folder=self._folder,
+            queue=self._small_files_queue,
+            service_provider=self._service_provider,
+            reporter=self.reporter,
+            report=self._report,
+            concurrency_limit=self._concurrency_limit,
         )
 
     def execute(self):
@@ -907,17 +1138,14 @@ class UploadAnnotationUseCase(BaseReportableUseCase):
                 self._user.email, annotation_json, self._project.type
             )
             if not errors:
-                annotation_file = io.StringIO()
-                json.dump(annotation_json, annotation_file, allow_nan=False)
-                size = annotation_file.tell()
-                annotation_file.seek(0)
-                if size > BIG_FILE_THRESHOLD:
+                content = json.dumpb(annotation_json, allow_nan=False)
+                if len(content) > BIG_FILE_THRESHOLD:
                     uploaded = run_async(
                         self._service_provider.annotations.upload_big_annotation(
                             project=self._project,
                             folder=self._folder,
                             item_id=self._image.id,
-                            data=annotation_file,
+                            data=content,
                             chunk_size=5 * 1024 * 1024,
                         )
                     )
@@ -1281,6 +1509,24 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
                     real_path.append(item)
         return real_path
 
+    @classmethod
+    def get_version(cls, annotation: dict) -> str:
+        try:
+            return annotation["version"]
+        except KeyError:
+            return cls.DEFAULT_VERSION
+
+    @classmethod
+    def build_validator(cls, schema: dict) -> superannotate_schemas.Draft7Validator:
+        validator = superannotate_schemas.Draft7Validator(schema)
+        from functools import partial
+
+        iter_errors = partial(cls.iter_errors, validator)
+        validator.iter_errors = iter_errors
+        validator.VALIDATORS["oneOf"] = cls.oneOf
+        validator.VALIDATORS["pattern"] = cls._pattern
+        return validator
+
     def _get_validator(self, version: str) -> superannotate_schemas.Draft7Validator:
         key = f"{self._project_type}__{version}"
         validator = ValidateAnnotationUseCase.SCHEMAS.get(key)
@@ -1290,17 +1536,12 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
             )
             if not schema_response.ok or not schema_response.data:
                 raise AppException(f"Schema {version} does not exist.")
-            validator = superannotate_schemas.Draft7Validator(schema_response.data)
-            from functools import partial
-
-            iter_errors = partial(self.iter_errors, validator)
-            validator.iter_errors = iter_errors
-            validator.VALIDATORS["oneOf"] = self.oneOf
-            validator.VALIDATORS["pattern"] = self._pattern
+            validator = self.build_validator(schema_response.data)
             ValidateAnnotationUseCase.SCHEMAS[key] = validator
         return validator
 
-    def extract_messages(self, path, error, report):
+    @classmethod
+    def extract_messages(cls, path, error, report):
         for sub_error in sorted(error.context, key=lambda e: e.schema_path):
             tmp_path = sub_error.path  # if sub_error.path else real_path
             _path = (
@@ -1309,7 +1550,7 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
                 + "".join(ValidateAnnotationUseCase.extract_path(tmp_path))
             )
             if sub_error.context:
-                self.extract_messages(_path, sub_error, report)
+                cls.extract_messages(_path, sub_error, report)
             else:
                 report.add(
                     (
@@ -1318,30 +1559,30 @@ class ValidateAnnotationUseCase(BaseReportableUseCase):
                     )
                 )
 
-    def execute(self) -> Response:
-        try:
-            version = self._annotation["version"]
-        except KeyError:
-            version = self.DEFAULT_VERSION
-        extract_path = ValidateAnnotationUseCase.extract_path
-        validator = self._get_validator(version)
-        errors = sorted(validator.iter_errors(self._annotation), key=lambda e: e.path)
+    @classmethod
+    def collect_errors(
+        cls, validator: superannotate_schemas.Draft7Validator, annotation: dict
+    ) -> list[tuple[str, str]]:
+        errors = sorted(validator.iter_errors(annotation), key=lambda e: e.path)
         errors_report: set[tuple[str, str]] = set()
-        if errors:
-            for error in errors:
-                if not error:
-                    continue
-                real_path = extract_path(error.path)
-                if not error.context:
-                    errors_report.add(("".join(real_path), error.message))
-                self.extract_messages(real_path, error, errors_report)
+        for error in errors:
+            if not error:
+                continue
+            real_path = cls.extract_path(error.path)
+            if not error.context:
+                errors_report.add(("".join(real_path), error.message))
+            cls.extract_messages(real_path, error, errors_report)
+        return list(sorted(errors_report, key=lambda x: x[0]))
 
-        self._response.data = list(sorted(errors_report, key=lambda x: x[0]))
+    def execute(self) -> Response:
+        validator = self._get_validator(self.get_version(self._annotation))
+        self._response.data = self.collect_errors(validator, self._annotation)
         return self._response
 
 
 class GetAnnotations(BaseReportableUseCase):
     CHUNK_SIZE = 1000
+    RETRIES = 3
 
     def __init__(
         self,
@@ -1352,6 +1593,9 @@ class GetAnnotations(BaseReportableUseCase):
         folder: FolderEntity = None,
         items: list[str] | list[int] | None = None,
         transform_version: str = None,
+        since: datetime | str | None = None,
+        sync_state: HighWaterMarkStore = None,
+        concurrency_limit: AdaptiveConcurrencyLimit = None,
     ):
         super().__init__(reporter)
         self._config = config
@@ -1361,8 +1605,14 @@ class GetAnnotations(BaseReportableUseCase):
         self._items = items
         self._item_id_name_map = {}
         self._item_names_provided = True
-        self._big_annotations_queue = None
         self._transform_version = transform_version
+        self._since = since
+        self._sync_state = sync_state or HighWaterMarkStore(
+            constants.SYNC_STATE_FILE_LOCATION
+        )
+        self._concurrency_limit = concurrency_limit or AdaptiveConcurrencyLimit(
+            config.MAX_COROUTINE_COUNT, config.MAX_ADAPTIVE_COROUTINE_COUNT
+        )
 
     @staticmethod
     def items_duplication_validation(
@@ -1383,6 +1633,29 @@ class GetAnnotations(BaseReportableUseCase):
             seen = set()
             self._items = [i for i in self._items if not (i in seen or seen.add(i))]
 
+    def validate_since(self):
+        self._since = validate_since(self._since)
+
+    @property
+    def sync_key(self) -> str:
+        return HighWaterMarkStore.get_key(
+            self._project.id, self._folder.id if self._folder else None
+        )
+
+    def get_since_query(self) -> Query:
+        since = self._since
+        if since == SINCE_LAST_SYNC:
+            since = self._sync_state.get(self.sync_key)
+        if since:
+            return Filter("updatedAt", since, OperatorEnum.GTE)
+        return EmptyQuery()
+
+    def update_sync_state(self, items: list[BaseItemEntity]):
+        if self._since == SINCE_LAST_SYNC:
+            self._sync_state.update(
+                self.sync_key, max((i.updatedAt or "" for i in items), default=None)
+            )
+
     def _prettify_annotations(self, annotations: list[dict]):
         re_struct = {}
         if self._items:
@@ -1400,22 +1673,12 @@ class GetAnnotations(BaseReportableUseCase):
 
         return annotations
 
-    async def get_big_annotation(self):
-        large_annotations = []
-        while True:
-            item: BaseItemEntity = await self._big_annotations_queue.get()
-            if item:
-                large_annotations.append(
-                    await self._service_provider.annotations.get_big_annotation(
-                        project=self._project,
-                        item=item,
-                        reporter=self.reporter,
-                    )
-                )
-            else:
-                await self._big_annotations_queue.put(None)
-                break
-        return large_annotations
+    async def get_big_annotation(self, item: BaseItemEntity) -> dict:
+        return await self._service_provider.annotations.get_big_annotation(
+            project=self._project,
+            item=item,
+            reporter=self.reporter,
+        )
 
     async def get_small_annotations(self, item_ids: list[int]):
         return await self._service_provider.annotations.list_small_annotations(
@@ -1426,112 +1689,219 @@ class GetAnnotations(BaseReportableUseCase):
             transform_version=self._transform_version,
         )
 
-    async def run_workers(
-        self,
-        big_annotations: list[BaseItemEntity],
-        small_annotations: list[list[dict]],
-    ):
-        annotations = []
-        if big_annotations:
-            self._big_annotations_queue = asyncio.Queue()
-            for item in big_annotations:
-                self._big_annotations_queue.put_nowait(item)
-            self._big_annotations_queue.put_nowait(None)
-            annotations.extend(
-                list(
-                    itertools.chain.from_iterable(
-                        await asyncio.gather(
-                            *[
-                                self.get_big_annotation()
-                                for _ in range(
-                                    max(self._config.MAX_COROUTINE_COUNT // 2, 1)
-                                )
-                            ]
-                        )
-                    )
+    async def iter_jobs(
+        self, items: list[BaseItemEntity]
+    ) -> AsyncIterator[tuple[bool, Any]]:
+        """
+        Lists the items page by page in a thread, the next page is listed
+        while the current one is classified and its jobs run.
+        The listed items are collected into items.
+        """
+        pages = self.iter_item_pages()
+        next_page = asyncio.ensure_future(asyncio.to_thread(next, pages, None))
+        try:
+            while (page := await next_page) is not None:
+                next_page = asyncio.ensure_future(asyncio.to_thread(next, pages, None))
+                items.extend(page)
+                self.reporter.extend_progress(len(page))
+                async for job in iter_annotation_jobs(
+                    self._service_provider, self._project, page
+                ):
+                    yield job
+        finally:
+            next_page.cancel()
+        self.log_listed_items(len(items))
+
+    async def run_workers(self, items: list[BaseItemEntity]) -> list[dict]:
+        async def _get_annotations(job: tuple[bool, Any]) -> list[dict]:
+            is_large, payload = job
+            if is_large:
+                return [await self.get_big_annotation(payload)]
+            return await self.get_small_annotations([i["id"] for i in payload])
+
+        results = await gather_adaptive(
+            _get_annotations,
+            self.iter_jobs(items),
+            self._concurrency_limit,
+            retries=self.RETRIES,
+        )
+        return list(filter(None, itertools.chain.from_iterable(results)))
+
+    def iter_item_pages(self) -> Iterator[list[BaseItemEntity]]:
+        if self._items:
+            if isinstance(self._items[0], str) and not self._since:
+                yield list(
+                    self._service_provider.get_items_by_name(
+                        self._project, self._folder, self._items
+                    ).values()
                 )
+            elif isinstance(self._items[0], str):
+                for names in divide_to_chunks(self._items, 1000):
+                    yield self._service_provider.item_service.list(
+                        self._project.id,
+                        self._folder.id,
+                        Filter("name", names, OperatorEnum.IN) & self.get_since_query(),
+                    )
+            else:
+                for i in range(0, len(self._items), self.CHUNK_SIZE):
+                    search_ids = self._items[i : i + self.CHUNK_SIZE]  # noqa
+                    data = self._service_provider.item_service.list(
+                        self._project.id,
+                        None,
+                        Filter("id", search_ids, OperatorEnum.IN)
+                        & self.get_since_query(),
+                    )
+                    self._item_id_name_map.update({i.id: i.name for i in data})
+                    yield data
+        elif self._items is None:
+            yield from self._service_provider.item_service.iter_list(
+                self._project.id, self._folder.id, self.get_since_query()
+            )
+
+    def log_missing_items(self, items_count: int):
+        if self._items and items_count != len(self._items) and not self._since:
+            self.reporter.log_warning(
+                f"Could not find annotations for {len(self._items) - items_count}/{len(self._items)} items."
             )
-        if small_annotations:
-            for chunks in divide_to_chunks(
-                small_annotations, self._config.MAX_COROUTINE_COUNT
-            ):
-                tasks = []
-                for chunk in chunks:
-                    tasks.append(self.get_small_annotations([i["id"] for i in chunk]))
-                annotations.extend(
-                    list(itertools.chain.from_iterable(await asyncio.gather(*tasks)))
-                )
 
-        return list(filter(None, annotations))
+    def log_listed_items(self, items_count: int):
+        self.log_missing_items(items_count)
+        if items_count:
+            self.log_start(items_count)
+        else:
+            logger.info("No annotations to download.")
 
-    def execute(self):
+    def list_items(self) -> list[BaseItemEntity]:
+        items = list(itertools.chain.from_iterable(self.iter_item_pages()))
+        self.log_missing_items(len(items))
+        return items
+
+    def log_start(self, items_count: int):
+        self.reporter.log_info(
+            f"Getting {items_count} annotations from "
+            f"{self._project.name}{f'/{self._folder.name}' if self._folder and self._folder.name != 'root' else ''}."
+        )
+
+    async def execute_async(self):
+        """Runs the use case in the running event loop."""
         if self.is_valid():
-            items = []
-            if self._items:
-                if isinstance(self._items[0], str):
-                    items = []
-                    for names in divide_to_chunks(self._items, 1000):
-                        data = self._service_provider.item_service.list(
-                            self._project.id,
-                            self._folder.id,
-                            Filter("name", names, OperatorEnum.IN),
-                        )
-                        items.extend(data)
-                else:
-                    items: list[BaseItemEntity] = []
-                    for i in range(0, len(self._items), self.CHUNK_SIZE):
-                        search_ids = self._items[i : i + self.CHUNK_SIZE]  # noqa
-                        data = self._service_provider.item_service.list(
-                            self._project.id,
-                            None,
-                            Filter("id", search_ids, OperatorEnum.IN),
-                        )
-                        items.extend(data)
-                    self._item_id_name_map = {i.id: i.name for i in items}
-                len_items, len_provided_items = len(items), len(self._items)
-                if len_items != len_provided_items:
-                    self.reporter.log_warning(
-                        f"Could not find annotations for {len_provided_items - len_items}/{len_provided_items} items."
-                    )
-            elif self._items is None:
-                items = self._service_provider.item_service.list(
-                    self._project.id, self._folder.id, EmptyQuery()
-                )
-            if not items:
-                logger.info("No annotations to download.")
-                self._response.data = []
-                return self._response
-            items_count = len(items)
-            self.reporter.log_info(
-                f"Getting {items_count} annotations from "
-                f"{self._project.name}{f'/{self._folder.name}' if self._folder and self._folder.name != 'root' else ''}."
-            )
-            id_item_map = {i.id: i for i in items}
+            # the total grows as the items are listed
             self.reporter.start_progress(
-                items_count,
+                0,
                 disable=logger.level > logging.INFO or self.reporter.log_enabled,
             )
-            sort_response = self._service_provider.annotations.get_upload_chunks(
-                project=self._project,
-                item_ids=list(id_item_map),
-            )
-            large_item_ids = set(map(itemgetter("id"), sort_response["large"]))
-            large_items: list[BaseItemEntity] = list(
-                filter(lambda item: item.id in large_item_ids, items)
-            )
-            small_items: list[list[dict]] = sort_response["small"]
+            items: list[BaseItemEntity] = []
             try:
-                annotations = run_async(self.run_workers(large_items, small_items))
+                annotations = await self.run_workers(items)
             except Exception as e:
                 logger.error(e)
                 self._response.errors = AppException("Can't get annotations.")
                 return self._response
-            self.reporter.finish_progress()
+            finally:
+                self.reporter.finish_progress()
+            await asyncio.to_thread(self.update_sync_state, items)
             self._response.data = self._prettify_annotations(annotations)  # noqa
         return self._response
 
+    def execute(self):
+        return run_async(self.execute_async())
+
+
+class IterAnnotations(GetAnnotations):
+    """
+    Streams annotations in the order they are received instead of collecting
+    them into a list. The chunks are fetched concurrently within the adaptive
+    concurrency limit and at most ``BUFFER_SIZE`` decoded annotations are kept
+    in memory, slow consumers suspend the download. Failed chunks are not
+    retried, as part of their annotations may be already yielded.
+    """
+
+    BUFFER_SIZE = 1000
+
+    async def _produce(
+        self,
+        jobs: AsyncIterator[tuple[bool, Any]],
+        lock: asyncio.Lock,
+        queue: asyncio.Queue,
+    ):
+        while True:
+            async with lock:
+                job = await anext(jobs, None)
+            if job is None:
+                return
+            is_large, payload = job
+            # the slot is released once the response is read, waiting for
+            # the consumer doesn't hold it nor count in the measured latency
+            async with self._concurrency_limit.slot():
+                if is_large:
+                    annotations = [
+                        await self._service_provider.annotations.get_big_annotation(
+                            project=self._project,
+                            item=payload,
+                            reporter=self.reporter,
+                            transform_version=self._transform_version,
+                        )
+                    ]
+                else:
+                    annotations = [
+                        annotation
+                        async for annotation in self._service_provider.annotations.iter_small_annotations(
+                            project=self._project,
+                            folder=self._folder,
+                            item_ids=[i["id"] for i in payload],
+                            reporter=self.reporter,
+                            transform_version=self._transform_version,
+                        )
+                    ]
+            for annotation in annotations:
+                if annotation:
+                    await queue.put(annotation)
+
+    async def iter_workers(self, items: list[BaseItemEntity]) -> AsyncIterator[dict]:
+        queue = asyncio.Queue(maxsize=self.BUFFER_SIZE)
+        jobs = iter_annotation_jobs(self._service_provider, self._project, items)
+        lock = asyncio.Lock()
+        workers = [
+            asyncio.create_task(self._produce(jobs, lock, queue))
+            for _ in range(self._concurrency_limit.maximum)
+        ]
+
+        async def _join_workers():
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                await queue.put(None)
+
+        joiner = asyncio.create_task(_join_workers())
+        try:
+            while (annotation := await queue.get()) is not None:
+                yield annotation
+            await joiner
+        finally:
+            for task in (*workers, joiner):
+                task.cancel()
+            await asyncio.gather(*workers, joiner, return_exceptions=True)
+            await jobs.aclose()
+
+    def _iter_annotations(self) -> Iterator[dict]:
+        items = self.list_items()
+        if not items:
+            logger.info("No annotations to download.")
+            return
+        self.log_start(len(items))
+        yield from iter_async(self.iter_workers(items), self.BUFFER_SIZE)
+        self.update_sync_state(items)
+
+    def execute(self):
+        if self.is_valid():
+            self._response.data = self._iter_annotations()
+        return self._response
+
 
 class DownloadAnnotations(BaseReportableUseCase):
+    RETRIES = 3
+    FOLDER_CONCURRENCY = 8
+
     def __init__(
         self,
         config: ConfigEntity,
@@ -1544,6 +1914,9 @@ class DownloadAnnotations(BaseReportableUseCase):
         service_provider: BaseServiceProvider,
         callback: Callable = None,
         transform_version=None,
+        resume: bool = False,
+        since: datetime | str | None = None,
+        concurrency_limit: AdaptiveConcurrencyLimit = None,
     ):
         super().__init__(reporter)
         self._config = config
@@ -1554,8 +1927,15 @@ class DownloadAnnotations(BaseReportableUseCase):
         self._item_names = item_names
         self._service_provider = service_provider
         self._callback = callback
-        self._big_file_queue = None
         self._transform_version = transform_version
+        self._resume = resume
+        self._since = since
+        self._manifest: DownloadManifest | None = None
+        self._sync_state: HighWaterMarkStore | None = None
+        self._id_item_map: dict[int, BaseItemEntity] = {}
+        self._concurrency_limit = concurrency_limit or AdaptiveConcurrencyLimit(
+            config.MAX_COROUTINE_COUNT, config.MAX_ADAPTIVE_COROUTINE_COUNT
+        )
 
     def validate_items(self):
         if self._item_names:
@@ -1563,6 +1943,19 @@ class DownloadAnnotations(BaseReportableUseCase):
                 self.reporter, self._item_names
             )
 
+    def validate_since(self):
+        self._since = validate_since(self._since)
+
+    def get_since_query(self, folder: FolderEntity) -> Query:
+        since = self._since
+        if since == SINCE_LAST_SYNC:
+            since = self._sync_state.get(
+                HighWaterMarkStore.get_key(self._project.id, folder.id)
+            )
+        if since:
+            return Filter("updatedAt", since, OperatorEnum.GTE)
+        return EmptyQuery()
+
     @property
     def destination(self) -> str:
         if self._destination:
@@ -1608,22 +2001,51 @@ class DownloadAnnotations(BaseReportableUseCase):
 
     @staticmethod
     def get_items_count(path: str):
-        return sum([len(files) for r, d, files in os.walk(path)])
+        excluded = {DownloadManifest.FILE_NAME, HighWaterMarkStore.FILE_NAME}
+        return sum(
+            len([i for i in files if i not in excluded])
+            for r, d, files in os.walk(path)
+        )
 
-    async def download_big_annotations(self, export_path):
-        while True:
-            item = await self._big_file_queue.get()
-            self._big_file_queue.task_done()
-            if item:
-                await self._service_provider.annotations.download_big_annotation(
-                    project=self._project,
-                    item=item,
-                    download_path=f"{export_path}{'/' + self._folder.name if not self._folder.is_root else ''}",
-                    callback=self._callback,
-                )
-            else:
-                self._big_file_queue.put_nowait(None)
-                break
+    def _get_download_path(self, export_path: str) -> str:
+        return f"{export_path}{'/' + self._folder.name if not self._folder.is_root else ''}"
+
+    def _skip_downloaded_items(
+        self, items: list[BaseItemEntity], export_path: str
+    ) -> list[BaseItemEntity]:
+        download_path = self._get_download_path(export_path)
+        return [
+            item
+            for item in items
+            if not self._manifest.is_up_to_date(
+                item.id,
+                item.updatedAt,
+                f"{download_path}/{item.name}.json",
+                self._transform_version,
+            )
+        ]
+
+    def _store_callback(self, item_id: int, file_path, size: int, checksum: str):
+        if self._manifest is None:
+            return
+        item = self._id_item_map.get(item_id)
+        self._manifest.add(
+            item_id,
+            item.updatedAt if item else None,
+            file_path,
+            size,
+            checksum,
+            self._transform_version,
+        )
+
+    async def download_big_annotation(self, item: BaseItemEntity, export_path):
+        await self._service_provider.annotations.download_big_annotation(
+            project=self._project,
+            item=item,
+            download_path=self._get_download_path(export_path),
+            callback=self._callback,
+            store_callback=self._store_callback,
+        )
 
     async def download_small_annotations(
         self, item_ids: list[int], export_path, folder: FolderEntity
@@ -1633,42 +2055,33 @@ class DownloadAnnotations(BaseReportableUseCase):
             folder=folder,
             item_ids=item_ids,
             reporter=self.reporter,
-            download_path=f"{export_path}{'/' + self._folder.name if not self._folder.is_root else ''}",
+            download_path=self._get_download_path(export_path),
             callback=self._callback,
             transform_version=self._transform_version,
+            store_callback=self._store_callback,
         )
 
     async def run_workers(
         self,
-        big_annotations: list[BaseItemEntity],
-        small_annotations: list[list[dict]],
+        items: list[BaseItemEntity],
         folder: FolderEntity,
         export_path,
     ):
-        if big_annotations:
-            self._big_file_queue = asyncio.Queue()
-            for item in big_annotations:
-                self._big_file_queue.put_nowait(item)
-            self._big_file_queue.put_nowait(None)
-            await asyncio.gather(
-                *[
-                    self.download_big_annotations(export_path)
-                    for _ in range(max(self._config.MAX_COROUTINE_COUNT // 2, 1))
-                ]
-            )
+        async def _download(job: tuple[bool, Any]):
+            is_large, payload = job
+            if is_large:
+                await self.download_big_annotation(payload, export_path)
+            else:
+                await self.download_small_annotations(
+                    [i["id"] for i in payload], export_path, folder
+                )
 
-        if small_annotations:
-            for chunks in divide_to_chunks(
-                small_annotations, self._config.MAX_COROUTINE_COUNT
-            ):
-                tasks = []
-                for chunk in chunks:
-                    tasks.append(
-                        self.download_small_annotations(
-                            [i["id"] for i in chunk], export_path, folder
-                        )
-                    )
-                await asyncio.gather(*tasks)
+        await gather_adaptive(
+            _download,
+            iter_annotation_jobs(self._service_provider, self._project, items),
+            self._concurrency_limit,
+            retries=self.RETRIES,
+        )
 
     def execute(self):
         if self.is_valid():
@@ -1683,46 +2096,25 @@ class DownloadAnnotations(BaseReportableUseCase):
                 ).data
             if not folders:
                 folders.append(self._folder)
-            for folder in folders:
-                if self._item_names:
-                    items = []
-                    for chunk in divide_to_chunks(self._item_names, 500):
-                        data = self._service_provider.item_service.list(
-                            self._project.id,
-                            folder.id,
-                            Filter("name", chunk, OperatorEnum.IN),
-                        )
-                        items.extend(data)
-                else:
-                    items = self._service_provider.item_service.list(
-                        self._project.id, folder.id, EmptyQuery()
-                    )
-                if not items:
-                    continue
-                new_export_path = self.destination
-                if not folder.is_root and self._folder.is_root:
-                    new_export_path += f"/{folder.name}"
-
-                id_item_map = {i.id: i for i in items}
-                sort_response = self._service_provider.annotations.get_upload_chunks(
-                    project=self._project,
-                    item_ids=list(id_item_map),
+            if self._resume:
+                self._manifest = DownloadManifest(self.destination).load()
+            if self._since == SINCE_LAST_SYNC:
+                self._sync_state = HighWaterMarkStore(
+                    Path(self.destination) / HighWaterMarkStore.FILE_NAME
                 )
-                large_item_ids = set(map(itemgetter("id"), sort_response["large"]))
-                large_items: list[BaseItemEntity] = list(
-                    filter(lambda item: item.id in large_item_ids, items)
+            try:
+                skipped_count = run_async(self._download_folders(folders))
+            except Exception as e:
+                logger.error(e)
+                self._response.errors = AppException("Can't get annotations.")
+                return self._response
+            finally:
+                if self._manifest:
+                    self._manifest.close()
+            if skipped_count:
+                logger.info(
+                    f"Skipped {skipped_count} items already downloaded and unchanged."
                 )
-                small_items: list[list[dict]] = sort_response["small"]
-                try:
-                    run_async(
-                        self.run_workers(
-                            large_items, small_items, folder, new_export_path
-                        )
-                    )
-                except Exception as e:
-                    logger.error(e)
-                    self._response.errors = AppException("Can't get annotations.")
-                    return self._response
             self.reporter.stop_spinner()
             count = self.get_items_count(self.destination)
             self.reporter.log_info(f"Downloaded annotations for {count} items.")
@@ -1730,6 +2122,67 @@ class DownloadAnnotations(BaseReportableUseCase):
             self._response.data = os.path.abspath(self.destination)
         return self._response
 
+    def _list_folder_items(self, folder: FolderEntity) -> list[BaseItemEntity]:
+        if self._item_names:
+            items = []
+            for chunk in divide_to_chunks(self._item_names, 500):
+                data = self._service_provider.item_service.list(
+                    self._project.id,
+                    folder.id,
+                    Filter("name", chunk, OperatorEnum.IN)
+                    & self.get_since_query(folder),
+                )
+                items.extend(data)
+            return items
+        return self._service_provider.item_service.list(
+            self._project.id, folder.id, self.get_since_query(folder)
+        )
+
+    async def _download_folder(self, folder: FolderEntity) -> int:
+        """
+        Returns the count of the skipped items.
+        """
+        listed_items = await asyncio.to_thread(self._list_folder_items, folder)
+        if not listed_items:
+            return 0
+        new_export_path = self.destination
+        if not folder.is_root and self._folder.is_root:
+            new_export_path += f"/{folder.name}"
+        items = listed_items
+        if self._manifest:
+            items = await asyncio.to_thread(
+                self._skip_downloaded_items, listed_items, new_export_path
+            )
+        if items:
+            self._id_item_map.update({i.id: i for i in items})
+            await self.run_workers(items, folder, new_export_path)
+        if self._sync_state:
+            self._sync_state.update(
+                HighWaterMarkStore.get_key(self._project.id, folder.id),
+                max((i.updatedAt or "" for i in listed_items), default=None),
+            )
+        return len(listed_items) - len(items)
+
+    async def _download_folders(self, folders: list[FolderEntity]) -> int:
+        """
+        Downloads up to FOLDER_CONCURRENCY folders at once, the annotation
+        requests of all folders share the same concurrency limit.
+        Returns the count of the skipped items.
+        """
+        semaphore = asyncio.Semaphore(self.FOLDER_CONCURRENCY)
+
+        async def _download(folder: FolderEntity) -> int:
+            async with semaphore:
+                return await self._download_folder(folder)
+
+        tasks = [asyncio.create_task(_download(folder)) for folder in folders]
+        try:
+            return sum(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
 
 class UploadMultiModalAnnotationsUseCase(BaseReportableUseCase):
     CHUNK_SIZE = 500
@@ -1777,16 +2230,11 @@ class UploadMultiModalAnnotationsUseCase(BaseReportableUseCase):
     def list_items(
         self, folder: FolderEntity, item_names: list[str]
     ) -> list[BaseItemEntity]:
-        existing_items = []
-        for i in range(0, len(item_names), self.CHUNK_SIZE):
-            items_to_check = item_names[i : i + self.CHUNK_SIZE]  # noqa: E203
-            data = self._service_provider.item_service.list(
-                self._project.id,
-                folder.id,
-                Filter("name", items_to_check, OperatorEnum.IN),
-            )
-            existing_items.extend(data)
-        return existing_items
+        return list(
+            self._service_provider.get_items_by_name(
+                self._project, folder, item_names
+            ).values()
+        )
 
     async def distribute_queues(self, items_to_upload: list[ItemToUpload]):
         data = [[i, False] for i in items_to_upload]
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 import logging
 
+from lib.core import json
 from lib.core.conditions import Condition
 from lib.core.conditions import CONDITION_EQ as EQ
 from lib.core.entities import AnnotationClassEntity
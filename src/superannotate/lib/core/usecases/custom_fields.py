@@ -1,11 +1,73 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from functools import partial
+from typing import Any
+
+from lib.core.concurrency import imap_bounded
 from lib.core.entities import FolderEntity
 from lib.core.entities import ProjectEntity
+from lib.core.exceptions import AppValidationException
 from lib.core.reporter import Reporter
 from lib.core.response import Response
 from lib.core.serviceproviders import BaseServiceProvider
 from lib.core.usecases import BaseReportableUseCase
+from lib.infrastructure.utils import divide_to_chunks
+from pydantic import ValidationError
+
+NO_ITEMS_MESSAGE = "No items provided."
+
+
+def iter_valid_rows(
+    rows: Iterable, is_valid_value: Callable[[Any], bool], invalid_rows: list[int]
+) -> Iterator[dict]:
+    """
+    Yields the rows mapping item names to valid values and collects the positions
+    of the other rows into invalid_rows. The rows of the iterables validated
+    by pydantic while they are read raise ValidationError, they're invalid too.
+    """
+    rows = iter(rows)
+    position = 0
+    while True:
+        try:
+            row = next(rows)
+        except StopIteration:
+            return
+        except ValidationError:
+            row = None
+        if isinstance(row, dict) and all(
+            isinstance(name, str) and is_valid_value(value)
+            for name, value in row.items()
+        ):
+            yield row
+        else:
+            invalid_rows.append(position)
+        position += 1
+
+
+def log_invalid_rows(reporter: Reporter, invalid_rows: list[int], expected: str):
+    if invalid_rows:
+        reporter.log_warning(
+            f"Skipped {len(invalid_rows)} row(s) that don't map item names to {expected}, "
+            f"at the positions: {', '.join(map(str, invalid_rows))}."
+        )
+
+
+def iter_until_failed(chunks: Iterable, errors: list) -> Iterator:
+    """
+    Stops reading the chunks once a sent chunk has failed, the chunks already
+    in flight are still finished.
+    """
+    for chunk in chunks:
+        yield chunk
+        if errors:
+            return
+
+
+def _is_field_names(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(i, str) for i in value)
 
 
 class CreateCustomSchemaUseCase(BaseReportableUseCase):
@@ -27,6 +89,7 @@ class CreateCustomSchemaUseCase(BaseReportableUseCase):
             schema=self._schema,
         )
         if response.ok:
+            self._service_provider.invalidate_saqul_queries(self._project)
             self._response.data = response.data
         else:
             error = response.error
@@ -77,6 +140,7 @@ class DeleteCustomSchemaUseCase(BaseReportableUseCase):
             fields=self._fields,
         )
         if response.ok:
+            self._service_provider.invalidate_saqul_queries(self._project)
             use_case_response = GetCustomSchemaUseCase(
                 reporter=self.reporter,
                 project=self._project,
@@ -92,14 +156,21 @@ class DeleteCustomSchemaUseCase(BaseReportableUseCase):
 
 
 class UploadCustomValuesUseCase(BaseReportableUseCase):
+    """
+    Uploads the values in chunks, keeping up to MAX_IN_FLIGHT_CHUNKS of them in flight.
+    The items can be any iterable, it's read one chunk at a time and the invalid
+    rows are skipped before the chunks are sent.
+    """
+
     CHUNK_SIZE = 5000
+    MAX_IN_FLIGHT_CHUNKS = 4
 
     def __init__(
         self,
         reporter: Reporter,
         project: ProjectEntity,
         folder: FolderEntity,
-        items: list[dict[str, str]],
+        items: Iterable[dict[str, dict]],
         service_provider: BaseServiceProvider,
     ):
         super().__init__(reporter)
@@ -109,46 +180,68 @@ class UploadCustomValuesUseCase(BaseReportableUseCase):
         self._service_provider = service_provider
 
     def execute(self) -> Response:
-        uploaded_items, failed_items = [], []
+        item_names, failed_items, invalid_rows, errors = set(), [], [], []
         self.reporter.log_info(
             "Validating metadata against the schema of the custom fields. "
             "Valid metadata will be attached to the specified item."
         )
+        upload = partial(
+            self._service_provider.explore.upload_fields,
+            self._project,
+            self._folder,
+        )
+        rows = iter_valid_rows(
+            self._items, lambda value: isinstance(value, dict), invalid_rows
+        )
         with self.reporter.spinner:
-            for idx in range(0, len(self._items), self.CHUNK_SIZE):
-                response = self._service_provider.explore.upload_fields(
-                    project=self._project,
-                    folder=self._folder,
-                    items=self._items[idx : idx + self.CHUNK_SIZE],  # noqa: E203
-                )
+            for chunk, response in imap_bounded(
+                upload,
+                iter_until_failed(divide_to_chunks(rows, self.CHUNK_SIZE), errors),
+                self.MAX_IN_FLIGHT_CHUNKS,
+            ):
                 if not response.ok:
-                    self._response.errors = response.error
-                    return self._response
+                    errors.append(response.error)
+                    continue
+                item_names.update(name for item in chunk for name in item)
                 failed_items.extend(response.data.failed_items)
-
+        log_invalid_rows(self.reporter, invalid_rows, "metadata dicts")
+        if not item_names and not errors:
+            raise AppValidationException(NO_ITEMS_MESSAGE)
+        self._response.data = {
+            "succeeded": list(item_names.difference(failed_items)),
+            "failed": failed_items,
+        }
+        if errors:
+            self.reporter.log_warning(
+                f"Before the failure, the values of {len(self._response.data['succeeded'])} item(s) were "
+                f"uploaded and {len(failed_items)} item(s) failed to match the schema of the custom fields."
+            )
+            self._response.errors = errors[0]
+            return self._response
         if failed_items:
             self.reporter.log_error(
                 f"The metadata dicts of {len(failed_items)} items are invalid because they don't match "
                 f'the schema of the custom fields defined for the "{self._project.name}" project.'
             )
-        self._response.data = {
-            "succeeded": list(
-                {list(item)[0] for item in self._items} ^ set(failed_items)
-            ),
-            "failed": failed_items,
-        }
         return self._response
 
 
 class DeleteCustomValuesUseCase(BaseReportableUseCase):
+    """
+    Deletes the values in chunks, keeping up to MAX_IN_FLIGHT_CHUNKS of them in flight.
+    The items can be any iterable, it's read one chunk at a time and the invalid
+    rows are skipped before the chunks are sent.
+    """
+
     CHUNK_SIZE = 5000
+    MAX_IN_FLIGHT_CHUNKS = 4
 
     def __init__(
         self,
         reporter: Reporter,
         project: ProjectEntity,
         folder: FolderEntity,
-        items: list[dict[str, list[str]]],
+        items: Iterable[dict[str, list[str]]],
         service_provider: BaseServiceProvider,
     ):
         super().__init__(reporter)
@@ -158,15 +251,31 @@ class DeleteCustomValuesUseCase(BaseReportableUseCase):
         self._service_provider = service_provider
 
     def execute(self) -> Response:
-        for idx in range(0, len(self._items), self.CHUNK_SIZE):
-            response = self._service_provider.explore.delete_values(
-                project=self._project,
-                folder=self._folder,
-                items=self._items[idx : idx + self.CHUNK_SIZE],  # noqa: E203
-            )
+        delete = partial(
+            self._service_provider.explore.delete_values,
+            self._project,
+            self._folder,
+        )
+        deleted_count, invalid_rows, errors = 0, [], []
+        rows = iter_valid_rows(self._items, _is_field_names, invalid_rows)
+        for chunk, response in imap_bounded(
+            delete,
+            iter_until_failed(divide_to_chunks(rows, self.CHUNK_SIZE), errors),
+            self.MAX_IN_FLIGHT_CHUNKS,
+        ):
             if not response.ok:
-                self._response.errors = response.error
-                return self._response
+                errors.append(response.error)
+                continue
+            deleted_count += len(chunk)
+        log_invalid_rows(self.reporter, invalid_rows, "lists of field names")
+        if not deleted_count and not errors:
+            raise AppValidationException(NO_ITEMS_MESSAGE)
+        if errors:
+            self.reporter.log_warning(
+                f"Before the failure, the fields of {deleted_count} item(s) were removed."
+            )
+            self._response.errors = errors[0]
+            return self._response
         self.reporter.log_info(
             "Corresponding fields and their values removed from items."
         )
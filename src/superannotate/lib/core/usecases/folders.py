@@ -152,6 +152,8 @@ class DeleteFolderUseCase(BaseUseCase):
             response = self.service_provider.folders.delete_multiple(
                 self._project, self._folders
             )
+            for folder in self._folders:
+                self.service_provider.invalidate_item_names(self._project, folder)
             if not response.ok:
                 self._response.errors = AppException("Couldn't delete folders.")
         else:
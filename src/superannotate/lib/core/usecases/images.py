@@ -3,7 +3,6 @@ from __future__ import annotations
 import concurrent.futures
 import copy
 import io
-import json
 import logging
 import os.path
 import random
@@ -20,6 +19,7 @@ import lib.core as constances
 import numpy as np
 import requests
 from botocore.exceptions import ClientError
+from lib.core import json
 from lib.core.conditions import Condition
 from lib.core.conditions import CONDITION_EQ as EQ
 from lib.core.entities import AnnotationClassEntity
@@ -154,6 +154,7 @@ class AttachFileUrlsUseCase(BaseUseCase):
                 upload_state_code=self.upload_state_code,
                 meta=meta,
             )
+            self._service_provider.invalidate_item_names(self._project, self._folder)
             if isinstance(backend_response, dict) and "error" in backend_response:
                 self._response.errors = AppException(backend_response["error"])
             else:
@@ -359,6 +360,8 @@ class UpdateItemUseCase(BaseUseCase):
 
     def execute(self):
         self._service_provider.items.update(project=self._project, item=self._item)
+        # the item can be renamed
+        self._service_provider.invalidate_item_names(self._project)
         return self._response
 
 
@@ -827,7 +830,6 @@ class UploadImageToProject(BaseUseCase):
 
 class UploadImagesToProject(BaseInteractiveUseCase):
     MAX_WORKERS = 10
-    LIST_NAME_CHUNK_SIZE = 500
 
     def __init__(
         self,
@@ -994,8 +996,6 @@ class UploadImagesToProject(BaseInteractiveUseCase):
         for path in paths:
             name_path_map[Path(path).name].append(path)
 
-        CHUNK_SIZE = UploadImagesToProject.LIST_NAME_CHUNK_SIZE
-
         filtered_paths = []
         duplicated_paths = []
         existing_items = []
@@ -1009,23 +1009,13 @@ class UploadImagesToProject(BaseInteractiveUseCase):
                 f"{len(duplicated_paths)} duplicate paths found that won't be uploaded."
             )
 
-        image_list = []
-        for i in range(0, len(filtered_paths), CHUNK_SIZE):
-            data = self._service_provider.item_service.list(
-                self._project.id,
-                self._folder.id,
-                Filter(
-                    "name",
-                    [
-                        image.split("/")[-1]
-                        for image in filtered_paths[i : i + CHUNK_SIZE]
-                    ],
-                    OperatorEnum.IN,
-                ),
+        image_list = set(
+            self._service_provider.get_items_by_name(
+                self._project,
+                self._folder,
+                [image.split("/")[-1] for image in filtered_paths],
             )
-            image_list.extend([image.name for image in data])
-
-        image_list = set(image_list)
+        )
         images_to_upload = []
 
         for path in filtered_paths:
@@ -1728,15 +1718,11 @@ class UploadVideosAsImages(BaseReportableUseCase):
                     frame_names = VideoPlugin.get_extractable_frames(
                         path, self._start_time, self._end_time, self._target_fps
                     )
-                    duplicate_images = []
-                    for names in divide_to_chunks(frame_names, 500):
-                        _items = self._service_provider.item_service.list(
-                            self._project.id,
-                            self._folder.id,
-                            Filter("name", names, OperatorEnum.IN),
+                    duplicate_images = list(
+                        self._service_provider.get_items_by_name(
+                            self._project, self._folder, frame_names
                         )
-                        duplicate_images.extend(_items)
-                    duplicate_images = [image.name for image in duplicate_images]
+                    )
                     frames_generator_use_case = ExtractFramesUseCase(
                         service_provider=self._service_provider,
                         project=self._project,
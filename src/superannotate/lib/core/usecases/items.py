@@ -4,9 +4,12 @@ import logging
 import re
 import traceback
 from collections import defaultdict
+from collections.abc import Callable
 from collections.abc import Generator
+from collections.abc import Iterator
 from concurrent.futures import as_completed
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from typing import Literal
 
 import lib.core as constants
@@ -29,6 +32,7 @@ from lib.core.jsx_conditions import Filter
 from lib.core.jsx_conditions import OperatorEnum
 from lib.core.reporter import Reporter
 from lib.core.response import Response
+from lib.core.service_types import ServiceResponse
 from lib.core.serviceproviders import BaseServiceProvider
 from lib.core.types import Attachment
 from lib.core.types import AttachmentMeta
@@ -73,7 +77,57 @@ def add_item_path(project: ProjectEntity, folder: FolderEntity, item: BaseItemEn
     return item
 
 
+def run_item_chunks(
+    func: Callable[[list[str]], ServiceResponse],
+    item_names: list[str],
+    chunk_size: int,
+    max_workers: int = 4,
+) -> list[tuple[list[str], ServiceResponse]]:
+    """
+    Calls func with the chunks of item_names in up to max_workers threads, the
+    requests are paced by the shared rate limiter of the client.
+    Returns the chunks with their responses in the order of the chunks.
+    """
+    chunks = [list(chunk) for chunk in divide_to_chunks(item_names, chunk_size)]
+    if len(chunks) <= 1:
+        return [(chunk, func(chunk)) for chunk in chunks]
+    with ThreadPoolExecutor(min(max_workers, len(chunks))) as executor:
+        return list(zip(chunks, executor.map(func, chunks)))
+
+
+def format_item_names(names: list[str], limit: int = None) -> str:
+    """Joins the names, the ones after the first limit names are only counted."""
+    if limit is None or len(names) <= limit:
+        return ", ".join(names)
+    return f"{', '.join(names[:limit])} and {len(names) - limit} more"
+
+
+def log_failed_chunks(
+    reporter: Reporter,
+    results: list[tuple[list[str], ServiceResponse]],
+    max_logged_names: int = 10,
+) -> list[str]:
+    """Warns about the items of the failed chunks and returns their names."""
+    failed = []
+    for chunk, response in results:
+        if not response.ok:
+            logger.debug(f"Failed to update {len(chunk)} item(s): {response.error}")
+            failed.extend(chunk)
+    if failed:
+        total = sum(len(chunk) for chunk, _ in results)
+        reporter.log_warning(
+            f"Failed to update {len(failed)}/{total} item(s): "
+            f"{format_item_names(failed, max_logged_names)}"
+        )
+    return failed
+
+
 class QueryEntitiesUseCase(BaseReportableUseCase):
+    """
+    Returns a lazy iterator of the queried item pages,
+    the pages are fetched while the iterator is consumed.
+    """
+
     def __init__(
         self,
         reporter: Reporter,
@@ -82,6 +136,7 @@ class QueryEntitiesUseCase(BaseReportableUseCase):
         service_provider: BaseServiceProvider,
         query: str,
         subset: str = None,
+        prefetch: int = 0,
     ):
         super().__init__(reporter)
         self._project = project
@@ -89,10 +144,11 @@ class QueryEntitiesUseCase(BaseReportableUseCase):
         self._service_provider = service_provider
         self._query = query
         self._subset = subset
+        self._prefetch = prefetch
 
     def validate_arguments(self):
         if self._query:
-            response = self._service_provider.explore.validate_saqul_query(
+            response = self._service_provider.validate_saqul_query(
                 project=self._project, query=self._query
             )
 
@@ -103,9 +159,7 @@ class QueryEntitiesUseCase(BaseReportableUseCase):
             else:
                 raise AppException("Incorrect query.")
         else:
-            response = self._service_provider.explore.validate_saqul_query(
-                self._project, "-"
-            )
+            response = self._service_provider.validate_saqul_query(self._project, "-")
             if not response.ok:
                 raise AppException(response.error)
 
@@ -143,27 +197,30 @@ class QueryEntitiesUseCase(BaseReportableUseCase):
             query_kwargs["folder"] = (
                 None if self._folder.name == "root" else self._folder
             )
-            service_response = self._service_provider.explore.saqul_query(
-                self._project,
-                **query_kwargs,
+            self._response.data = self._process_pages(
+                self._service_provider.explore.iter_saqul_query(
+                    self._project, prefetch=self._prefetch, **query_kwargs
+                )
             )
-            if service_response.ok:
-                data = []
-                for i, item in enumerate(service_response.data):
-                    #  tmp wrapper
-                    if "assignment" in item:
-                        item["assignments"] = item.pop("assignment")
-                    item["url"] = item.get("path", None)
-                    item["path"] = (
-                        f"{self._project.name}"
-                        f"{'/' + item['folder_name'] if not item['is_root_folder'] else ''}"
-                    )
-                    data.append(item)
-                self._response.data = data
-            else:
-                self._response.errors = service_response.data
         return self._response
 
+    def _process_pages(self, pages: Iterator[list[dict]]) -> Iterator[list[dict]]:
+        with closing(pages):
+            for page in pages:
+                yield self._process_page(page)
+
+    def _process_page(self, items: list[dict]) -> list[dict]:
+        for item in items:
+            #  tmp wrapper
+            if "assignment" in item:
+                item["assignments"] = item.pop("assignment")
+            item["url"] = item.get("path", None)
+            item["path"] = (
+                f"{self._project.name}"
+                f"{'/' + item['folder_name'] if not item['is_root_folder'] else ''}"
+            )
+        return items
+
 
 class QueryEntitiesCountUseCase(BaseReportableUseCase):
     def __init__(
@@ -184,7 +241,7 @@ class QueryEntitiesCountUseCase(BaseReportableUseCase):
 
     def validate_arguments(self):
         if self._query:
-            response = self._service_provider.explore.validate_saqul_query(
+            response = self._service_provider.validate_saqul_query(
                 project=self._project, query=self._query
             )
 
@@ -195,9 +252,7 @@ class QueryEntitiesCountUseCase(BaseReportableUseCase):
             else:
                 raise AppException("Incorrect query.")
         else:
-            response = self._service_provider.explore.validate_saqul_query(
-                self._project, "-"
-            )
+            response = self._service_provider.validate_saqul_query(self._project, "-")
             if not response.ok:
                 raise AppException(response.error)
 
@@ -413,6 +468,9 @@ class AttachItems(BaseReportableUseCase):
                         upload_state_code=self._upload_state_code,
                         meta=to_upload_meta,
                     )
+                    self._service_provider.invalidate_item_names(
+                        self._project, self._folder
+                    )
                     if not backend_response.ok:
                         self._response.errors = AppException(backend_response.error)
                     else:
@@ -498,6 +556,9 @@ class GenerateItems(BaseReportableUseCase):
                     attachments=chunk,
                     upload_state_code=3,
                 )
+                self._service_provider.invalidate_item_names(
+                    self._project, self._folder
+                )
                 if not backend_response.ok:
                     self._response.errors = AppException(backend_response.error)
                     return self._response
@@ -512,6 +573,9 @@ class CopyMoveItems(BaseReportableUseCase):
     Return skipped item names.
     """
 
+    MAX_IN_FLIGHT_CHUNKS = 4
+    VERIFY_BY_NAME_LIMIT = 10000
+
     def __init__(
         self,
         reporter: Reporter,
@@ -554,6 +618,45 @@ class CopyMoveItems(BaseReportableUseCase):
         if items_count > response.data.project_limit.remaining_image_count:
             raise AppValidationException(project_limit_err_msg)
 
+    def _process_chunk(self, item_names: list[str]) -> bool:
+        """
+        Copies or moves the items and waits for the operation to finish.
+        Returns False if the operation wasn't started.
+        """
+        response = self._service_provider.items.copy_move_multiple(
+            project=self._project,
+            from_folder=self._from_folder,
+            to_folder=self._to_folder,
+            item_names=item_names,
+            include_annotations=self._include_annotations,
+            duplicate_strategy=self._duplicate_strategy,
+            operation=self._operation,
+        )
+        if not response.ok or not response.data.get("poll_id"):
+            return False
+        self._service_provider.items.await_copy_move(
+            project=self._project,
+            poll_id=response.data["poll_id"],
+            items_count=len(item_names),
+        )
+        return True
+
+    def _list_processed_names(self, item_names: list[str]) -> set[str]:
+        if len(item_names) <= self.VERIFY_BY_NAME_LIMIT:
+            return set(
+                self._service_provider.get_items_by_name(
+                    self._project, self._to_folder, item_names
+                )
+            )
+        # a single pass over the destination is cheaper than the name lookups
+        item_names = set(item_names)
+        processed = set()
+        for page in self._service_provider.item_service.iter_list(
+            self._project.id, self._to_folder.id, EmptyQuery()
+        ):
+            processed.update(i.name for i in page if i.name in item_names)
+        return processed
+
     def validate_item_names(self):
         if self._item_names:
             provided_items_count = len(self._item_names)
@@ -579,66 +682,44 @@ class CopyMoveItems(BaseReportableUseCase):
                 return self._response
             skipped_items = []
             if self._duplicate_strategy == "skip":
-                existing_items = []
-                for i in range(0, len(items), self._chunk_size):
-                    query = Filter(
-                        "name", items[i : i + self._chunk_size], OperatorEnum.IN
-                    )  # noqa
-                    data = self._service_provider.item_service.list(
-                        self._project.id, self._to_folder.id, query
+                duplications = list(
+                    self._service_provider.get_items_by_name(
+                        self._project, self._to_folder, items
                     )
-                    if not data:
-                        continue
-                    existing_items += data
-                duplications = [item.name for item in existing_items]
+                )
                 items_to_processing = list(set(items) - set(duplications))
                 skipped_items.extend(duplications)
             else:
                 items_to_processing = items
             if items_to_processing:
-                for i in range(0, len(items_to_processing), self._chunk_size):
-                    chunk_to_process = items_to_processing[
-                        i : i + self._chunk_size
-                    ]  # noqa: E203
-                    response = self._service_provider.items.copy_move_multiple(
-                        project=self._project,
-                        from_folder=self._from_folder,
-                        to_folder=self._to_folder,
-                        item_names=chunk_to_process,
-                        include_annotations=self._include_annotations,
-                        duplicate_strategy=self._duplicate_strategy,
-                        operation=self._operation,
-                    )
-                    if not response.ok or not response.data.get("poll_id"):
-                        skipped_items.extend(chunk_to_process)
-                        continue
+                # the moved and replaced items are no longer where they were found
+                self._service_provider.invalidate_item_names(
+                    self._project, self._from_folder
+                )
+                self._service_provider.invalidate_item_names(
+                    self._project, self._to_folder
+                )
+                chunks = [
+                    list(chunk)
+                    for chunk in divide_to_chunks(items_to_processing, self._chunk_size)
+                ]
+                with ThreadPoolExecutor(self.MAX_IN_FLIGHT_CHUNKS) as executor:
+                    futures = {
+                        executor.submit(self._process_chunk, chunk): chunk
+                        for chunk in chunks
+                    }
                     try:
-                        self._service_provider.items.await_copy_move(
-                            project=self._project,
-                            poll_id=response.data["poll_id"],
-                            items_count=len(chunk_to_process),
-                        )
+                        for future in as_completed(futures):
+                            if not future.result():
+                                skipped_items.extend(futures[future])
                     except BackendError as e:
+                        executor.shutdown(cancel_futures=True)
                         self._response.errors = AppException(e)
                         return self._response
-                existing_items = []
-                for i in range(0, len(items_to_processing), self._chunk_size):
-                    data = self._service_provider.item_service.list(
-                        self._project.id,
-                        self._to_folder.id,
-                        Filter(
-                            "name",
-                            items_to_processing[i : i + self._chunk_size],
-                            OperatorEnum.IN,
-                        ),  # noqa
-                    )
-                    existing_items += data
-
-                existing_item_names_set = {item.name for item in existing_items}
                 items_to_processing_names_set = set(items_to_processing)
-                processed_items = existing_item_names_set.intersection(
-                    items_to_processing_names_set
-                )
+                processed_items = self._list_processed_names(
+                    items_to_processing
+                ).intersection(items_to_processing_names_set)
                 skipped_items.extend(
                     list(items_to_processing_names_set - processed_items)
                 )
@@ -681,34 +762,30 @@ class SetAnnotationStatues(BaseReportableUseCase):
                 )
             ]
             return
-        existing_items = []
-        for i in range(0, len(self._item_names), self.CHUNK_SIZE):
-            search_names = self._item_names[i : i + self.CHUNK_SIZE]  # noqa
-            data = self._service_provider.item_service.list(
-                self._project.id,
-                self._folder.id,
-                Filter("name", search_names, OperatorEnum.IN),
-            )
-            existing_items += data
+        existing_items = self._service_provider.get_items_by_name(
+            self._project, self._folder, self._item_names
+        )
         if not existing_items:
             raise AppValidationException(self.ERROR_MESSAGE)
-        if existing_items:
-            self._item_names = list(
-                {i.name for i in existing_items}.intersection(set(self._item_names))
-            )
+        self._item_names = list(existing_items)
 
     def execute(self):
         if self.is_valid():
-            for i in range(0, len(self._item_names), self.CHUNK_SIZE):
-                status_changed = self._service_provider.items.set_statuses(
+            results = run_item_chunks(
+                lambda item_names: self._service_provider.items.set_statuses(
                     project=self._project,
                     folder=self._folder,
-                    item_names=self._item_names[i : i + self.CHUNK_SIZE],  # noqa: E203,
+                    item_names=item_names,
                     annotation_status=self._annotation_status_code,
+                ),
+                self._item_names,
+                self.CHUNK_SIZE,
+            )
+            failed = log_failed_chunks(self.reporter, results)
+            if failed:
+                self._response.errors = AppException(
+                    f"{self.ERROR_MESSAGE} of the items: {format_item_names(failed)}"
                 )
-                if not status_changed.ok:
-                    self._response.errors = AppException(self.ERROR_MESSAGE)
-                    break
         return self._response
 
 
@@ -748,43 +825,42 @@ class SetApprovalStatues(BaseReportableUseCase):
                     f"Dropping duplicates. Found {unique}/{total} unique items."
                 )
             self._item_names = list(_tmp)
-            existing_items = []
-            for i in range(0, len(self._item_names), self.CHUNK_SIZE):
-                search_names = self._item_names[i : i + self.CHUNK_SIZE]  # noqa
-                data = self._service_provider.item_service.list(
-                    self._project.id,
-                    self._folder.id,
-                    Filter("name", search_names, OperatorEnum.IN),
-                )
-                cand_items = data
-                existing_items += cand_items
+            existing_items = self._service_provider.get_items_by_name(
+                self._project, self._folder, self._item_names
+            )
             if not existing_items:
                 raise AppValidationException("No items found.")
-            if existing_items:
-                self._item_names = list(
-                    {i.name for i in existing_items}.intersection(set(self._item_names))
-                )
+            self._item_names = list(existing_items)
 
     def execute(self):
         if self.is_valid():
-            total_items = 0
-            for i in range(0, len(self._item_names), self.CHUNK_SIZE):
-                response = self._service_provider.items.set_approval_statuses(
+            results = run_item_chunks(
+                lambda item_names: self._service_provider.items.set_approval_statuses(
                     project=self._project,
                     folder=self._folder,
-                    item_names=self._item_names[i : i + self.CHUNK_SIZE],  # noqa: E203,
+                    item_names=item_names,
                     approval_status=self._approval_status_code,
-                )
-                if not response.ok:
-                    if response.error == "Unsupported project type.":
-                        self._response.errors = (
-                            f"The function is not supported for"
-                            f" {constants.ProjectType(self._project.type).name} projects."
-                        )
-                    else:
-                        self._response.errors = self.ERROR_MESSAGE
-                    return self._response
-                total_items += len(response.data)
+                ),
+                self._item_names,
+                self.CHUNK_SIZE,
+            )
+            failed = log_failed_chunks(self.reporter, results)
+            if failed:
+                if any(
+                    response.error == "Unsupported project type."
+                    for _, response in results
+                ):
+                    self._response.errors = (
+                        f"The function is not supported for"
+                        f" {constants.ProjectType(self._project.type).name} projects."
+                    )
+                else:
+                    self._response.errors = (
+                        "Failed to change approval status of the items: "
+                        f"{format_item_names(failed)}"
+                    )
+                return self._response
+            total_items = sum(len(response.data) for _, response in results)
             if total_items:
                 logger.info(
                     f"Successfully updated {total_items}/{len(self._item_names)} item(s)"
@@ -825,6 +901,7 @@ class DeleteItemsUseCase(BaseUseCase):
                 )
                 item_ids = [item.id for item in items]
 
+            self._service_provider.invalidate_item_names(self._project, self._folder)
             for i in range(0, len(item_ids), self.CHUNK_SIZE):
                 self._service_provider.items.delete_multiple(
                     project=self._project,
@@ -1,9 +1,25 @@
 import asyncio
+import atexit
+import logging
+import os
+import queue
 import re
 import time
 import typing
+import weakref
+from concurrent.futures import Future
+from threading import Event
+from threading import Lock
+from threading import get_ident
 from threading import Thread
 
+logger = logging.getLogger("sa")
+
+_loop_finalizers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_loop_finalizers_lock = Lock()
+_event_loop_runner: "EventLoopRunner | None" = None
+_event_loop_runner_lock = Lock()
+
 
 def set_last_action(annotation: dict, email: str) -> dict:
     """Set ``metadata.lastAction`` on an annotation JSON in place."""
@@ -46,11 +62,134 @@ class AsyncThread(Thread):
         return self._response
 
 
-def run_async(f):
+def add_loop_finalizer(callback: typing.Callable[[], typing.Awaitable]):
+    """Register a coroutine function to be awaited before the running loop of
+    ``run_async`` is closed (e.g. to release pooled connections bound to it)."""
+    loop = asyncio.get_running_loop()
+    with _loop_finalizers_lock:
+        _loop_finalizers.setdefault(loop, []).append(callback)
+
+
+async def finalize_loop():
+    with _loop_finalizers_lock:
+        callbacks = _loop_finalizers.pop(asyncio.get_running_loop(), [])
+    for callback in callbacks:
+        try:
+            await callback()
+        except Exception as e:
+            logger.debug(f"Failed to finalize event loop resource: {e}")
+
+
+async def _run_and_finalize(coro: typing.Awaitable):
+    try:
+        return await coro
+    finally:
+        await finalize_loop()
+
+
+class EventLoopRunner:
+    """
+    Runs coroutines submitted from synchronous code on a long-lived event loop
+    in a background thread, so the connection pools bound to the loop are
+    reused across calls. The loop finalizers run when the runner is closed.
+    The loop is shared by all the threads using the SDK, so the coroutines must
+    not block it, the blocking calls they make are run with asyncio.to_thread.
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: Thread | None = None
+        self._lock = Lock()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Event loop runner is closed.")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = Thread(
+                    target=self._loop.run_forever, name="sa-event-loop", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and self._thread.ident == get_ident()
+
+    def submit(self, coro: typing.Coroutine) -> Future:
+        try:
+            loop = self._get_loop()
+        except RuntimeError:
+            coro.close()
+            raise
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: typing.Coroutine):
+        future = self.submit(coro)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+
+        async def _shutdown():
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await finalize_loop()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+def get_event_loop_runner() -> EventLoopRunner:
+    """Returns the process-wide event loop runner, starting a new one if needed."""
+    global _event_loop_runner
+    with _event_loop_runner_lock:
+        if _event_loop_runner is None or _event_loop_runner.closed:
+            _event_loop_runner = EventLoopRunner()
+            atexit.register(_event_loop_runner.close)
+        return _event_loop_runner
+
+
+def _reset_event_loop_runner():
+    global _event_loop_runner, _event_loop_runner_lock
+    # the loop thread of the parent process does not exist in the child
+    _event_loop_runner = None
+    _event_loop_runner_lock = Lock()
+
+
+os.register_at_fork(after_in_child=_reset_event_loop_runner)
+
+
+def _run_in_thread(f):
     response = [None]
 
-    def wrapper(func: typing.Callable):
-        response[0] = asyncio.run(func)  # noqa
+    def wrapper(func: typing.Awaitable):
+        response[0] = asyncio.run(_run_and_finalize(func))  # noqa
         return response[0]
 
     thread = AsyncThread(target=wrapper, args=(f,))
@@ -59,6 +198,77 @@ def run_async(f):
     return response[0]
 
 
+def run_async(f):
+    runner = get_event_loop_runner()
+    if runner.in_loop_thread():
+        # blocking the runner's loop on itself would deadlock
+        return _run_in_thread(f)
+    return runner.run(f)
+
+
+class _RaisedInProducer:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+_STOP_ITERATION = object()
+
+
+def iter_async(
+    async_iterator: typing.AsyncIterator, buffer_size: int = 1000
+) -> typing.Iterator:
+    """
+    Iterate an async iterator from synchronous code.
+
+    The async iterator is consumed on its own event loop thread and can run at most
+    ``buffer_size`` items ahead of the caller. Once the buffer is full the producer
+    is suspended until the caller catches up. Closing the returned generator stops
+    the producer.
+    """
+    buffer = queue.Queue(maxsize=buffer_size)
+    stopped = Event()
+
+    async def _put(value):
+        try:
+            buffer.put_nowait(value)
+        except queue.Full:
+            await asyncio.to_thread(buffer.put, value)
+
+    async def _produce():
+        try:
+            async for value in async_iterator:
+                await _put(value)
+                if stopped.is_set():
+                    break
+        except BaseException as e:
+            await _put(_RaisedInProducer(e))
+        finally:
+            if hasattr(async_iterator, "aclose"):
+                await async_iterator.aclose()
+            await _put(_STOP_ITERATION)
+
+    thread = AsyncThread(
+        target=asyncio.run, args=(_run_and_finalize(_produce()),), daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            value = buffer.get()
+            if value is _STOP_ITERATION:
+                break
+            if isinstance(value, _RaisedInProducer):
+                raise value.exc
+            yield value
+    finally:
+        stopped.set()
+        while thread.is_alive():
+            try:
+                buffer.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        thread.join()
+
+
 def parse_version(version_string):
     """Smart version parsing with support for various formats"""
     # Remove 'v' prefix if present
@@ -1,9 +1,8 @@
-import json
 from abc import ABC
 from abc import abstractmethod
-from io import StringIO
 from typing import Any
 
+from lib.core import json
 from lib.core.entities import BaseItemEntity
 from lib.core.entities import FolderEntity
 from lib.core.entities import ProjectEntity
@@ -154,7 +153,7 @@ class MultimodalLargeAnnotationAdapter(BaseMultimodalAnnotationAdapter):
                 project=self._project,
                 folder=self._folder,
                 item_id=self._item.id,
-                data=StringIO(json.dumps(self._annotation)),
+                data=json.dumpb(self._annotation),
                 chunk_size=5 * 1024 * 1024,
                 transform_version="llmJsonV3",
             )
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 import io
 import logging
 import os
 from abc import ABCMeta
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import closing
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 from typing import Literal
@@ -13,6 +18,7 @@ from typing import Literal
 import lib.core as constances
 from lib.core import ApprovalStatus
 from lib.core import usecases
+from lib.core.concurrency import AdaptiveConcurrencyLimit
 from lib.core.conditions import Condition
 from lib.core.conditions import CONDITION_EQ as EQ
 from lib.core.entities import AttachmentEntity
@@ -1311,6 +1317,13 @@ class AnnotationManager(BaseManager):
     def __init__(self, service_provider: ServiceProvider, config: ConfigEntity):
         super().__init__(service_provider)
         self._config = config
+        # shared by the use cases, so the learned limits outlive a single call
+        self._download_concurrency = AdaptiveConcurrencyLimit(
+            config.MAX_COROUTINE_COUNT, config.MAX_ADAPTIVE_COROUTINE_COUNT
+        )
+        self._upload_concurrency = AdaptiveConcurrencyLimit(
+            config.MAX_COROUTINE_COUNT, config.MAX_ADAPTIVE_COROUTINE_COUNT
+        )
 
     def set_item_annotations(
         self,
@@ -1351,6 +1364,27 @@ class AnnotationManager(BaseManager):
             response.raise_for_status()
         return response
 
+    def _get_annotations_use_case(
+        self,
+        project: ProjectEntity,
+        folder: FolderEntity = None,
+        items: list[str] | list[int] = None,
+        verbose=True,
+        transform_version: str = None,
+        since: datetime | str | None = None,
+    ) -> usecases.GetAnnotations:
+        return usecases.GetAnnotations(
+            config=self._config,
+            reporter=Reporter(log_info=verbose, log_warning=verbose),
+            project=project,
+            folder=folder,
+            items=items,
+            service_provider=self.service_provider,
+            transform_version=transform_version,
+            since=since,
+            concurrency_limit=self._download_concurrency,
+        )
+
     def list(
         self,
         project: ProjectEntity,
@@ -1358,8 +1392,35 @@ class AnnotationManager(BaseManager):
         items: list[str] | list[int] = None,
         verbose=True,
         transform_version: str = None,
+        since: datetime | str | None = None,
+    ):
+        return self._get_annotations_use_case(
+            project, folder, items, verbose, transform_version, since
+        ).execute()
+
+    async def list_async(
+        self,
+        project: ProjectEntity,
+        folder: FolderEntity = None,
+        items: list[str] | list[int] = None,
+        verbose=True,
+        transform_version: str = None,
+        since: datetime | str | None = None,
+    ):
+        return await self._get_annotations_use_case(
+            project, folder, items, verbose, transform_version, since
+        ).execute_async()
+
+    def iterate(
+        self,
+        project: ProjectEntity,
+        folder: FolderEntity = None,
+        items: list[str] | list[int] = None,
+        verbose=True,
+        transform_version: str = None,
+        since: datetime | str | None = None,
     ):
-        use_case = usecases.GetAnnotations(
+        use_case = usecases.IterAnnotations(
             config=self._config,
             reporter=Reporter(log_info=verbose, log_warning=verbose),
             project=project,
@@ -1367,6 +1428,8 @@ class AnnotationManager(BaseManager):
             items=items,
             service_provider=self.service_provider,
             transform_version=transform_version,
+            since=since,
+            concurrency_limit=self._download_concurrency,
         )
         return use_case.execute()
 
@@ -1379,6 +1442,8 @@ class AnnotationManager(BaseManager):
         item_names: list[str] | None,
         callback: Callable | None,
         transform_version: str,
+        resume: bool = False,
+        since: datetime | str | None = None,
     ):
         use_case = usecases.DownloadAnnotations(
             config=self._config,
@@ -1391,6 +1456,9 @@ class AnnotationManager(BaseManager):
             service_provider=self.service_provider,
             callback=callback,
             transform_version=transform_version,
+            resume=resume,
+            since=since,
+            concurrency_limit=self._download_concurrency,
         )
         return use_case.execute()
 
@@ -1424,7 +1492,7 @@ class AnnotationManager(BaseManager):
         )
         return use_case.execute()
 
-    def upload_multiple(
+    def _upload_annotations_use_case(
         self,
         project: ProjectEntity,
         folder: FolderEntity,
@@ -1432,6 +1500,8 @@ class AnnotationManager(BaseManager):
         keep_status: bool,
         user: UserEntity,
         output_format: str = None,
+    ) -> (
+        usecases.UploadAnnotationsUseCase | usecases.UploadMultiModalAnnotationsUseCase
     ):
         if project.type == ProjectType.MULTIMODAL and output_format == "multimodal":
             use_case = usecases.UploadMultiModalAnnotationsUseCase(
@@ -1454,8 +1524,39 @@ class AnnotationManager(BaseManager):
                 keep_status=keep_status,
                 user=user,
                 transform_version=None,
+                process_count=self._config.ANNOTATION_UPLOAD_PROCESS_COUNT,
+                concurrency_limit=self._upload_concurrency,
             )
-        return use_case.execute()
+        return use_case
+
+    def upload_multiple(
+        self,
+        project: ProjectEntity,
+        folder: FolderEntity,
+        annotations: list[dict],
+        keep_status: bool,
+        user: UserEntity,
+        output_format: str = None,
+    ):
+        return self._upload_annotations_use_case(
+            project, folder, annotations, keep_status, user, output_format
+        ).execute()
+
+    async def upload_multiple_async(
+        self,
+        project: ProjectEntity,
+        folder: FolderEntity,
+        annotations: list[dict],
+        keep_status: bool,
+        user: UserEntity,
+        output_format: str = None,
+    ):
+        use_case = self._upload_annotations_use_case(
+            project, folder, annotations, keep_status, user, output_format
+        )
+        if isinstance(use_case, usecases.UploadAnnotationsUseCase):
+            return await use_case.execute_async()
+        return await asyncio.to_thread(use_case.execute)
 
     def upload_from_folder(
         self,
@@ -1479,6 +1580,7 @@ class AnnotationManager(BaseManager):
             reporter=Reporter(),
             folder_path=folder_path,
             keep_status=keep_status,
+            concurrency_limit=self._upload_concurrency,
         )
         return use_case.execute()
 
@@ -1534,7 +1636,7 @@ class CustomFieldManager(BaseManager):
         return use_case.execute()
 
     def upload_values(
-        self, project: ProjectEntity, folder: FolderEntity, items: list[dict]
+        self, project: ProjectEntity, folder: FolderEntity, items: Iterable[dict]
     ):
         use_case = usecases.UploadCustomValuesUseCase(
             reporter=Reporter(),
@@ -1546,7 +1648,7 @@ class CustomFieldManager(BaseManager):
         return use_case.execute()
 
     def delete_values(
-        self, project: ProjectEntity, folder: FolderEntity, items: list[dict]
+        self, project: ProjectEntity, folder: FolderEntity, items: Iterable[dict]
     ):
         use_case = usecases.DeleteCustomValuesUseCase(
             reporter=Reporter(),
@@ -1647,10 +1749,17 @@ class BaseController(metaclass=ABCMeta):
         self._reporter = None
 
         http_client = HttpClient(
-            api_url=config.API_URL, token=config.API_TOKEN, verify_ssl=config.VERIFY_SSL
+            api_url=config.API_URL,
+            token=config.API_TOKEN,
+            verify_ssl=config.VERIFY_SSL,
+            pool_size=config.HTTP_POOL_SIZE,
+            pool_size_per_host=config.HTTP_POOL_SIZE_PER_HOST,
+            keepalive_timeout=config.HTTP_KEEPALIVE_TIMEOUT,
         )
 
-        self.service_provider = ServiceProvider(http_client)
+        self.service_provider = ServiceProvider(
+            http_client, item_name_cache_ttl=config.ITEM_NAME_CACHE_TTL
+        )
         self._user = self.get_current_user()
         self._team = self.get_team().data
         self.annotation_classes = AnnotationClassManager(self.service_provider)
@@ -2081,14 +2190,15 @@ class Controller(BaseController):
         )
         return use_case.execute()
 
-    def query_entities(
+    def iter_query_entities(
         self,
         project: ProjectEntity,
         folder: FolderEntity,
         query: str = None,
         subset: str = None,
-    ) -> list[BaseItemEntity]:
-
+        prefetch: int = 0,
+    ) -> Iterator[list[BaseItemEntity]]:
+        """Lazily yields the queried items page by page."""
         use_case = usecases.QueryEntitiesUseCase(
             reporter=self.get_default_reporter(),
             project=project,
@@ -2096,14 +2206,29 @@ class Controller(BaseController):
             query=query,
             subset=subset,
             service_provider=self.service_provider,
+            prefetch=prefetch,
         )
         response = use_case.execute()
         if response.errors:
             raise AppException(response.errors)
-        items = response.data
-        return ItemManager.process_response(
-            self.service_provider, items, project, folder, map_fields=False
-        )
+        with closing(response.data) as pages:
+            for items in pages:
+                yield ItemManager.process_response(
+                    self.service_provider, items, project, folder, map_fields=False
+                )
+
+    def query_entities(
+        self,
+        project: ProjectEntity,
+        folder: FolderEntity,
+        query: str = None,
+        subset: str = None,
+    ) -> list[BaseItemEntity]:
+        return [
+            item
+            for items in self.iter_query_entities(project, folder, query, subset)
+            for item in items
+        ]
 
     def query_items_count(
         self,
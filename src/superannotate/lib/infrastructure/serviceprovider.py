@@ -8,6 +8,7 @@ from lib.core import entities
 from lib.core.conditions import Condition
 from lib.core.enums import ApprovalStatus
 from lib.core.enums import CustomFieldEntityEnum
+from lib.core.service_types import ServiceResponse
 from lib.core.service_types import TeamResponse
 from lib.core.service_types import UploadAnnotationAuthDataResponse
 from lib.core.service_types import UserLimitsResponse
@@ -26,6 +27,8 @@ from lib.infrastructure.services.telemetry_scoring import TelemetryScoringServic
 from lib.infrastructure.services.work_management import WorkManagementService
 from lib.infrastructure.utils import CachedWorkManagementRepository
 from lib.infrastructure.utils import EntityContext
+from lib.infrastructure.utils import ItemNameIndex
+from lib.infrastructure.utils import SaqulQueryCache
 
 
 class ServiceProvider(BaseServiceProvider):
@@ -44,7 +47,7 @@ class ServiceProvider(BaseServiceProvider):
     URL_REMOVE_USERS_FROM_TEAM = "team/{team_id}/members/bulk"
     URL_REMOVE_USERS_FROM_PROJECT = "project/{project_id}/share/bulk"
 
-    def __init__(self, client: HttpClient):
+    def __init__(self, client: HttpClient, item_name_cache_ttl: float = 0):
         self.enum_mapping = {"approval_status": ApprovalStatus.get_mapping()}
 
         self.client = client
@@ -73,6 +76,8 @@ class ServiceProvider(BaseServiceProvider):
         self._cached_work_management_repository = CachedWorkManagementRepository(
             5, self.work_management
         )
+        self._item_name_index = ItemNameIndex(self.item_service, item_name_cache_ttl)
+        self._saqul_query_cache = SaqulQueryCache(self.explore)
 
     def get_custom_fields_templates(
         self,
@@ -166,6 +171,29 @@ class ServiceProvider(BaseServiceProvider):
             self.client.team_id
         )
 
+    def get_items_by_name(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        names: list[str],
+    ) -> dict[str, entities.BaseItemEntity]:
+        return self._item_name_index.resolve(project.id, folder.id, names)
+
+    def invalidate_item_names(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity | None = None,
+    ):
+        self._item_name_index.invalidate(project.id, folder.id if folder else None)
+
+    def validate_saqul_query(
+        self, project: entities.ProjectEntity, query: str
+    ) -> ServiceResponse:
+        return self._saqul_query_cache.validate(project, query)
+
+    def invalidate_saqul_queries(self, project: entities.ProjectEntity):
+        self._saqul_query_cache.invalidate(project.id)
+
     @staticmethod
     def _get_work_management_url(client: HttpClient):
         if client.api_url != constants.BACKEND_URL:
@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import copy
 import io
-import json
+import itertools
 import logging
+from collections.abc import AsyncIterator
 from collections.abc import Callable
 from pathlib import Path
 from urllib.parse import urljoin
@@ -12,15 +13,22 @@ from urllib.parse import urljoin
 import aiohttp
 import lib.core as constants
 from lib.core import entities
+from lib.core import json
+from lib.core.concurrency import iter_poll_delays
 from lib.core.exceptions import AppException
+from lib.core.exceptions import BackendError
 from lib.core.reporter import Reporter
 from lib.core.service_types import UploadAnnotations
 from lib.core.service_types import UploadAnnotationsResponse
 from lib.core.serviceproviders import BaseAnnotationService
 from lib.infrastructure.services.http_client import AIOHttpSession
+from lib.infrastructure.services.http_client import HttpClient
 from lib.infrastructure.stream_data_handler import StreamedAnnotations
 from lib.infrastructure.utils import annotation_is_valid
 from lib.infrastructure.utils import divide_to_chunks
+from lib.infrastructure.utils import iter_utf8_parts
+from lib.infrastructure.utils import store_annotation
+from lib.infrastructure.utils import store_annotation_stream
 from pydantic import TypeAdapter
 
 logger = logging.getLogger("sa")
@@ -28,6 +36,10 @@ logger = logging.getLogger("sa")
 
 class AnnotationService(BaseAnnotationService):
     ASSETS_PROVIDER_VERSION = "v4"
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    UPLOAD_PART_CONCURRENCY = 4
+    CLASSIFY_CONCURRENCY = 8
+    SYNC_TIMEOUT = 30 * 60
 
     URL_GET_ANNOTATIONS = "items/annotations/download"
     URL_UPLOAD_ANNOTATIONS = "items/annotations/upload"
@@ -80,7 +92,8 @@ class AnnotationService(BaseAnnotationService):
             self.URL_START_FILE_SYNC.format(item_id=item_id),
         )
         async with AIOHttpSession(
-            connector=aiohttp.TCPConnector(ssl=False),
+            connector=self.client.get_aio_connector(),
+            connector_owner=False,
             headers=self.client.default_headers,
             raise_for_status=True,
         ) as session:
@@ -88,17 +101,19 @@ class AnnotationService(BaseAnnotationService):
             sync_params.pop("current_source")
             sync_params.pop("desired_source")
 
-            synced = False
             sync_status_url = urljoin(
                 self.get_assets_provider_url(),
                 self.URL_START_FILE_SYNC_STATUS.format(item_id=item_id),
             )
-            while synced != "SUCCESS":
+            for delay in iter_poll_delays(timeout=self.SYNC_TIMEOUT):
                 synced = await session.get(sync_status_url, params=sync_params)
-                synced = await synced.json()
-                synced = synced["status"]
-                await asyncio.sleep(5)
-        return synced
+                synced = (await synced.json())["status"]
+                if synced == "SUCCESS":
+                    return synced
+                await asyncio.sleep(delay)
+            raise AppException(
+                f"The annotation of the item {item_id} wasn't synced in {self.SYNC_TIMEOUT}s."
+            )
 
     async def get_big_annotation(
         self,
@@ -127,12 +142,13 @@ class AnnotationService(BaseAnnotationService):
             transform_version=transform_version,
         )
         async with AIOHttpSession(
-            connector=aiohttp.TCPConnector(ssl=False),
+            connector=self.client.get_aio_connector(),
+            connector_owner=False,
             headers=self.client.default_headers,
             raise_for_status=True,
         ) as session:
             start_response = await session.request("post", url, params=query_params)
-            large_annotation = await start_response.json()
+            large_annotation = await start_response.json(loads=json.loads)
         if reporter:
             reporter.update_progress()
         return large_annotation
@@ -159,6 +175,7 @@ class AnnotationService(BaseAnnotationService):
             reporter,
             map_function=lambda x: {"image_ids": x},
             callback=callback,
+            connector=self.client.get_aio_connector(),
         )
         return await handler.list_annotations(
             method="post",
@@ -167,6 +184,37 @@ class AnnotationService(BaseAnnotationService):
             params=query_params,
         )
 
+    async def iter_small_annotations(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        item_ids: list[int],
+        reporter: Reporter,
+        callback: Callable = None,
+        transform_version: str = None,
+    ) -> AsyncIterator[dict]:
+        query_params = {
+            "team_id": project.team_id,
+            "project_id": project.id,
+        }
+        if transform_version is not None:
+            query_params["transform_version"] = transform_version
+
+        handler = StreamedAnnotations(
+            self.client.default_headers,
+            reporter,
+            map_function=lambda x: {"image_ids": x},
+            callback=callback,
+            connector=self.client.get_aio_connector(),
+        )
+        async for annotation in handler.iter_annotations(
+            method="post",
+            url=urljoin(self.get_assets_provider_url(), self.URL_GET_ANNOTATIONS),
+            data=item_ids,
+            params=query_params,
+        ):
+            yield annotation
+
     def get_upload_chunks(
         self,
         project: entities.ProjectEntity,
@@ -195,6 +243,66 @@ class AnnotationService(BaseAnnotationService):
             large.extend(response.data.get("large", []))
         return {"small": small, "large": large}
 
+    async def iter_upload_chunks(
+        self,
+        project: entities.ProjectEntity,
+        item_ids: list[int],
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[dict[str, list]]:
+        """
+        Classifies the item sizes in chunk_size batches, up to CLASSIFY_CONCURRENCY
+        batches at once, and yields the small and large groups of each batch
+        as soon as it is classified. The order of the batches is not kept.
+        """
+        url = urljoin(self.get_assets_provider_url(), self.URL_CLASSIFY_ITEM_SIZE)
+        chunks = iter(divide_to_chunks(item_ids, chunk_size))
+        async with AIOHttpSession(
+            connector=self.client.get_aio_connector(),
+            connector_owner=False,
+            headers=self.client.default_headers,
+        ) as session:
+
+            async def _classify(chunk: list[int]) -> dict:
+                response = await session.request(
+                    "post",
+                    url,
+                    params={"team_id": project.team_id, "limit": len(chunk)},
+                    json={"project_id": project.id, "item_ids": chunk},
+                )
+                content = await response.read()
+                if not response.ok:
+                    try:
+                        error = HttpClient.get_error_message(response.status, content)
+                    except ValueError:
+                        error = content.decode("utf-8", errors="replace")
+                    raise AppException(error)
+                return json.loads(content)
+
+            pending = set()
+            try:
+                while True:
+                    for chunk in itertools.islice(
+                        chunks, self.CLASSIFY_CONCURRENCY - len(pending)
+                    ):
+                        pending.add(asyncio.create_task(_classify(chunk)))
+                    if not pending:
+                        break
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        data = task.result()
+                        yield {
+                            "small": [
+                                i["data"] for i in data.get("small", {}).values()
+                            ],
+                            "large": data.get("large", []),
+                        }
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
     async def download_big_annotation(
         self,
         project: entities.ProjectEntity,
@@ -202,6 +310,7 @@ class AnnotationService(BaseAnnotationService):
         item: entities.BaseItemEntity,
         callback: Callable = None,
         transform_version: str = None,
+        store_callback: Callable = None,
     ):
         item_id = item.id
         item_name = item.name
@@ -225,27 +334,41 @@ class AnnotationService(BaseAnnotationService):
         )
 
         async with AIOHttpSession(
-            connector=aiohttp.TCPConnector(ssl=False),
+            connector=self.client.get_aio_connector(),
+            connector_owner=False,
             headers=self.client.default_headers,
             raise_for_status=True,
         ) as session:
             start_response = await session.request("post", url, params=query_params)
-            res = await start_response.json()
-            if start_response.status > 299 or not annotation_is_valid(res):
-                logger.debug(
-                    f"Failed to download large annotation; item_id [{item_id}];"
-                    f" response: {res}; http_status: {start_response.status}"
-                )
-                raise AppException(
-                    f"Failed to download large annotation, ID: {item_id}"
-                )
             Path(download_path).mkdir(exist_ok=True, parents=True)
-
             dest_path = Path(download_path) / (item_name + ".json")
-            with open(dest_path, "w") as fp:
-                if callback:
-                    res = callback(res)
-                json.dump(res, fp)
+            if callback:
+                res = await start_response.json(loads=json.loads)
+                if not annotation_is_valid(res):
+                    logger.debug(
+                        f"Failed to download large annotation; item_id [{item_id}];"
+                        f" response: {res}; http_status: {start_response.status}"
+                    )
+                    raise AppException(
+                        f"Failed to download large annotation, ID: {item_id}"
+                    )
+                stored = store_annotation(dest_path, callback(res))
+            else:
+                # written as received without decoding
+                stored = await store_annotation_stream(
+                    dest_path,
+                    start_response.content.iter_chunked(self.DOWNLOAD_CHUNK_SIZE),
+                )
+                if not stored:
+                    logger.debug(
+                        f"Failed to download large annotation; item_id [{item_id}];"
+                        f" invalid response; http_status: {start_response.status}"
+                    )
+                    raise AppException(
+                        f"Failed to download large annotation, ID: {item_id}"
+                    )
+            if store_callback:
+                store_callback(item_id, dest_path, *stored)
 
     async def download_small_annotations(
         self,
@@ -256,6 +379,7 @@ class AnnotationService(BaseAnnotationService):
         item_ids: list[int],
         callback: Callable = None,
         transform_version: str = None,
+        store_callback: Callable = None,
     ):
         query_params = {
             "team_id": project.team_id,
@@ -269,6 +393,7 @@ class AnnotationService(BaseAnnotationService):
             reporter=reporter,
             map_function=lambda x: {"image_ids": x},
             callback=callback,
+            connector=self.client.get_aio_connector(),
         )
 
         return await handler.download_annotations(
@@ -277,13 +402,14 @@ class AnnotationService(BaseAnnotationService):
             data=item_ids,
             params=query_params,
             download_path=download_path,
+            store_callback=store_callback,
         )
 
     async def upload_small_annotations(
         self,
         project: entities.ProjectEntity,
         folder: entities.FolderEntity,
-        items_name_data_map: dict[str, dict],
+        items_name_data_map: dict[str, dict | bytes],
         transform_version: str = None,
     ) -> UploadAnnotationsResponse:
         params = [
@@ -299,16 +425,19 @@ class AnnotationService(BaseAnnotationService):
         del headers["Content-Type"]
         async with AIOHttpSession(
             headers=headers,
-            connector=aiohttp.TCPConnector(ssl=False),
+            connector=self.client.get_aio_connector(),
+            connector_owner=False,
         ) as session:
             form_data = aiohttp.FormData(
                 quote_fields=False,
             )
             tmp = {}
             for name, data in items_name_data_map.items():
-                tmp[name] = io.StringIO()
-                json.dump({"data": data}, tmp[name], allow_nan=False)
-                tmp[name].seek(0)
+                if isinstance(data, bytes):
+                    # already encoded annotation JSON
+                    tmp[name] = io.BytesIO(b'{"data": ' + data + b"}")
+                else:
+                    tmp[name] = io.BytesIO(json.dumpb({"data": data}, allow_nan=False))
 
             for key, data in tmp.items():
                 form_data.add_field(
@@ -323,7 +452,7 @@ class AnnotationService(BaseAnnotationService):
             if not _response.ok:
                 logger.debug(f"Status code {str(_response.status)}")
                 logger.debug(await _response.text())
-                raise AppException("Can't upload annotations.")
+                raise BackendError("Can't upload annotations.", status=_response.status)
             data_json = await _response.json()
             response = UploadAnnotationsResponse()
             response.status = _response.status
@@ -334,26 +463,42 @@ class AnnotationService(BaseAnnotationService):
             )
             return response
 
-    async def upload_big_annotation(
+    @staticmethod
+    def _get_big_annotation_params(
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        transform_version: str = None,
+    ) -> dict:
+        params = {
+            "team_id": project.team_id,
+            "project_id": project.id,
+            "folder_id": folder.id,
+        }
+        if transform_version:
+            params["current_transform_version"] = transform_version
+        return params
+
+    async def send_big_annotation(
         self,
         project: entities.ProjectEntity,
         folder: entities.FolderEntity,
         item_id: int,
-        data: io.StringIO,
+        data: bytes,
         chunk_size: int,
         transform_version: str = None,
-    ) -> bool:
+    ) -> str | None:
+        """
+        Sends the encoded annotation JSON in parts of at most chunk_size bytes,
+        up to UPLOAD_PART_CONCURRENCY parts at once, and starts its server-side sync.
+        The parts are views of data, each of them is encoded only when it's sent.
+        Returns the upload id to await the sync with, None if the annotation is empty.
+        """
         async with AIOHttpSession(
-            connector=aiohttp.TCPConnector(ssl=False),
+            connector=self.client.get_aio_connector(),
+            connector_owner=False,
             headers=self.client.default_headers,
         ) as session:
-            params = {
-                "team_id": project.team_id,
-                "project_id": project.id,
-                "folder_id": folder.id,
-            }
-            if transform_version:
-                params["current_transform_version"] = transform_version
+            params = self._get_big_annotation_params(project, folder, transform_version)
             url = urljoin(
                 self.get_assets_provider_url("v3.01"),
                 self.URL_START_FILE_UPLOAD_PROCESS.format(item_id=item_id),
@@ -365,31 +510,41 @@ class AnnotationService(BaseAnnotationService):
             params["path"] = process_info["path"]
             headers = copy.copy(self.client.default_headers)
             headers["upload_id"] = process_info["upload_id"]
-            chunk_id = 1
-            data_sent = False
-            while True:
-                chunk = data.read(chunk_size)
-                params["chunk_id"] = chunk_id
-                if chunk:
-                    data_sent = True
+            part_url = urljoin(
+                self.get_assets_provider_url(),
+                self.URL_START_FILE_SEND_PART.format(item_id=item_id),
+            )
+            semaphore = asyncio.Semaphore(self.UPLOAD_PART_CONCURRENCY)
+
+            async def _send_part(chunk_id: int, view: memoryview, start: int, end: int):
+                async with semaphore:
+                    with view[start:end] as part:
+                        body = json.dumpb({"data_chunk": str(part, "utf-8")})
                     response = await session.request(
                         "post",
-                        urljoin(
-                            self.get_assets_provider_url(),
-                            self.URL_START_FILE_SEND_PART.format(item_id=item_id),
-                        ),
-                        params=params,
+                        part_url,
+                        params={**params, "chunk_id": chunk_id},
                         headers=headers,
-                        data=json.dumps({"data_chunk": chunk}, allow_nan=False),
+                        data=body,
                     )
                     if not response.ok:
                         raise AppException(str(await response.text()))
-                    chunk_id += 1
-                if not chunk and not data_sent:
-                    return False
-                if len(chunk) < chunk_size:
-                    break
-            del params["chunk_id"]
+
+            with memoryview(data) as buffer:
+                if not buffer:
+                    return None
+                tasks = [
+                    asyncio.create_task(_send_part(chunk_id, buffer, start, end))
+                    for chunk_id, (start, end) in enumerate(
+                        iter_utf8_parts(buffer, chunk_size), start=1
+                    )
+                ]
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    # the parts mustn't be read after the buffer is closed
+                    for task in tasks:
+                        task.cancel()
             response = await session.request(
                 "post",
                 urljoin(
@@ -413,26 +568,66 @@ class AnnotationService(BaseAnnotationService):
             )
             if not response.ok:
                 raise AppException(str(await response.text()))
-            while True:
+            return process_info["upload_id"]
+
+    async def wait_big_annotation_sync(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        item_id: int,
+        upload_id: str,
+        transform_version: str = None,
+    ) -> bool:
+        """
+        Polls the sync status of the sent annotation until it succeeds or fails,
+        raises AppException if it doesn't finish in SYNC_TIMEOUT seconds.
+        """
+        params = self._get_big_annotation_params(project, folder, transform_version)
+        headers = copy.copy(self.client.default_headers)
+        headers["upload_id"] = upload_id
+        url = urljoin(
+            self.get_assets_provider_url(),
+            self.URL_START_FILE_SYNC_STATUS.format(item_id=item_id),
+        )
+        async with AIOHttpSession(
+            connector=self.client.get_aio_connector(),
+            connector_owner=False,
+            headers=self.client.default_headers,
+        ) as session:
+            for delay in iter_poll_delays(timeout=self.SYNC_TIMEOUT):
                 response = await session.request(
-                    "get",
-                    urljoin(
-                        self.get_assets_provider_url(),
-                        self.URL_START_FILE_SYNC_STATUS.format(item_id=item_id),
-                    ),
-                    params=params,
-                    headers=headers,
+                    "get", url, params=params, headers=headers
                 )
-                if response.ok:
-                    data = await response.json()
-                    status = data.get("status")
-                    if status == "SUCCESS":
-                        return True
-                    if status.startswith("FAILED"):
-                        return False
-                    await asyncio.sleep(15)
-                else:
+                if not response.ok:
                     raise AppException(str(await response.text()))
+                status = (await response.json()).get("status")
+                if status == "SUCCESS":
+                    return True
+                if status and status.startswith("FAILED"):
+                    return False
+                await asyncio.sleep(delay)
+            raise AppException(
+                f"The upload {upload_id} of the annotation of the item {item_id} "
+                f"wasn't synced in {self.SYNC_TIMEOUT}s."
+            )
+
+    async def upload_big_annotation(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity,
+        item_id: int,
+        data: bytes,
+        chunk_size: int,
+        transform_version: str = None,
+    ) -> bool:
+        upload_id = await self.send_big_annotation(
+            project, folder, item_id, data, chunk_size, transform_version
+        )
+        if upload_id is None:
+            return False
+        return await self.wait_big_annotation_sync(
+            project, folder, item_id, upload_id, transform_version
+        )
 
     def delete(
         self,
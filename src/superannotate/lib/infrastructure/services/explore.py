@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 from collections import ChainMap
+from collections.abc import Iterator
+from contextlib import closing
 from urllib.parse import urljoin
 
 import lib.core as constants
 from lib.core import entities
 from lib.core.conditions import Condition
+from lib.core.exceptions import AppException
 from lib.core.service_types import ServiceResponse
 from lib.core.service_types import SubsetListResponse
 from lib.core.service_types import UploadCustomFieldValuesResponse
 from lib.core.serviceproviders import BaseExploreService
-from superannotate import AppException
 
 
 class ExploreService(BaseExploreService):
@@ -193,6 +195,59 @@ class ExploreService(BaseExploreService):
 
         return ServiceResponse(status=200, res_data=items)
 
+    def iter_saqul_query(
+        self,
+        project: entities.ProjectEntity,
+        folder: entities.FolderEntity = None,
+        query: str = None,
+        subset_id: int = None,
+        prefetch: int = 0,
+    ) -> Iterator[list[dict]]:
+        """
+        Lazily yields the queried items page by page. With prefetch the next
+        pages are requested in the background while the current one is consumed,
+        once the first page is full.
+        """
+        params = {"project_id": project.id, "includeFolderNames": True}
+        if folder:
+            params["folder_id"] = folder.id
+        if subset_id:
+            params["subset_id"] = subset_id
+        data = {"query": query} if query else {}
+        url = urljoin(self.explore_service_url, self.URL_SAQUL_QUERY)
+
+        def fetch(image_index: int) -> ServiceResponse:
+            return self.client.request(
+                url, "post", params=params, data={**data, "image_index": image_index}
+            )
+
+        def get_page(response: ServiceResponse) -> list[dict]:
+            if not response.ok:
+                raise AppException(response.error)
+            return response.data or []
+
+        # the small results fit into the first page, so nothing is prefetched for them
+        page = get_page(fetch(0))
+        if page:
+            yield page
+        if len(page) < self.SAQUL_CHUNK_SIZE:
+            return
+        offsets = range(
+            self.SAQUL_CHUNK_SIZE, self.MAX_ITEMS_COUNT, self.SAQUL_CHUNK_SIZE
+        )
+        if prefetch:
+            responses = self.client.prefetch_pages(fetch, offsets, prefetch)
+        else:
+            responses = (fetch(offset) for offset in offsets)
+        # closing the pages cancels the prefetched requests that haven't started
+        with closing(responses):
+            for response in responses:
+                page = get_page(response)
+                if page:
+                    yield page
+                if len(page) < self.SAQUL_CHUNK_SIZE:
+                    return
+
     def query_item_count(
         self,
         project: entities.ProjectEntity,
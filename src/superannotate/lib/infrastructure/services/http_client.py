@@ -3,21 +3,28 @@ from __future__ import annotations
 import asyncio
 import base64
 import io
-import json
 import logging
 import os
 import platform
 import threading
 import time
 import urllib.parse
+import weakref
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from contextlib import contextmanager
-from enum import Enum
 from functools import lru_cache
+from itertools import islice
 from typing import Any
 from typing import Literal
 
 import aiohttp
 import requests
+from lib.core import json
+from lib.core.concurrency import RateLimiter
 from lib.core.exceptions import AppException
 from lib.core.jsx_conditions import EmptyQuery
 from lib.core.jsx_conditions import Limit
@@ -25,36 +32,74 @@ from lib.core.jsx_conditions import Offset
 from lib.core.jsx_conditions import Query
 from lib.core.service_types import ServiceResponse
 from lib.core.serviceproviders import BaseClient
-from pydantic import BaseModel
+from lib.core.utils import add_loop_finalizer
 from pydantic import TypeAdapter
 from requests.adapters import HTTPAdapter
 from requests.adapters import Retry
 
 logger = logging.getLogger("sa")
 
-
-class PydanticEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, BaseModel):
-            return obj.model_dump(exclude_none=True, mode="json")
-        if isinstance(obj, Enum):
-            return obj.value
-        return json.JSONEncoder.default(self, obj)
+# shared by all clients of the process, so concurrent jobs don't cause retry storms
+RATE_LIMITER = RateLimiter(
+    families={"annotations": r"/annotations", "search": r"/search$|/count$|/parse/"},
+    limits={
+        "annotations": (100.0, 64),
+        "search": (20.0, 8),
+        RateLimiter.DEFAULT_FAMILY: (50.0, 32),
+    },
+)
 
 
 class HttpClient(BaseClient):
     AUTH_TYPE = "sdk"
+    POOL_SIZE = 100
+    POOL_SIZE_PER_HOST = 0
+    KEEPALIVE_TIMEOUT = 30
+    PAGINATION_WORKERS = 4
 
-    def __init__(self, api_url: str, token: str, verify_ssl: bool = True):
+    def __init__(
+        self,
+        api_url: str,
+        token: str,
+        verify_ssl: bool = True,
+        pool_size: int = POOL_SIZE,
+        pool_size_per_host: int = POOL_SIZE_PER_HOST,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+    ):
         super().__init__(api_url, token)
         self._verify_ssl = verify_ssl
         self._version = os.environ.get("sa_version")
         self._env = os.environ.get("SA_ENV")
+        self._pool_size = pool_size
+        self._pool_size_per_host = pool_size_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._aio_connectors: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._aio_connectors_lock = threading.Lock()
+        self._pagination_executor = None
 
     @property
     def verify_ssl(self):
         return self._verify_ssl
 
+    def get_aio_connector(self) -> aiohttp.TCPConnector:
+        """
+        Returns the connection pool bound to the running event loop.
+        Sessions created on top of it must pass ``connector_owner=False``.
+        """
+        loop = asyncio.get_running_loop()
+        with self._aio_connectors_lock:
+            connector = self._aio_connectors.get(loop)
+            if connector is None or connector.closed:
+                connector = aiohttp.TCPConnector(
+                    ssl=False,
+                    limit=self._pool_size,
+                    limit_per_host=self._pool_size_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                )
+                self._aio_connectors[loop] = connector
+                add_loop_finalizer(connector.close)
+        return connector
+
     @lru_cache(maxsize=32)
     def _get_session(self, thread_id, ttl=None):  # noqa
         del ttl
@@ -109,8 +154,8 @@ class HttpClient(BaseClient):
         return safe_api
 
     def _request(self, url, method, session, retried=0, **kwargs):
-
-        with self.safe_api():
+        family = RATE_LIMITER.get_family(url)
+        with self.safe_api(), RATE_LIMITER.limit(family):
             req = requests.Request(
                 method=method,
                 url=url,
@@ -119,7 +164,10 @@ class HttpClient(BaseClient):
             prepared = session.prepare_request(req)
             response = session.send(request=prepared, verify=self._verify_ssl)
 
-        if response.status_code == 404 and retried < 3:
+        throttled = RATE_LIMITER.handle_response(
+            family, response.status_code, response.headers
+        )
+        if (response.status_code == 404 or throttled) and retried < 3:
             time.sleep(retried * 0.1)
             return self._request(
                 url, method=method, session=session, retried=retried + 1, **kwargs
@@ -150,7 +198,7 @@ class HttpClient(BaseClient):
         _url = self._get_url(url)
         kwargs = {"params": {"team_id": self.team_id}}
         if data:
-            kwargs["data"] = json.dumps(data, cls=PydanticEncoder)
+            kwargs["data"] = json.dumpb(data)
         if params:
             kwargs["params"].update(params)
         session = self.get_session()
@@ -162,55 +210,101 @@ class HttpClient(BaseClient):
             session.headers.update(self.default_headers)
         return self.serialize_response(response, content_type, dispatcher)
 
-    def paginate(
+    def _get_pagination_executor(self) -> ThreadPoolExecutor:
+        with self._aio_connectors_lock:
+            if self._pagination_executor is None:
+                self._pagination_executor = ThreadPoolExecutor(
+                    max_workers=self.PAGINATION_WORKERS,
+                    thread_name_prefix="sa-paginate",
+                )
+        return self._pagination_executor
+
+    def prefetch_pages(
+        self,
+        fetch: Callable[[int], ServiceResponse],
+        offsets: range,
+        max_in_flight: int | None = None,
+    ) -> Iterator[ServiceResponse]:
+        """
+        Fetches the given offsets concurrently keeping at most max_in_flight
+        (defaults to PAGINATION_WORKERS) requests in flight, yields the responses
+        in the order of the offsets. The requests not yet started are cancelled
+        when the consumer stops early.
+        """
+        executor = self._get_pagination_executor()
+        offsets = iter(offsets)
+        futures = deque(
+            executor.submit(fetch, offset)
+            for offset in islice(offsets, max_in_flight or self.PAGINATION_WORKERS)
+        )
+        try:
+            while futures:
+                response = futures.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    futures.append(executor.submit(fetch, next_offset))
+                yield response
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _iter_pages(
+        self, fetch: Callable[[int], ServiceResponse], chunk_size: int
+    ) -> Iterator[ServiceResponse]:
+        """
+        Walks the pages of a paginated endpoint. Once the total count is known
+        the remaining offset windows are fetched concurrently.
+        """
+        offset = 0
+        response = fetch(offset)
+        while True:
+            yield response
+            if not response.ok or not response.data:
+                return
+            data_len = len(response.data)
+            offset += data_len
+            if data_len < chunk_size or response.total_count - offset <= 0:
+                return
+            with closing(
+                self.prefetch_pages(
+                    fetch, range(offset, response.total_count, chunk_size)
+                )
+            ) as responses:
+                for response in responses:
+                    yield response
+                    if not response.ok or len(response.data or []) < chunk_size:
+                        return
+                    offset += chunk_size
+            # the total count could grow while listing
+            if response.total_count - offset <= 0:
+                return
+            response = fetch(offset)
+
+    def iter_paginate(
         self,
         url: str,
-        item_type: Any = None,
         chunk_size: int = 2000,
         query_params: dict[str, Any] = None,
         headers: dict = None,
-    ) -> ServiceResponse:
-        offset = 0
-        total = []
+    ) -> Iterator[ServiceResponse]:
+        """
+        Lazily yields the responses of the pages, the caller is responsible
+        for checking the status of each page.
+        """
         splitter = "&" if "?" in url else "?"
 
-        while True:
-            _url = f"{url}{splitter}offset={offset}"
-            _response = self.request(
-                _url,
+        def fetch(offset: int) -> ServiceResponse:
+            return self.request(
+                f"{url}{splitter}offset={offset}",
                 method="get",
                 params=query_params,
                 dispatcher="data",
                 headers=headers,
             )
-            if _response.ok:
-                if _response.data:
-                    total.extend(_response.data)
-                else:
-                    break
-                data_len = len(_response.data)
-                offset += data_len
-                if data_len < chunk_size or _response.total_count - offset < 0:
-                    break
-            else:
-                break
 
-        if item_type:
-            response = ServiceResponse(
-                status=_response.status,
-                res_data=TypeAdapter(list[item_type]).validate_python(total),
-            )
-        else:
-            response = ServiceResponse(
-                status=_response.status,
-                res_data=total,
-            )
-        if not _response.ok:
-            response.set_error(_response.error)
-            response.status = _response.status
-        return response
+        return self._iter_pages(fetch, chunk_size)
 
-    def jsx_paginate(
+    def iter_jsx_paginate(
         self,
         url: str,
         method: str = Literal["get", "post"],
@@ -218,16 +312,19 @@ class HttpClient(BaseClient):
         query_params: dict = None,
         headers: dict = None,
         chunk_size: int = 100,
-        item_type: Any = None,
-    ) -> ServiceResponse:
-        offset = 0
-        total = []
+    ) -> Iterator[ServiceResponse]:
+        """
+        Lazily yields the responses of the pages, the caller is responsible
+        for checking the status of each page.
+        """
+        if body_query is None:
+            body_query = EmptyQuery()
 
-        while True:
-            if body_query is None:
-                body_query = EmptyQuery()
-            paginated_query = body_query & Limit(chunk_size) & Offset(offset)
-            _response = self.request(
+        def fetch(offset: int) -> ServiceResponse:
+            paginated_query = (
+                EmptyQuery() & body_query & Limit(chunk_size) & Offset(offset)
+            )
+            return self.request(
                 url=url,
                 method=method,
                 data=paginated_query.body_builder(),
@@ -235,17 +332,17 @@ class HttpClient(BaseClient):
                 headers=headers,
                 dispatcher="data",
             )
-            if _response.ok:
-                if _response.data:
-                    total.extend(_response.data)
-                else:
-                    break
-                data_len = len(_response.data)
-                offset += data_len
-                if data_len < chunk_size or _response.total_count - offset < 0:
-                    break
-            else:
-                break
+
+        return self._iter_pages(fetch, chunk_size)
+
+    @staticmethod
+    def _collect_pages(
+        pages: Iterator[ServiceResponse], item_type: Any = None
+    ) -> ServiceResponse:
+        total = []
+        for _response in pages:
+            if _response.ok and _response.data:
+                total.extend(_response.data)
 
         if item_type:
             response = ServiceResponse(
@@ -262,6 +359,63 @@ class HttpClient(BaseClient):
             response.status = _response.status
         return response
 
+    def paginate(
+        self,
+        url: str,
+        item_type: Any = None,
+        chunk_size: int = 2000,
+        query_params: dict[str, Any] = None,
+        headers: dict = None,
+    ) -> ServiceResponse:
+        return self._collect_pages(
+            self.iter_paginate(
+                url,
+                chunk_size=chunk_size,
+                query_params=query_params,
+                headers=headers,
+            ),
+            item_type,
+        )
+
+    def jsx_paginate(
+        self,
+        url: str,
+        method: str = Literal["get", "post"],
+        body_query: Query = None,
+        query_params: dict = None,
+        headers: dict = None,
+        chunk_size: int = 100,
+        item_type: Any = None,
+    ) -> ServiceResponse:
+        return self._collect_pages(
+            self.iter_jsx_paginate(
+                url,
+                method=method,
+                body_query=body_query,
+                query_params=query_params,
+                headers=headers,
+                chunk_size=chunk_size,
+            ),
+            item_type,
+        )
+
+    @staticmethod
+    def get_error_message(status: int, content: bytes):
+        """
+        Returns the error reported in the body of a failed response,
+        raises ValueError if the body isn't JSON.
+        """
+        if status in (502, 504):
+            return "Our service is currently unavailable, please try again later."
+        data_json = json.loads(content)
+        if "error" in data_json:
+            return data_json["error"]
+        elif "errors" in data_json:
+            return data_json["errors"]
+        elif "message" in data_json:
+            return data_json["message"]
+        return "Unknown Error"
+
     @staticmethod
     def serialize_response(
         response: requests.Response, content_type, dispatcher: str = None
@@ -271,23 +425,11 @@ class HttpClient(BaseClient):
         }
         try:
             if not response.ok:
-                if response.status_code in (502, 504):
-                    data["res_error"] = (
-                        "Our service is currently unavailable, please try again later."
-                    )
-                    return content_type(**data)
-                else:
-                    data_json = response.json()
-                    if "error" in data_json:
-                        data["res_error"] = data_json["error"]
-                    elif "errors" in data_json:
-                        data["res_error"] = data_json["errors"]
-                    elif "message" in data_json:
-                        data["res_error"] = data_json["message"]
-                    else:
-                        data["res_error"] = "Unknown Error"
-                    return content_type(**data)
-            data_json = response.json()
+                data["res_error"] = HttpClient.get_error_message(
+                    response.status_code, response.content
+                )
+                return content_type(**data)
+            data_json = json.loads(response.content)
             if dispatcher:
                 if dispatcher in data_json:
                     data["res_data"] = data_json.pop(dispatcher)
@@ -305,10 +447,14 @@ class HttpClient(BaseClient):
 
 
 class AIOHttpSession(aiohttp.ClientSession):
-    RETRY_STATUS_CODES = [401, 403, 502, 503, 504]
+    RETRY_STATUS_CODES = [401, 403, 429, 502, 503, 504]
     RETRY_LIMIT = 3
     BACKOFF_FACTOR = 0.5
 
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("json_serialize", json.dumps)
+        super().__init__(*args, **kwargs)
+
     @staticmethod
     def _copy_form_data(data: aiohttp.FormData) -> aiohttp.FormData:
         form_data = aiohttp.FormData(quote_fields=False)
@@ -322,13 +468,24 @@ class AIOHttpSession(aiohttp.ClientSession):
             )
         return form_data
 
+    async def _request(self, method: str, str_or_url, **kwargs):
+        family = RATE_LIMITER.get_family(str(str_or_url))
+        async with RATE_LIMITER.limit_async(family):
+            try:
+                response = await super()._request(method, str_or_url, **kwargs)
+            except aiohttp.ClientResponseError as e:
+                RATE_LIMITER.handle_response(family, e.status, e.headers)
+                raise
+        RATE_LIMITER.handle_response(family, response.status, response.headers)
+        return response
+
     async def request(self, *args, **kwargs) -> aiohttp.ClientResponse:
         attempts = self.RETRY_LIMIT
         delay = 0
         for _ in range(attempts):
             delay += self.BACKOFF_FACTOR
             try:
-                response = await super()._request(*args, **kwargs)
+                response = await self._request(*args, **kwargs)
                 if attempts <= 1 or response.status not in self.RETRY_STATUS_CODES:
                     if not response.ok:
                         txt = await response.text()
@@ -4,6 +4,7 @@ import time
 from typing import Literal
 
 from lib.core import entities
+from lib.core.concurrency import iter_poll_delays
 from lib.core.exceptions import AppException
 from lib.core.exceptions import BackendError
 from lib.core.serviceproviders import BaseItemService
@@ -157,8 +158,7 @@ class ItemService(BaseItemService):
     ):
         try:
             await_time = 60 + items_count * 0.3  # time for waiting backend processing
-            timeout_start = time.time()
-            while time.time() < timeout_start + await_time:
+            for delay in iter_poll_delays(initial=1, maximum=4, timeout=await_time):
                 response = self.client.request(
                     self.URL_COPY_PROGRESS,
                     "get",
@@ -169,7 +169,11 @@ class ItemService(BaseItemService):
                 progress = response.data.get("progress")
                 if progress == "finished":
                     break
-                time.sleep(4)
+                time.sleep(delay)
+            else:
+                raise AppException(
+                    f"The copy/move job {poll_id} wasn't finished in {await_time:.0f}s."
+                )
         except (AppException, Exception) as e:
             raise BackendError(e)
 
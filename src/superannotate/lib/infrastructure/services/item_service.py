@@ -1,16 +1,21 @@
+from __future__ import annotations
+
 import base64
+from collections.abc import Iterator
 
 from lib.core.entities import BaseItemEntity
 from lib.core.jsx_conditions import Join
 from lib.core.jsx_conditions import Query
 from lib.core.service_types import BaseItemResponse
 from lib.core.serviceproviders import SuperannotateServiceProvider
+from pydantic import TypeAdapter
 from superannotate import AppException
 
 
 class ItemService(SuperannotateServiceProvider):
     URL_LIST = "items/search"
     URL_GET = "items/{item_id}"
+    CHUNK_SIZE = 2000
 
     def get(self, project_id: int, item_id: int, query: Query):
         result = self.client.request(
@@ -26,27 +31,46 @@ class ItemService(SuperannotateServiceProvider):
         )
         return result
 
-    def list(self, project_id: int, folder_id: int | None, query: Query):
-        query &= Join("metadata", ["path"])
+    def _get_list_headers(self, project_id: int, folder_id: int | None) -> dict:
         entity_context = [
             f'"team_id":{self.client.team_id}',
             f'"project_id":{project_id}',
         ]
         if folder_id:
             entity_context.append(f'"folder_id":{folder_id}')
+        return {
+            "x-sa-entity-context": base64.b64encode(
+                f"{{{','.join(entity_context)}}}".encode()
+            ).decode()
+        }
 
+    def list(self, project_id: int, folder_id: int | None, query: Query):
+        query &= Join("metadata", ["path"])
         response = self.client.jsx_paginate(
             url=self.URL_LIST,
-            chunk_size=2000,
+            chunk_size=self.CHUNK_SIZE,
             body_query=query,
             method="post",
             item_type=BaseItemEntity,
-            headers={
-                "x-sa-entity-context": base64.b64encode(
-                    f"{{{','.join(entity_context)}}}".encode()
-                ).decode()
-            },
+            headers=self._get_list_headers(project_id, folder_id),
         )
         if not response.ok:
             raise AppException(response.error)
         return response.data
+
+    def iter_list(
+        self, project_id: int, folder_id: int | None, query: Query
+    ) -> Iterator[list[BaseItemEntity]]:
+        """Lazily yields the listed items page by page."""
+        query &= Join("metadata", ["path"])
+        for response in self.client.iter_jsx_paginate(
+            url=self.URL_LIST,
+            chunk_size=self.CHUNK_SIZE,
+            body_query=query,
+            method="post",
+            headers=self._get_list_headers(project_id, folder_id),
+        ):
+            if not response.ok:
+                raise AppException(response.error)
+            if response.data:
+                yield TypeAdapter(list[BaseItemEntity]).validate_python(response.data)
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import copy
-import json
 import logging
 import os
 from collections.abc import Callable
+from collections.abc import Iterator
 
 import aiohttp
+from lib.core import json
 from lib.core.exceptions import AppException
 from lib.core.exceptions import BackendError
 from lib.core.reporter import Reporter
 from lib.infrastructure.services.http_client import AIOHttpSession
 from lib.infrastructure.utils import annotation_is_valid
 from lib.infrastructure.utils import async_retry_on_generator
+from lib.infrastructure.utils import store_annotation
 
 _seconds = 2**10
 TIMEOUT = aiohttp.ClientTimeout(
@@ -22,6 +24,66 @@ TIMEOUT = aiohttp.ClientTimeout(
 logger = logging.getLogger("sa")
 
 
+class DelimitedJSONParser:
+    """
+    Incremental parser of a byte stream of JSON documents separated by a delimiter.
+
+    The received bytes are appended to a single buffer and only the new bytes
+    are scanned for the delimiter, a frame is decoded once it is complete.
+    The consumed frames are dropped from the front of the buffer without copying
+    the remaining tail. If the delimiter occurs inside a JSON string the frame
+    doesn't decode, so it is extended to the next delimiter.
+    """
+
+    def __init__(self, delimiter: bytes):
+        self._delimiter = delimiter
+        self._buffer = bytearray()
+        self._scan_from = 0
+
+    def _decode(self, end: int):
+        with memoryview(self._buffer)[:end] as frame:
+            return json.loads(frame)
+
+    def feed(self, chunk: bytes) -> Iterator:
+        buffer, delimiter = self._buffer, self._delimiter
+        buffer += chunk
+        frame_start = 0
+        while (index := buffer.find(delimiter, self._scan_from)) != -1:
+            self._scan_from = index + len(delimiter)
+            if index == frame_start:
+                frame_start = self._scan_from
+                continue
+            if frame_start:
+                del buffer[:frame_start]
+                index -= frame_start
+                self._scan_from -= frame_start
+                frame_start = 0
+            try:
+                json_obj = self._decode(index)
+            except json.JSONDecodeError:
+                continue
+            frame_start = self._scan_from
+            yield json_obj
+        if frame_start:
+            del buffer[:frame_start]
+            self._scan_from -= frame_start
+        # the delimiter can be split between the chunks
+        self._scan_from = max(self._scan_from, len(buffer) - len(delimiter) + 1)
+
+    def close(self) -> Iterator:
+        """Decodes the last frame if the stream doesn't end with the delimiter."""
+        if self._buffer.strip():
+            try:
+                yield self._decode(len(self._buffer))
+            except json.JSONDecodeError as e:
+                logger.debug(
+                    f"Failed to parse buffer, buffer_len: {len(self._buffer)} || start buffer:"
+                    f" {self._buffer[:50]} || buffer_end: ...{self._buffer[-50:]} || error: {e}"
+                )
+        self._buffer.clear()
+        self._scan_from = 0
+
+
 class StreamedAnnotations:
     DELIMITER = "\\n;)\\n"
     DELIMITER_LEN = len(DELIMITER)
@@ -33,8 +95,10 @@ class StreamedAnnotations:
         reporter: Reporter,
         callback: Callable = None,
         map_function: Callable = None,
+        connector: aiohttp.BaseConnector = None,
     ):
         self._headers = headers
+        self._connector = connector
         self._annotations = []
         self._reporter = reporter
         self._callback: Callable = callback
@@ -56,9 +120,9 @@ class StreamedAnnotations:
         async with AIOHttpSession(
             headers=self._headers,
             timeout=TIMEOUT,
-            connector=aiohttp.TCPConnector(
-                ssl=self.VERIFY_SSL, keepalive_timeout=2**32
-            ),
+            connector=self._connector
+            or aiohttp.TCPConnector(ssl=self.VERIFY_SSL, keepalive_timeout=2**32),
+            connector_owner=self._connector is None,
             raise_for_status=True,
         ) as session:
             response = await session.request(
@@ -66,47 +130,31 @@ class StreamedAnnotations:
             )  # noqa
             if not response.ok:
                 logger.error(response.text)
-            buffer = ""
-            line_groups = b""
-            decoder = json.JSONDecoder()
+            parser = DelimitedJSONParser(self.DELIMITER.encode("utf-8"))
             data_received = False
-            async for line in response.content.iter_any():
-                line_groups += line
-                try:
-                    buffer += line_groups.decode("utf-8")
-                    line_groups = b""
-                except UnicodeDecodeError:
-                    continue
-                while buffer:
-                    try:
-                        if buffer.startswith(self.DELIMITER):
-                            buffer = buffer[self.DELIMITER_LEN :]
-                        json_obj, index = decoder.raw_decode(buffer)
-                        if not annotation_is_valid(json_obj):
-                            logger.warning(
-                                f"Invalid JSON detected in small annotations stream process, json: {json_obj}."
-                            )
-                            if data_received:
-                                raise AppException(
-                                    "Invalid JSON detected in small annotations stream process."
-                                )
-                            else:
-                                raise BackendError(
-                                    "Invalid JSON detected at the start of the small annotations stream process."
-                                )
-                        data_received = True
-                        yield json_obj
-                        if len(buffer[index:]) >= self.DELIMITER_LEN:
-                            buffer = buffer[index + self.DELIMITER_LEN :]
-                        else:
-                            buffer = buffer[index:]
-                            break
-                    except json.decoder.JSONDecodeError as e:
-                        logger.debug(
-                            f"Failed to parse buffer, buffer_len: {len(buffer)} || start buffer:"
-                            f" {buffer[:50]} || buffer_end: ...{buffer[-50:]} || error: {e}"
-                        )
-                        break
+            async for chunk in response.content.iter_any():
+                for json_obj in parser.feed(chunk):
+                    self._validate_annotation(json_obj, data_received)
+                    data_received = True
+                    yield json_obj
+            for json_obj in parser.close():
+                self._validate_annotation(json_obj, data_received)
+                yield json_obj
+
+    @staticmethod
+    def _validate_annotation(json_obj, data_received: bool):
+        if not annotation_is_valid(json_obj):
+            logger.warning(
+                f"Invalid JSON detected in small annotations stream process, json: {json_obj}."
+            )
+            if data_received:
+                raise AppException(
+                    "Invalid JSON detected in small annotations stream process."
+                )
+            else:
+                raise BackendError(
+                    "Invalid JSON detected at the start of the small annotations stream process."
+                )
 
     async def list_annotations(
         self,
@@ -114,22 +162,29 @@ class StreamedAnnotations:
         url: str,
         data: list[int] = None,
         params: dict = None,
+    ):
+        return [
+            annotation
+            async for annotation in self.iter_annotations(method, url, data, params)
+        ]
+
+    async def iter_annotations(
+        self,
+        method: str,
+        url: str,
+        data: list[int] = None,
+        params: dict = None,
     ):
         params = copy.copy(params)
         params["limit"] = len(data)
-        annotations = []
 
         async for annotation in self.fetch(
             method,
             url,
             self._process_data(data),
-            params=copy.copy(params),
+            params=params,
         ):
-            annotations.append(
-                self._callback(annotation) if self._callback else annotation
-            )
-
-        return annotations
+            yield self._callback(annotation) if self._callback else annotation
 
     async def download_annotations(
         self,
@@ -138,6 +193,7 @@ class StreamedAnnotations:
         download_path,
         data: list[int],
         params: dict = None,
+        store_callback: Callable = None,
     ):
         params = copy.copy(params)
         params["limit"] = len(data)
@@ -151,19 +207,21 @@ class StreamedAnnotations:
             self._annotations.append(
                 self._callback(annotation) if self._callback else annotation
             )
-            self._store_annotation(
+            file_path, size, checksum = self._store_annotation(
                 download_path,
                 annotation,
                 self._callback,
             )
+            if store_callback:
+                store_callback(annotation["metadata"]["id"], file_path, size, checksum)
             self._items_downloaded += 1
 
     @staticmethod
     def _store_annotation(path, annotation: dict, callback: Callable = None):
         os.makedirs(path, exist_ok=True)
-        with open(f"{path}/{annotation['metadata']['name']}.json", "w") as file:
-            annotation = callback(annotation) if callback else annotation
-            json.dump(annotation, file)
+        file_path = f"{path}/{annotation['metadata']['name']}.json"
+        annotation = callback(annotation) if callback else annotation
+        return (file_path, *store_annotation(file_path, annotation))
 
     def _process_data(self, data):
         if data and self._map_function:
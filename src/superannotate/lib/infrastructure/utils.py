@@ -1,21 +1,35 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import itertools
 import logging
+import os
+import tempfile
+import threading
 import time
 import typing
 from abc import ABC
 from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from functools import wraps
 from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import aiofiles
+from lib.core import json
 from lib.core.entities import ProjectEntity
 from lib.core.enums import CustomFieldEntityEnum
 from lib.core.exceptions import AppException
 from lib.core.exceptions import PathError
+from lib.core.jsx_conditions import Filter
+from lib.core.jsx_conditions import OperatorEnum
 from lib.infrastructure.services.work_management import WorkManagementService
 
 logger = logging.getLogger("sa")
@@ -139,6 +153,10 @@ def async_retry_on_generator(
     return decorator
 
 
+ANNOTATION_SNIFF_SIZE = 64 * 1024
+_METADATA_KEY = b'"metadata"'
+
+
 def annotation_is_valid(annotation: dict) -> bool:
     annotation_keys = annotation.keys()
     if (
@@ -150,6 +168,80 @@ def annotation_is_valid(annotation: dict) -> bool:
     return True
 
 
+def store_annotation(path: str | Path, annotation: dict) -> tuple[int, str]:
+    """Writes the annotation JSON file, returns the written size and md5 checksum."""
+    content = json.dumpb(annotation)
+    with open(path, "wb") as file:
+        file.write(content)
+    return len(content), hashlib.md5(content, usedforsecurity=False).hexdigest()
+
+
+async def store_annotation_stream(
+    path: str | Path, chunks: AsyncIterator[bytes]
+) -> tuple[int, str] | None:
+    """
+    Streams the annotation JSON to a temporary file next to the path and renames it
+    once the whole body is written, so the annotation is never held in memory.
+    Returns the written size and md5 checksum, None if the body isn't a valid annotation.
+
+    Bodies up to ANNOTATION_SNIFF_SIZE (errors included) are validated by parsing them,
+    larger ones by sniffing the opening brace and the metadata key.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".sa_", suffix=".part")
+    os.close(fd)
+    head, tail = b"", b""
+    has_metadata = False
+    checksum = hashlib.md5(usedforsecurity=False)
+    size = 0
+    try:
+        async with aiofiles.open(tmp_path, "wb") as file:
+            async for chunk in chunks:
+                if len(head) < ANNOTATION_SNIFF_SIZE:
+                    head += chunk[: ANNOTATION_SNIFF_SIZE - len(head)]
+                if not has_metadata:
+                    # the key can be split between the chunks
+                    has_metadata = (
+                        _METADATA_KEY in tail + chunk[: len(_METADATA_KEY)]
+                        or _METADATA_KEY in chunk
+                    )
+                    tail = (tail + chunk)[-len(_METADATA_KEY) :]  # noqa: E203
+                checksum.update(chunk)
+                size += len(chunk)
+                await file.write(chunk)
+        if size <= ANNOTATION_SNIFF_SIZE:
+            try:
+                annotation = json.loads(head)
+                is_valid = isinstance(annotation, dict) and annotation_is_valid(
+                    annotation
+                )
+            except json.JSONDecodeError:
+                is_valid = False
+        else:
+            is_valid = head.lstrip().startswith(b"{") and has_metadata
+        if not is_valid:
+            os.remove(tmp_path)
+            return None
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return size, checksum.hexdigest()
+
+
+def iter_utf8_parts(view: memoryview, size: int) -> Iterator[tuple[int, int]]:
+    """Yields the (start, end) offsets of parts of at most size bytes not splitting characters."""
+    start, length = 0, len(view)
+    while start < length:
+        end = min(start + size, length)
+        # step back from UTF-8 continuation bytes
+        while start + 1 < end < length and view[end] & 0xC0 == 0x80:
+            end -= 1
+        yield start, end
+        start = end
+
+
 class BaseCachedWorkManagementRepository(ABC):
     def __init__(self, ttl_seconds: int, work_management: WorkManagementService):
         self.ttl_seconds = ttl_seconds
@@ -512,3 +604,125 @@ class CachedWorkManagementRepository:
                     "templates"
                 ]
         raise AppException("Invalid entity provided.")
+
+
+class ItemNameIndex:
+    """
+    Resolves item names to items in bulk, the names are listed in CHUNK_SIZE
+    chunks by up to MAX_WORKERS threads. Only the requested names are returned.
+    With a positive ttl_seconds (opt-in, as the items can be changed by other
+    clients meanwhile) the found items of each folder are kept for ttl_seconds
+    and only the names missing from the index are listed. The names that are
+    not found are not kept.
+    """
+
+    DEFAULT_TTL_SECONDS = 0
+    CHUNK_SIZE = 1000
+    MAX_WORKERS = 4
+
+    def __init__(self, item_service, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._item_service = item_service
+        self._K_V_map: dict[tuple[int, int], dict[str, tuple[float, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _list(self, project_id: int, folder_id: int, names: list[str]) -> list:
+        return self._item_service.list(
+            project_id, folder_id, Filter("name", names, OperatorEnum.IN)
+        )
+
+    def resolve(self, project_id: int, folder_id: int, names: list[str]) -> dict:
+        key = (project_id, folder_id)
+        resolved = {}
+        if self.ttl_seconds > 0:
+            with self._lock:
+                index = self._K_V_map.get(key, {})
+                expired_before = time.time() - self.ttl_seconds
+                for name in names:
+                    cached = index.get(name)
+                    if cached and cached[0] > expired_before:
+                        resolved[name] = cached[1]
+        missing = list(dict.fromkeys(i for i in names if i not in resolved))
+        if not missing:
+            return resolved
+        chunks = [list(i) for i in divide_to_chunks(missing, self.CHUNK_SIZE)]
+        if len(chunks) == 1:
+            pages = [self._list(project_id, folder_id, chunks[0])]
+        else:
+            with ThreadPoolExecutor(min(self.MAX_WORKERS, len(chunks))) as executor:
+                pages = list(
+                    executor.map(
+                        lambda chunk: self._list(project_id, folder_id, chunk), chunks
+                    )
+                )
+        requested = set(missing)
+        # e.g. the items matched case-insensitively
+        found = [
+            item
+            for item in itertools.chain.from_iterable(pages)
+            if item.name in requested
+        ]
+        resolved.update((item.name, item) for item in found)
+        if self.ttl_seconds > 0:
+            with self._lock:
+                now = time.time()
+                index = {
+                    k: v
+                    for k, v in self._K_V_map.get(key, {}).items()
+                    if v[0] > now - self.ttl_seconds
+                }
+                index.update((item.name, (now, item)) for item in found)
+                self._K_V_map[key] = index
+        return resolved
+
+    def invalidate(self, project_id: int, folder_id: int | None = None):
+        with self._lock:
+            for key in list(self._K_V_map):
+                if key[0] == project_id and folder_id in (None, key[1]):
+                    del self._K_V_map[key]
+
+
+class SaqulQueryCache:
+    """
+    Keeps the validation responses of the saqul queries of each project for
+    ttl_seconds, so the repeated queries and counts skip the validation request.
+    The least recently used responses are dropped once there are more than max_size.
+    Only the successful responses are kept.
+    """
+
+    DEFAULT_TTL_SECONDS = 300
+    MAX_SIZE = 256
+
+    def __init__(
+        self,
+        explore_service,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_size: int = MAX_SIZE,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._explore_service = explore_service
+        self._K_V_map: OrderedDict[tuple[int, str], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(self, project: ProjectEntity, query: str):
+        key = (project.id, query)
+        with self._lock:
+            cached = self._K_V_map.get(key)
+            if cached and cached[0] > time.time() - self.ttl_seconds:
+                self._K_V_map.move_to_end(key)
+                return cached[1]
+        response = self._explore_service.validate_saqul_query(project, query)
+        if response.ok:
+            with self._lock:
+                self._K_V_map[key] = (time.time(), response)
+                self._K_V_map.move_to_end(key)
+                while len(self._K_V_map) > self.max_size:
+                    self._K_V_map.popitem(last=False)
+        return response
+
+    def invalidate(self, project_id: int):
+        with self._lock:
+            for key in list(self._K_V_map):
+                if key[0] == project_id:
+                    del self._K_V_map[key]
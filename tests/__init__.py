@@ -8,6 +8,7 @@ os.environ.update({"SA_VERSION_CHECK": "False"})
 LIB_PATH = Path(__file__).parent.parent / "src"
 DATA_SET_PATH = Path(__file__).parent / "data_set"
 sys.path.insert(0, str(LIB_PATH))
+sys.path.insert(0, str(LIB_PATH / "superannotate"))
 
 
 def compare_result(result: dict, expected: dict, ignore_keys: set = None):
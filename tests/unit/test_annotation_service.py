@@ -0,0 +1,70 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import patch
+
+from aiohttp import web
+from lib.core.entities import ProjectEntity
+from lib.core.exceptions import AppException
+from lib.core.utils import finalize_loop
+from lib.infrastructure.services.annotation import AnnotationService
+from lib.infrastructure.services.http_client import HttpClient
+
+
+class TestIterUploadChunks(TestCase):
+    def setUp(self):
+        self.requests = []
+        self.project = ProjectEntity(id=1, name="p", type=1, team_id=7)
+
+    async def _handle(self, request):
+        body = await request.json()
+        self.requests.append(dict(request.query))
+        if 0 in body["item_ids"]:
+            return web.json_response({"error": "Invalid items."}, status=400)
+        return web.json_response(
+            {
+                "small": {"0": {"data": body["item_ids"][1:]}},
+                "large": body["item_ids"][:1],
+            }
+        )
+
+    def _classify(self, item_ids):
+        async def _run():
+            app = web.Application()
+            app.router.add_post(
+                f"/{AnnotationService.URL_CLASSIFY_ITEM_SIZE}", self._handle
+            )
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            service = AnnotationService(
+                HttpClient("https://api.example.com", "token=7")
+            )
+            try:
+                with patch.object(
+                    service,
+                    "get_assets_provider_url",
+                    return_value=f"http://127.0.0.1:{port}/",
+                ):
+                    return [
+                        batch
+                        async for batch in service.iter_upload_chunks(
+                            self.project, item_ids, chunk_size=2
+                        )
+                    ]
+            finally:
+                await finalize_loop()
+                await runner.cleanup()
+
+        return asyncio.run(_run())
+
+    def test_requests_are_team_scoped(self):
+        batches = self._classify([1, 2, 3, 4])
+        assert sorted(i for b in batches for i in b["large"]) == [1, 3]
+        assert sorted(i for b in batches for s in b["small"] for i in s) == [2, 4]
+        assert all(r["team_id"] == "7" for r in self.requests)
+
+    def test_errors_are_reported(self):
+        with self.assertRaisesRegex(AppException, "Invalid items."):
+            self._classify([0, 1])
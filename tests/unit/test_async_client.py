@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from lib.app.interface.responses import QueryResult
+from lib.core.exceptions import AppException
+from superannotate import AsyncSAClient
+
+
+class TestAsyncSAClient(TestCase):
+    def setUp(self):
+        patcher = patch("superannotate.lib.app.interface.async_sdk_interface.SAClient")
+        self.client_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sync_client = self.client_class.return_value
+
+    def test_calls_are_bounded_by_workers(self):
+        in_flight, max_in_flight = 0, 0
+        lock = threading.Lock()
+
+        def list_items(project, folder, **kwargs):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return [{"project": project}]
+
+        self.sync_client.list_items.side_effect = list_items
+
+        async def _run():
+            async with AsyncSAClient(token="token", max_workers=4) as sa_client:
+                return await asyncio.gather(
+                    *[sa_client.list_items(f"project/{i}") for i in range(40)]
+                )
+
+        results = asyncio.run(_run())
+        assert results == [[{"project": f"project/{i}"}] for i in range(40)]
+        assert max_in_flight == 4
+        self.client_class.assert_called_once_with(token="token", config_path=None)
+
+    def test_errors_are_raised(self):
+        self.sync_client.set_annotation_statuses = MagicMock(
+            side_effect=ValueError("Invalid status.")
+        )
+
+        async def _run():
+            async with AsyncSAClient() as sa_client:
+                await sa_client.set_annotation_statuses("project", "Unknown", ["a"])
+
+        with self.assertRaises(ValueError):
+            asyncio.run(_run())
+        self.sync_client.set_annotation_statuses.assert_called_once_with(
+            "project", "Unknown", ["a"]
+        )
+
+    def test_annotations_are_fetched_in_the_calling_loop(self):
+        controller = self.sync_client.controller
+        controller.get_project_folder.return_value = ("project", "folder")
+        loops = []
+
+        async def list_async(*args, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return MagicMock(errors=None, data=[{"name": "a"}])
+
+        controller.annotations.list_async = list_async
+
+        async def _run():
+            async with AsyncSAClient() as sa_client:
+                return (
+                    await sa_client.get_annotations("project/folder", ["a"]),
+                    asyncio.get_running_loop(),
+                )
+
+        annotations, loop = asyncio.run(_run())
+        assert annotations == [{"name": "a"}]
+        assert loops == [loop]
+        controller.get_project_folder.assert_called_once_with("project/folder")
+
+    def test_upload_errors_are_raised(self):
+        controller = self.sync_client.controller
+        controller.get_project_folder.return_value = ("project", "folder")
+
+        async def upload_multiple_async(**kwargs):
+            return MagicMock(errors="Can't upload annotations.")
+
+        controller.annotations.upload_multiple_async = upload_multiple_async
+
+        async def _run():
+            async with AsyncSAClient() as sa_client:
+                await sa_client.upload_annotations("project", [{"metadata": {}}])
+
+        with self.assertRaisesRegex(AppException, "Can't upload annotations."):
+            asyncio.run(_run())
+
+    def test_query_result_is_loaded(self):
+        result = QueryResult(lambda _: iter([[{"name": "a"}]]), lambda: 1)
+        self.sync_client.query.return_value = result
+
+        async def _run():
+            async with AsyncSAClient() as sa_client:
+                return await sa_client.query("project", "instance(type=bbox)")
+
+        assert asyncio.run(_run()) is result
+        assert result._loaded
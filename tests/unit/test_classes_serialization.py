@@ -7,7 +7,7 @@ from pydantic import ValidationError
 from superannotate.lib.app.serializers import BaseSerializer
 from superannotate.lib.core.entities.classes import AnnotationClassEntity
 from superannotate.lib.core.entities.classes import AttributeGroup
-from superannotate.lib.infrastructure.services.http_client import PydanticEncoder
+from superannotate.lib.core.json import PydanticEncoder
 from superannotate.lib.infrastructure.validators import wrap_error
 from tests import DATA_SET_PATH
 
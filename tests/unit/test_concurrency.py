@@ -0,0 +1,302 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from unittest import TestCase
+from unittest.mock import patch
+
+from lib.core.concurrency import AdaptiveConcurrencyLimit
+from lib.core.concurrency import ConcurrencyLimit
+from lib.core.concurrency import gather_adaptive
+from lib.core.concurrency import imap_bounded
+from lib.core.concurrency import iter_poll_delays
+from lib.core.concurrency import parse_retry_after
+from lib.core.concurrency import RateLimiter
+from lib.core.concurrency import TokenBucket
+from lib.core.exceptions import BackendError
+
+
+class TestAdaptiveConcurrencyLimit(TestCase):
+    def test_additive_increase_up_to_maximum(self):
+        limit = AdaptiveConcurrencyLimit(2, maximum=4)
+        for _ in range(100):
+            limit._active += 1
+            limit.release(latency=0.1)
+        assert limit.limit == 4
+        assert limit.active == 0
+
+    def test_no_increase_on_slow_requests(self):
+        limit = AdaptiveConcurrencyLimit(2, maximum=4)
+        limit._active += 1
+        limit.release(latency=0.1)
+        for _ in range(20):
+            limit._active += 1
+            limit.release(latency=1)
+        assert limit.limit == 2
+
+    def test_multiplicative_decrease_once_per_burst(self):
+        limit = AdaptiveConcurrencyLimit(8, maximum=8)
+        limit._active = 3
+        limit.release(started_at=0.0, throttled=True)
+        limit.release(started_at=0.0, throttled=True)
+        assert limit.limit == 4
+        limit.release(throttled=True)
+        assert limit.limit == 2
+        for _ in range(5):
+            limit._active += 1
+            limit.release(throttled=True)
+        assert limit.limit == 1
+
+    def test_waiter_woken_from_another_thread(self):
+        limit = AdaptiveConcurrencyLimit(1)
+
+        async def _run():
+            await limit.acquire()
+            threading.Timer(0.05, limit.release).start()
+            await asyncio.wait_for(limit.acquire(), 1)
+            limit.release()
+
+        asyncio.run(_run())
+        assert limit.active == 0
+
+
+class TestGatherAdaptive(TestCase):
+    def test_order_and_limit(self):
+        limit = AdaptiveConcurrencyLimit(3, maximum=3)
+        in_flight, max_in_flight = 0, 0
+
+        async def _job(value):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01 * (value % 3))
+            in_flight -= 1
+            return value * 2
+
+        results = asyncio.run(gather_adaptive(_job, range(20), limit))
+        assert results == [i * 2 for i in range(20)]
+        assert max_in_flight == 3
+        assert limit.active == 0
+
+    def test_throttled_jobs_are_retried(self):
+        limit = AdaptiveConcurrencyLimit(4, maximum=4)
+        attempts = {}
+
+        async def _job(value):
+            attempts[value] = attempts.get(value, 0) + 1
+            if value == 1 and attempts[value] < 3:
+                raise BackendError("Too many requests.", status=429)
+            return value
+
+        results = asyncio.run(
+            gather_adaptive(_job, range(3), limit, retries=3, retry_delay=0)
+        )
+        assert results == [0, 1, 2]
+        assert attempts[1] == 3
+        assert limit.limit < 4
+
+    def test_other_errors_are_raised(self):
+        limit = AdaptiveConcurrencyLimit(2)
+
+        async def _job(value):
+            raise BackendError("Broken.", status=400)
+
+        with self.assertRaises(BackendError):
+            asyncio.run(gather_adaptive(_job, range(3), limit, retries=3))
+        assert limit.limit == 2
+        assert limit.active == 0
+
+
+class TestConcurrencyLimit(TestCase):
+    def test_threads_and_coroutines_share_the_limit(self):
+        limit = ConcurrencyLimit(2)
+        in_flight, max_in_flight = 0, 0
+        lock = threading.Lock()
+
+        def _enter():
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+
+        def _exit():
+            nonlocal in_flight
+            with lock:
+                in_flight -= 1
+
+        def _thread_job(_):
+            limit.acquire_blocking()
+            _enter()
+            time.sleep(0.01)
+            _exit()
+            limit.release()
+
+        async def _coroutine_job():
+            await limit.acquire()
+            _enter()
+            await asyncio.sleep(0.01)
+            _exit()
+            limit.release()
+
+        async def _run():
+            await asyncio.gather(*[_coroutine_job() for _ in range(5)])
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(_thread_job, i) for i in range(8)]
+            asyncio.run(_run())
+            [f.result() for f in futures]
+        assert max_in_flight == 2
+        assert limit.active == 0
+
+    def test_waiter_cancelled_before_hand_over(self):
+        limit = ConcurrencyLimit(1)
+
+        async def _run():
+            await limit.acquire()
+            waiting = asyncio.create_task(limit.acquire())
+            await asyncio.sleep(0)
+            # the slot is handed over in a callback, the waiter is cancelled before it runs
+            limit.release()
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+            await asyncio.sleep(0)
+            assert limit.active == 0
+            await limit.acquire()
+            second = asyncio.create_task(limit.acquire())
+            await asyncio.sleep(0.01)
+            assert not second.done()
+            limit.release()
+            await second
+            limit.release()
+
+        asyncio.run(_run())
+        assert limit.active == 0
+
+    def test_blocking_acquire_timeout(self):
+        limit = ConcurrencyLimit(1)
+        assert limit.acquire_blocking(0.01)
+        assert not limit.acquire_blocking(0.01)
+        limit.release()
+        # the timed out waiter doesn't take the released slot
+        assert limit.active == 0
+        assert limit.acquire_blocking(0.01)
+        limit.release()
+
+
+class TestImapBounded(TestCase):
+    def test_jobs_are_read_lazily(self):
+        read, in_flight, max_in_flight = 0, 0, 0
+        lock = threading.Lock()
+
+        def _jobs():
+            nonlocal read
+            for i in range(20):
+                read += 1
+                yield i
+
+        def _job(value):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return value * 2
+
+        results = imap_bounded(_job, _jobs(), 3)
+        job, result = next(results)
+        assert result == job * 2
+        assert read <= 4
+        assert sorted(dict([(job, result), *results]).values()) == [
+            i * 2 for i in range(20)
+        ]
+        assert max_in_flight == 3
+
+    def test_pending_jobs_are_cancelled_on_error(self):
+        called = []
+
+        def _job(value):
+            called.append(value)
+            if value == 0:
+                raise BackendError("Broken.", status=400)
+            time.sleep(0.05)
+
+        with self.assertRaises(BackendError):
+            list(imap_bounded(_job, range(100), 2))
+        assert len(called) < 5
+
+
+class TestPollDelays(TestCase):
+    def test_exponential_with_jitter(self):
+        delays = list(islice(iter_poll_delays(0.5, maximum=4), 8))
+        for delay, upper in zip(delays, (0.5, 1, 2, 4, 4, 4, 4, 4)):
+            assert upper / 2 <= delay <= upper
+        assert len(set(delays)) == len(delays)
+
+    def test_timeout(self):
+        clock = 0.0
+        with patch("lib.core.concurrency.time.monotonic", lambda: clock):
+            delays = []
+            for delay in iter_poll_delays(0.5, maximum=4, timeout=5):
+                # the poller sleeps for the delay
+                clock += delay
+                delays.append(delay)
+            assert not list(iter_poll_delays(1, timeout=0.1))
+        assert 2 <= len(delays) <= 5
+        assert sum(delays) <= 5
+
+
+class TestRateLimiter(TestCase):
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert 0.05 < bucket.reserve() <= 0.1
+        bucket.pause(5)
+        assert 5 < bucket.reserve() <= 5.3
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("2") == 2
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+    def test_families_and_throttling(self):
+        limiter = RateLimiter(
+            families={"annotations": r"/annotations"},
+            limits={"annotations": (100, 4), RateLimiter.DEFAULT_FAMILY: (100, 4)},
+        )
+        assert (
+            limiter.get_family("https://a.b/items/annotations/download?x=/search")
+            == "annotations"
+        )
+        assert limiter.get_family("https://a.b/items/search") == "default"
+        assert limiter.handle_response("annotations", 200, {}) == 0
+        assert limiter.handle_response("annotations", 503, {}) == 0
+        assert limiter.handle_response("annotations", 503, {"Retry-After": "3"}) == 3
+        assert limiter.handle_response("default", 429, {}) == limiter.THROTTLING_PAUSE
+        assert limiter._buckets["annotations"].reserve() > 2
+
+    def test_event_loop_thread_is_limited(self):
+        limiter = RateLimiter(families={}, limits={"default": (100, 1)})
+        limiter.LOOP_SLOT_TIMEOUT = 0.2
+        limiter.handle_response("default", 429, {"Retry-After": "0.3"})
+
+        async def _run():
+            started = time.monotonic()
+            with limiter.limit("default"):
+                assert limiter._concurrency["default"].active == 1
+            paused = time.monotonic() - started
+            async with limiter.limit_async("default"):
+                # the slot held by a coroutine of the blocked loop is waited for with a timeout
+                started = time.monotonic()
+                with limiter.limit("default"):
+                    pass
+                return paused, time.monotonic() - started
+
+        paused, waited = asyncio.run(_run())
+        assert paused >= 0.25
+        assert 0.15 <= waited < 1
+        assert limiter._concurrency["default"].active == 0
@@ -0,0 +1,81 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from lib.core.entities import FolderEntity
+from lib.core.entities import ProjectEntity
+from lib.core.exceptions import BackendError
+from lib.core.service_types import ServiceResponse
+from lib.core.usecases.items import CopyMoveItems
+from lib.infrastructure.services.item import ItemService
+
+
+class TestCopyMoveItems(TestCase):
+    NAMES = [f"item_{i}" for i in range(100)]
+
+    def setUp(self):
+        self.in_flight, self.max_in_flight = 0, 0
+        self.lock = threading.Lock()
+        self.moved = set()
+        self.service_provider = MagicMock()
+        self.service_provider.items.copy_move_multiple.side_effect = self._copy_move
+        self.service_provider.items.await_copy_move.side_effect = self._await
+        self.service_provider.get_items_by_name.side_effect = self._get_by_name
+
+    def _copy_move(self, item_names, **kwargs):
+        if "item_0" in item_names:
+            return ServiceResponse(status=400, res_error="Failed.")
+        return ServiceResponse(status=200, res_data={"poll_id": item_names})
+
+    def _await(self, project, poll_id, items_count):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+            self.moved.update(poll_id)
+
+    def _get_by_name(self, project, folder, names):
+        return {name: MagicMock() for name in names if name in self.moved}
+
+    def _copy_move_items(self):
+        return CopyMoveItems(
+            reporter=MagicMock(),
+            project=ProjectEntity(id=1, name="p", type=1, team_id=1),
+            from_folder=FolderEntity(id=1, name="a", project_id=1, team_id=1),
+            to_folder=FolderEntity(id=2, name="b", project_id=1, team_id=1),
+            item_names=self.NAMES,
+            service_provider=self.service_provider,
+            include_annotations=True,
+            duplicate_strategy="replace",
+            operation="move",
+            chunk_size=10,
+        )
+
+    def test_chunks_are_processed_concurrently(self):
+        use_case = self._copy_move_items()
+        use_case._validate_limitations = MagicMock()
+        response = use_case.execute()
+        assert not response.errors
+        assert 1 < self.max_in_flight <= CopyMoveItems.MAX_IN_FLIGHT_CHUNKS
+        skipped = sorted(response.data)
+        assert len(skipped) == 10
+        assert "item_0" in skipped
+        self.service_provider.invalidate_item_names.assert_called()
+
+    def test_await_copy_move_timeout(self):
+        client = MagicMock()
+        client.request.return_value = ServiceResponse(
+            status=200, res_data={"progress": "started"}
+        )
+        with patch(
+            "lib.infrastructure.services.item.iter_poll_delays",
+            return_value=iter([0, 0]),
+        ), self.assertRaisesRegex(BackendError, "copy/move job 7 wasn't finished"):
+            ItemService(client).await_copy_move(
+                ProjectEntity(id=1, name="p", type=1, team_id=1), 7, 1
+            )
+        assert client.request.call_count == 2
@@ -0,0 +1,82 @@
+import asyncio
+from unittest import TestCase
+
+from lib.core.utils import add_loop_finalizer
+from lib.core.utils import EventLoopRunner
+from lib.core.utils import get_event_loop_runner
+from lib.core.utils import iter_async
+from lib.core.utils import run_async
+
+
+class TestIterAsync(TestCase):
+    @staticmethod
+    async def _produce(count, produced=None, fail_on=None):
+        for i in range(count):
+            if i == fail_on:
+                raise ValueError("producer failed")
+            if produced is not None:
+                produced.append(i)
+            await asyncio.sleep(0)
+            yield i
+
+    def test_yields_all_values_in_order(self):
+        assert list(iter_async(self._produce(50), buffer_size=3)) == list(range(50))
+
+    def test_producer_is_bounded_by_buffer(self):
+        produced = []
+        iterator = iter_async(self._produce(1000, produced), buffer_size=5)
+        assert next(iterator) == 0
+        iterator.close()
+        assert len(produced) < 10
+
+    def test_producer_exception_is_raised(self):
+        iterator = iter_async(self._produce(10, fail_on=3), buffer_size=2)
+        with self.assertRaises(ValueError):
+            list(iterator)
+
+
+class TestEventLoopRunner(TestCase):
+    def setUp(self):
+        self.runner = EventLoopRunner()
+
+    def tearDown(self):
+        self.runner.close()
+
+    @staticmethod
+    async def _get_loop():
+        return asyncio.get_running_loop()
+
+    def test_calls_share_the_loop(self):
+        assert self.runner.run(self._get_loop()) is self.runner.run(self._get_loop())
+
+    def test_exception_is_raised(self):
+        async def _fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            self.runner.run(_fail())
+        assert self.runner.run(asyncio.sleep(0, result=1)) == 1
+
+    def test_close_runs_finalizers(self):
+        finalized = []
+
+        async def _register():
+            async def _finalize():
+                finalized.append(True)
+
+            add_loop_finalizer(_finalize)
+
+        self.runner.run(_register())
+        assert not finalized
+        self.runner.close()
+        assert finalized
+        assert self.runner.closed
+        with self.assertRaises(RuntimeError):
+            self.runner.run(asyncio.sleep(0))
+
+    def test_run_async_inside_the_loop(self):
+        async def _nested():
+            return run_async(self._get_loop()), asyncio.get_running_loop()
+
+        nested_loop, loop = get_event_loop_runner().run(_nested())
+        assert nested_loop is not loop
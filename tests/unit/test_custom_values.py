@@ -0,0 +1,123 @@
+import re
+from collections.abc import Iterable
+from itertools import chain
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from lib.core.entities import FolderEntity
+from lib.core.entities import ProjectEntity
+from lib.core.exceptions import AppValidationException
+from lib.core.service_types import ServiceResponse
+from lib.core.service_types import UploadCustomFieldValuesResponse
+from lib.core.usecases.custom_fields import DeleteCustomValuesUseCase
+from lib.core.usecases.custom_fields import UploadCustomValuesUseCase
+from pydantic import TypeAdapter
+
+
+class TestCustomValues(TestCase):
+    def setUp(self):
+        self.read = 0
+        self.uploaded = []
+        self.service_provider = MagicMock()
+        self.service_provider.explore.upload_fields.side_effect = self._upload
+        self.service_provider.explore.delete_values.side_effect = self._delete
+
+    def _items(self, count, values=None):
+        for i in range(count):
+            self.read += 1
+            yield {f"item_{i}": values or {"field": i}}
+
+    def _upload(self, project, folder, items):
+        self.uploaded.append(self.read)
+        failed = [name for item in items for name in item if name.endswith("7")]
+        return UploadCustomFieldValuesResponse(
+            status=200, res_data={"failed_items": failed}
+        )
+
+    def _delete(self, project, folder, items):
+        if any("item_12000" in item for item in items):
+            return ServiceResponse(status=400, res_error="Failed.")
+        return ServiceResponse(status=200)
+
+    def _use_case(self, use_case_class, items):
+        self.reporter = MagicMock()
+        return use_case_class(
+            reporter=self.reporter,
+            project=ProjectEntity(id=1, name="p", type=1, team_id=1),
+            folder=FolderEntity(id=1, name="root", project_id=1, team_id=1),
+            items=items,
+            service_provider=self.service_provider,
+        )
+
+    def test_upload_streams_the_items(self):
+        response = self._use_case(
+            UploadCustomValuesUseCase, self._items(30000)
+        ).execute()
+        assert not response.errors
+        assert len(self.uploaded) == 6
+        # only the chunks in flight are read ahead
+        assert self.uploaded[0] <= 5000 * UploadCustomValuesUseCase.MAX_IN_FLIGHT_CHUNKS
+        assert len(response.data["failed"]) == 3000
+        assert len(response.data["succeeded"]) == 27000
+        assert "item_7" not in response.data["succeeded"]
+
+    def test_no_items(self):
+        with self.assertRaisesRegex(AppValidationException, "No items provided."):
+            self._use_case(UploadCustomValuesUseCase, iter(())).execute()
+        with self.assertRaisesRegex(AppValidationException, "No items provided."):
+            self._use_case(DeleteCustomValuesUseCase, [{"item_1": "field"}]).execute()
+
+    def test_delete_error(self):
+        response = self._use_case(
+            DeleteCustomValuesUseCase, self._items(40000, ["field"])
+        ).execute()
+        assert str(response.errors) == "Failed."
+        # the chunks in flight are finished and counted, no more rows are read
+        (message,), _ = self.reporter.log_warning.call_args
+        removed = int(re.search(r"the fields of (\d+) item\(s\)", message).group(1))
+        assert 10000 <= removed < 35000
+        assert self.read < 40000
+
+    def test_upload_error_reports_the_chunks_in_flight(self):
+        self.service_provider.explore.upload_fields.side_effect = [
+            UploadCustomFieldValuesResponse(status=400, res_error="Failed."),
+            UploadCustomFieldValuesResponse(status=200, res_data={"failed_items": []}),
+        ]
+        response = self._use_case(
+            UploadCustomValuesUseCase, self._items(10000)
+        ).execute()
+        assert str(response.errors) == "Failed."
+        assert len(response.data["succeeded"]) == 5000
+        (message,), _ = self.reporter.log_warning.call_args
+        assert "the values of 5000 item(s) were uploaded" in message
+
+    def test_validation_errors_are_not_swallowed(self):
+        def items():
+            yield {"item_1": {"field": 1}}
+            raise ValueError("Unreadable row.")
+
+        with self.assertRaisesRegex(ValueError, "Unreadable row."):
+            self._use_case(UploadCustomValuesUseCase, items()).execute()
+
+    def test_invalid_rows_are_not_sent(self):
+        # the SDK validates the iterables lazily, the invalid rows raise when read
+        items = TypeAdapter(Iterable[dict[str, dict]]).validate_python(
+            [{"item_1": {"field": 1}}, {"item_2": "value"}, {"item_3": {"field": 3}}]
+        )
+        response = self._use_case(
+            UploadCustomValuesUseCase, chain(items, ["row", {"item_4": {}}])
+        ).execute()
+        assert set(response.data["succeeded"]) == {"item_1", "item_3", "item_4"}
+        (message,), _ = self.reporter.log_warning.call_args
+        assert message.endswith("at the positions: 1, 3.")
+
+    def test_delete_skips_invalid_rows(self):
+        response = self._use_case(
+            DeleteCustomValuesUseCase,
+            [{"item_1": ["field"]}, {"item_2": "field"}, {"item_3": [1]}],
+        ).execute()
+        assert not response.errors
+        (_, _, items), _ = self.service_provider.explore.delete_values.call_args
+        assert list(items) == [{"item_1": ["field"]}]
+        (message,), _ = self.reporter.log_warning.call_args
+        assert message.endswith("at the positions: 1, 2.")
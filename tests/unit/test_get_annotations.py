@@ -0,0 +1,161 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from lib.core.entities import BaseItemEntity
+from lib.core.entities import ConfigEntity
+from lib.core.entities import FolderEntity
+from lib.core.entities import ProjectEntity
+from lib.core.usecases.annotations import DownloadAnnotations
+from lib.core.usecases.annotations import GetAnnotations
+from lib.core.usecases.annotations import IterAnnotations
+
+
+class TestGetAnnotationsPipeline(TestCase):
+    PAGES = [
+        [BaseItemEntity(id=p * 10 + i, name=f"{p}_{i}") for i in range(3)]
+        for p in range(3)
+    ]
+
+    def setUp(self):
+        self.events = []
+        self.classified = []
+        self.service_provider = MagicMock()
+        self.service_provider.item_service.iter_list.side_effect = self._iter_list
+        self.service_provider.annotations.iter_upload_chunks = self._classify
+        self.service_provider.annotations.list_small_annotations = self._list_small
+        self.service_provider.annotations.get_big_annotation = self._get_big
+
+    def _iter_list(self, project_id, folder_id, query):
+        for index, page in enumerate(self.PAGES):
+            time.sleep(0.05)
+            self.events.append(f"listed_{index}")
+            yield page
+
+    async def _classify(self, project, item_ids):
+        self.classified.extend(item_ids)
+        yield {
+            "large": [{"id": item_ids[0]}],
+            "small": [[{"id": i} for i in item_ids[1:]]],
+        }
+
+    async def _list_small(self, item_ids, **kwargs):
+        self.events.append(f"fetched_{item_ids[0] // 10}")
+        return [{"metadata": {"id": i}} for i in item_ids]
+
+    async def _get_big(self, item, **kwargs):
+        return {"metadata": {"id": item.id}}
+
+    async def _iter_small(self, item_ids, **kwargs):
+        for item_id in item_ids:
+            yield {"metadata": {"id": item_id}}
+
+    def _get_annotations(self, use_case_class=GetAnnotations):
+        return use_case_class(
+            config=ConfigEntity(SA_TOKEN="a" * 24 + "t=1"),
+            reporter=MagicMock(),
+            project=ProjectEntity(id=1, name="p", type=1, team_id=1),
+            folder=FolderEntity(id=1, name="root", project_id=1, team_id=1),
+            service_provider=self.service_provider,
+            items=None,
+            sync_state=MagicMock(),
+        )
+
+    def test_annotations_are_fetched_while_listing(self):
+        response = self._get_annotations().execute()
+        assert not response.errors
+        assert sorted(a["metadata"]["id"] for a in response.data) == sorted(
+            i.id for page in self.PAGES for i in page
+        )
+        assert self.events.index("fetched_0") < self.events.index("listed_2")
+
+    def test_slots_are_not_held_while_the_buffer_is_full(self):
+        self.service_provider.annotations.iter_small_annotations = self._iter_small
+        use_case = self._get_annotations(IterAnnotations)
+        use_case.BUFFER_SIZE = 1
+        items = [i for page in self.PAGES for i in page]
+
+        async def _run():
+            annotations = use_case.iter_workers(items)
+            received = [await anext(annotations)]
+            # the producers wait for the slow consumer
+            await asyncio.sleep(0.05)
+            active = use_case._concurrency_limit.active
+            received.extend([annotation async for annotation in annotations])
+            return active, received
+
+        active, received = asyncio.run(_run())
+        assert active == 0
+        assert len(received) == len(items)
+
+    def test_no_items(self):
+        self.PAGES = []
+        response = self._get_annotations().execute()
+        assert response.data == []
+        assert not self.classified
+
+
+class TestDownloadFolders(TestCase):
+    FOLDERS = [
+        FolderEntity(id=i, name=f"folder_{i}", project_id=1, team_id=1)
+        for i in range(1, 11)
+    ]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.listing, self.max_listing = 0, 0
+        self.lock = threading.Lock()
+        self.service_provider = MagicMock()
+        self.service_provider.folders.list.return_value.data = self.FOLDERS
+        self.service_provider.item_service.list.side_effect = self._list
+        self.service_provider.annotations.iter_upload_chunks = self._classify
+        self.service_provider.annotations.download_small_annotations = self._download
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _list(self, project_id, folder_id, query):
+        with self.lock:
+            self.listing += 1
+            self.max_listing = max(self.max_listing, self.listing)
+        time.sleep(0.05)
+        with self.lock:
+            self.listing -= 1
+        return [BaseItemEntity(id=folder_id * 10 + i, name=str(i)) for i in range(2)]
+
+    @staticmethod
+    async def _classify(project, item_ids):
+        yield {"large": [], "small": [[{"id": i} for i in item_ids]]}
+
+    @staticmethod
+    async def _download(download_path, item_ids, **kwargs):
+        os.makedirs(download_path, exist_ok=True)
+        for item_id in item_ids:
+            Path(download_path, f"{item_id}.json").write_text("{}")
+
+    def test_folders_are_downloaded_concurrently(self):
+        use_case = DownloadAnnotations(
+            config=ConfigEntity(SA_TOKEN="a" * 24 + "t=1"),
+            reporter=MagicMock(),
+            project=ProjectEntity(id=1, name="p", type=1, team_id=1),
+            folder=FolderEntity(
+                id=0, name="root", project_id=1, team_id=1, is_root=True
+            ),
+            destination=self._tmp.name,
+            recursive=True,
+            item_names=[],
+            service_provider=self.service_provider,
+        )
+        response = use_case.execute()
+        assert not response.errors
+        assert self.max_listing > 1
+        for folder in self.FOLDERS:
+            assert sorted(os.listdir(Path(self._tmp.name) / folder.name)) == [
+                f"{folder.id * 10}.json",
+                f"{folder.id * 10 + 1}.json",
+            ]
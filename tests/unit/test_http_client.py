@@ -1,8 +1,12 @@
+import asyncio
 import os
 import platform
 from unittest import TestCase
 from unittest.mock import patch
 
+from lib.core.service_types import ServiceResponse
+from lib.core.utils import EventLoopRunner
+from lib.core.utils import run_async
 from src.superannotate.lib.infrastructure.services.http_client import HttpClient
 
 
@@ -50,3 +54,73 @@ class TestHttpClient(TestCase):
                 f"OS: {platform.system()}; Team: {self.team_id}"
             )
             assert headers["User-Agent"] == expected_user_agent
+
+    def test_aio_connector_shared_within_loop(self):
+        client = HttpClient(self.api_url, self.token, pool_size_per_host=4)
+        runner = EventLoopRunner()
+
+        async def _get_connectors():
+            first = client.get_aio_connector()
+            second = await asyncio.create_task(self._get_connector(client))
+            return first, second
+
+        first, second = runner.run(_get_connectors())
+        assert first is second
+        assert first.limit_per_host == 4
+        assert not first.closed
+        assert runner.run(self._get_connector(client)) is first
+        runner.close()
+        assert first.closed
+
+    def test_aio_connector_per_loop(self):
+        client = HttpClient(self.api_url, self.token)
+        first = run_async(self._get_connector(client))
+        second = run_async(self._get_connector(client))
+        other_runner = EventLoopRunner()
+        third = other_runner.run(self._get_connector(client))
+        other_runner.close()
+        assert first is second
+        assert first is not third
+
+    @staticmethod
+    async def _get_connector(client):
+        return client.get_aio_connector()
+
+    def _paginated_client(self, total, chunk_size, page_sizes=None):
+        client = HttpClient(self.api_url, self.token)
+        offsets = []
+
+        def request(url, method="get", data=None, dispatcher=None, **kwargs):
+            offset = data["query"]["offset"]
+            offsets.append(offset)
+            size = (page_sizes or {}).get(offset, chunk_size)
+            return ServiceResponse(
+                status=200,
+                res_data=list(range(offset, min(offset + size, total))),
+                count=total,
+            )
+
+        client.request = request
+        return client, offsets
+
+    def test_jsx_paginate_merges_pages_in_order(self):
+        client, offsets = self._paginated_client(total=1050, chunk_size=100)
+        response = client.jsx_paginate("items", "post", chunk_size=100)
+        assert response.ok
+        assert response.data == list(range(1050))
+        assert sorted(offsets) == list(range(0, 1050, 100))
+
+    def test_jsx_paginate_stops_on_partial_page(self):
+        client, _ = self._paginated_client(
+            total=1000, chunk_size=100, page_sizes={300: 50}
+        )
+        response = client.jsx_paginate("items", "post", chunk_size=100)
+        assert response.data == list(range(350))
+
+    def test_iter_jsx_paginate_is_lazy(self):
+        client, offsets = self._paginated_client(total=100_000, chunk_size=100)
+        pages = client.iter_jsx_paginate("items", "post", chunk_size=100)
+        assert next(pages).data == list(range(100))
+        assert next(pages).data == list(range(100, 200))
+        pages.close()
+        assert len(offsets) <= 2 + HttpClient.PAGINATION_WORKERS
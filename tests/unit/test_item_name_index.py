@@ -0,0 +1,65 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from lib.core.entities import BaseItemEntity
+from lib.infrastructure.utils import ItemNameIndex
+
+
+class TestItemNameIndex(TestCase):
+    def setUp(self):
+        self.requested = []
+        self.threads = set()
+        self.item_service = MagicMock()
+        self.item_service.list.side_effect = self._list
+        self.index = ItemNameIndex(self.item_service, ttl_seconds=60)
+        self.index.CHUNK_SIZE = 10
+
+    def _list(self, project_id, folder_id, query):
+        names = query.build_query().split("||")[-1].split(",")
+        self.requested.append(names)
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        items = [
+            BaseItemEntity(id=int(name[5:]), name=name)
+            for name in names
+            if not name.endswith("missing")
+        ]
+        # the backend matches the names case-insensitively
+        return items + [BaseItemEntity(id=-1, name="ITEM_1")]
+
+    def test_names_are_listed_in_parallel_chunks(self):
+        names = [f"item_{i}" for i in range(35)] + ["item_missing"]
+        resolved = self.index.resolve(1, 2, names)
+        assert sorted(resolved) == sorted(names[:-1])
+        assert resolved["item_7"].id == 7
+        assert len(self.requested) == 4
+        assert len(self.threads) > 1
+
+    def test_found_items_are_reused(self):
+        self.index.resolve(1, 2, ["item_1", "item_2", "item_missing"])
+        self.requested.clear()
+        resolved = self.index.resolve(1, 2, ["item_2", "item_3", "item_missing"])
+        assert sorted(resolved) == ["item_2", "item_3"]
+        assert self.requested == [["item_3", "item_missing"]]
+        self.index.resolve(1, 3, ["item_2"])
+        assert self.requested[-1] == ["item_2"]
+
+    def test_only_requested_names_are_returned(self):
+        assert list(self.index.resolve(1, 2, ["item_1"])) == ["item_1"]
+        assert self.index.resolve(1, 2, ["item_missing"]) == {}
+
+    def test_items_are_not_kept_by_default(self):
+        index = ItemNameIndex(self.item_service)
+        index.resolve(1, 2, ["item_1"])
+        index.resolve(1, 2, ["item_1"])
+        assert len(self.requested) == 2
+
+    def test_expiration_and_invalidation(self):
+        self.index.resolve(1, 2, ["item_1"])
+        self.index.invalidate(1)
+        self.index.resolve(1, 2, ["item_1"])
+        self.index.ttl_seconds = 0
+        self.index.resolve(1, 2, ["item_1"])
+        assert len(self.requested) == 3
@@ -0,0 +1,78 @@
+import io
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from enum import Enum
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import UUID
+
+import numpy as np
+from lib.core import json
+from pydantic import BaseModel
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class Point(BaseModel):
+    x: int
+    y: int | None = None
+
+
+@dataclass
+class Size:
+    width: int
+    height: int
+
+
+class TestJSON(TestCase):
+    DATA = {"name": "ü", "color": Color.RED, "point": Point(x=1), 1: [1.5, None]}
+    EXPECTED = {"name": "ü", "color": "red", "point": {"x": 1}, "1": [1.5, None]}
+
+    def _assert_backend(self):
+        assert json.loads(json.dumps(self.DATA)) == self.EXPECTED
+        assert json.loads(json.dumpb(self.DATA)) == self.EXPECTED
+        assert json.loads(json.dumps(self.DATA, indent=4)) == self.EXPECTED
+        assert json.loads(json.dumpb({"big": 2**70})) == {"big": 2**70}
+        assert json.loads('{"value": NaN}')["value"] != 0
+        assert json.dumpb({"a": [{"b": float("nan")}, None]}) == (
+            b'{"a":[{"b":NaN},null]}'
+        )
+        assert json.loads(json.dumpb({"a": float("-inf")}))["a"] == float("-inf")
+        with self.assertRaises(ValueError):
+            json.dumpb({"value": float("nan")}, allow_nan=False)
+        with self.assertRaises(json.JSONDecodeError):
+            json.loads("{")
+
+    def test_default_backend(self):
+        self._assert_backend()
+
+    def test_standard_library_backend(self):
+        with patch.object(json, "orjson", None):
+            self._assert_backend()
+
+    def test_backends_write_the_same_bytes(self):
+        data = {
+            **self.DATA,
+            "created": datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+            "day": datetime(2024, 1, 2).date(),
+            "id": UUID(int=1),
+            "size": Size(1, 2),
+            "mask": np.array([[0, 1]], dtype=np.uint8),
+            "score": np.float64(0.5),
+            "text": "ü €",
+        }
+        content = json.dumpb(data)
+        with patch.object(json, "orjson", None):
+            assert json.dumpb(data) == content
+        assert json.loads(content)["created"] == "2024-01-02T03:04:05.123456+00:00"
+        assert "ü €".encode() in content
+
+    def test_dump_to_text_and_binary_files(self):
+        text, binary = io.StringIO(), io.BytesIO()
+        json.dump(self.DATA, text)
+        json.dump(self.DATA, binary)
+        assert json.loads(text.getvalue()) == self.EXPECTED
+        assert json.load(io.BytesIO(binary.getvalue())) == self.EXPECTED
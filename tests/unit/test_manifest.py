@@ -0,0 +1,126 @@
+import os
+import tempfile
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest import TestCase
+
+from lib.core.entities import BaseItemEntity
+from lib.core.manifest import DownloadManifest
+from lib.core.manifest import HighWaterMarkStore
+from lib.core.manifest import to_timestamp
+from lib.infrastructure.utils import store_annotation
+
+
+class TestDownloadManifest(TestCase):
+    UPDATED_AT = "2024-01-01T00:00:00.000Z"
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.destination = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _store(self, manifest, item_id, name, updated_at=UPDATED_AT):
+        path = os.path.join(self.destination, f"{name}.json")
+        size, checksum = store_annotation(path, {"metadata": {"name": name}})
+        manifest.add(item_id, updated_at, path, size, checksum)
+        return path
+
+    def test_stored_item_is_up_to_date_after_reload(self):
+        manifest = DownloadManifest(self.destination)
+        path = self._store(manifest, 1, "item_1")
+        manifest.close()
+
+        manifest = DownloadManifest(self.destination).load()
+        assert manifest.is_up_to_date(1, self.UPDATED_AT, path)
+        assert not manifest.is_up_to_date(1, "2024-02-01T00:00:00.000Z", path)
+        assert not manifest.is_up_to_date(1, self.UPDATED_AT, path, "llmJsonV2")
+        assert not manifest.is_up_to_date(2, self.UPDATED_AT, path)
+
+    def test_changed_or_missing_file_is_not_up_to_date(self):
+        manifest = DownloadManifest(self.destination)
+        path = self._store(manifest, 1, "item_1")
+        with open(path, "a") as file:
+            file.write(" ")
+        assert not manifest.is_up_to_date(1, self.UPDATED_AT, path)
+        os.remove(path)
+        assert not manifest.is_up_to_date(1, self.UPDATED_AT, path)
+
+    def test_edited_file_of_same_size_is_not_up_to_date(self):
+        manifest = DownloadManifest(self.destination)
+        path = self._store(manifest, 1, "item_1")
+        with open(path, "r+b") as file:
+            file.seek(-2, os.SEEK_END)
+            file.write(b"  ")
+        assert not manifest.is_up_to_date(1, self.UPDATED_AT, path)
+        unverified = DownloadManifest(self.destination, verify_checksums=False).load()
+        assert unverified.is_up_to_date(1, self.UPDATED_AT, path)
+
+    def test_interrupted_manifest_is_loaded(self):
+        manifest = DownloadManifest(self.destination)
+        path = self._store(manifest, 1, "item_1")
+        self._store(manifest, 1, "item_1", updated_at="2024-02-01T00:00:00.000Z")
+        with open(manifest.path, "a") as file:
+            file.write('{"id": 2, "updat')
+
+        manifest = DownloadManifest(self.destination).load()
+        assert manifest.is_up_to_date(1, "2024-02-01T00:00:00.000Z", path)
+        assert not manifest.is_up_to_date(1, self.UPDATED_AT, path)
+
+    def test_close_compacts_entries(self):
+        manifest = DownloadManifest(self.destination)
+        self._store(manifest, 1, "item_1")
+        self._store(manifest, 1, "item_1", updated_at="2024-02-01T00:00:00.000Z")
+        self._store(manifest, 2, "item_2")
+        manifest.close()
+        with open(manifest.path) as file:
+            assert len(file.readlines()) == 2
+
+
+class TestHighWaterMarkStore(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, HighWaterMarkStore.FILE_NAME)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_to_timestamp(self):
+        expected = "2024-01-01T10:00:00.000Z"
+        assert to_timestamp("2024-01-01T10:00:00Z") == expected
+        assert to_timestamp("2024-01-01T12:00:00+02:00") == expected
+        assert to_timestamp(datetime(2024, 1, 1, 10)) == expected
+        tz = timezone(timedelta(hours=-1))
+        assert to_timestamp(datetime(2024, 1, 1, 9, tzinfo=tz)) == expected
+        assert to_timestamp("2024-01-01T10:00:00.5Z") == "2024-01-01T10:00:00.500Z"
+        with self.assertRaises(ValueError):
+            to_timestamp("yesterday")
+
+    def test_item_updated_at_is_stored(self):
+        item = BaseItemEntity(id=1, name="a", updatedAt="2024-01-01T10:00:00.123Z")
+        assert item.updatedAt == "2024-01-01T10:00:00.123000.000Z"
+        assert to_timestamp(item.updatedAt) == "2024-01-01T10:00:00.123Z"
+        store = HighWaterMarkStore(self.path)
+        key = HighWaterMarkStore.get_key(1, None)
+        store.update(key, item.updatedAt)
+        assert store.get(key) == "2024-01-01T10:00:00.123Z"
+
+    def test_mark_moves_forward_only(self):
+        store = HighWaterMarkStore(self.path)
+        key = HighWaterMarkStore.get_key(1, 2)
+        assert store.get(key) is None
+        store.update(key, "2024-02-01T00:00:00.000Z")
+        store.update(key, "2024-01-01T00:00:00.000Z")
+        store.update(key, None)
+        assert HighWaterMarkStore(self.path).get(key) == "2024-02-01T00:00:00.000Z"
+        assert store.get(HighWaterMarkStore.get_key(1, None)) is None
+
+    def test_invalid_file_is_ignored(self):
+        with open(self.path, "w") as file:
+            file.write("{")
+        store = HighWaterMarkStore(self.path)
+        assert store.get("1/") is None
+        store.update("1/", "2024-01-01T00:00:00.000Z")
+        assert store.get("1/") == "2024-01-01T00:00:00.000Z"
@@ -0,0 +1,141 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from lib.app.interface.responses import QueryResult
+from lib.core.entities import ProjectEntity
+from lib.core.exceptions import AppException
+from lib.core.service_types import ServiceResponse
+from lib.infrastructure.services.explore import ExploreService
+from lib.infrastructure.services.http_client import HttpClient
+
+
+class TestIterSaqulQuery(TestCase):
+    ITEMS_COUNT = 420
+
+    def setUp(self):
+        self.requested = []
+        self.lock = threading.Lock()
+        self.client = HttpClient("https://api.superannotate.com", "a" * 24 + "t=1")
+        self.service = ExploreService(self.client)
+        self.project = ProjectEntity(id=1, name="p", type=1, team_id=1)
+
+    def _request(self, url, method, params=None, data=None):
+        index = data["image_index"]
+        with self.lock:
+            self.requested.append(index)
+        if index == 100 and self.ITEMS_COUNT < 0:
+            return ServiceResponse(status=500, res_error="Failed.")
+        end = min(index + ExploreService.SAQUL_CHUNK_SIZE, abs(self.ITEMS_COUNT))
+        return ServiceResponse(
+            status=200, res_data=[{"id": i} for i in range(index, end)]
+        )
+
+    def _query(self, prefetch):
+        with patch.object(self.client, "request", side_effect=self._request):
+            return [
+                page
+                for page in self.service.iter_saqul_query(
+                    self.project, query="a", prefetch=prefetch
+                )
+            ]
+
+    def test_pages(self):
+        for prefetch in (0, 3):
+            pages = self._query(prefetch)
+            assert [i["id"] for page in pages for i in page] == list(range(420))
+            assert len(pages) == 9
+
+    def test_pages_are_fetched_on_demand(self):
+        with patch.object(self.client, "request", side_effect=self._request):
+            pages = self.service.iter_saqul_query(self.project, prefetch=2)
+            next(pages)
+            assert self.requested == [0]
+            next(pages)
+            pages.close()
+        assert len(self.requested) <= 4
+
+    def test_closing_cancels_the_queued_prefetches(self):
+        self.ITEMS_COUNT = 2000
+
+        def _slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return self._request(*args, **kwargs)
+
+        with patch.object(self.client, "request", side_effect=_slow_request):
+            pages = self.service.iter_saqul_query(self.project, prefetch=12)
+            next(pages)
+            next(pages)
+            pages.close()
+            time.sleep(0.2)
+        # only the requests the workers had started are sent
+        assert len(self.requested) <= 1 + 2 * HttpClient.PAGINATION_WORKERS
+
+    def test_small_result_is_not_prefetched(self):
+        self.ITEMS_COUNT = 30
+        pages = self._query(4)
+        assert [len(page) for page in pages] == [30]
+        assert self.requested == [0]
+
+    def test_error(self):
+        self.ITEMS_COUNT = -420
+        with self.assertRaises(AppException):
+            self._query(2)
+
+
+class TestQueryResult(TestCase):
+    def setUp(self):
+        self.prefetches = []
+        self.fetched_pages = 0
+
+    def _fetch_pages(self, prefetch, fail_at=None):
+        self.prefetches.append(prefetch)
+        for page in range(3):
+            if page == fail_at:
+                raise AppException("Failed.")
+            self.fetched_pages += 1
+            yield [{"id": page * 2}, {"id": page * 2 + 1}]
+
+    def test_iteration_streams_the_pages(self):
+        result = QueryResult(self._fetch_pages, lambda: 6)
+        for item in result:
+            if item["id"] == 1:
+                break
+        assert self.fetched_pages == 1
+        assert self.prefetches == [QueryResult.PREFETCH_PAGES]
+        assert [len(page) for page in result.iter_pages(prefetch=0)] == [2, 2, 2]
+        assert self.prefetches[-1] == 0
+        assert result.count() == 6
+
+    def test_streamed_items_are_kept(self):
+        result = QueryResult(self._fetch_pages, lambda: 6)
+        for item in result:
+            if item["id"] == 2:
+                break
+        assert self.fetched_pages == 2
+        assert [i["id"] for i in result] == list(range(6))
+        assert [i["id"] for i in result] == list(range(6))
+        assert len(result) == 6
+        assert self.fetched_pages == 3
+        assert self.prefetches == [QueryResult.PREFETCH_PAGES]
+
+    def test_failed_stream_starts_over(self):
+        fail_at = [1]
+        result = QueryResult(
+            lambda prefetch: self._fetch_pages(
+                prefetch, fail_at.pop() if fail_at else None
+            ),
+            lambda: 6,
+        )
+        with self.assertRaises(AppException):
+            list(result)
+        assert [i["id"] for i in result] == list(range(6))
+
+    def test_list_operations_load_once(self):
+        result = QueryResult(self._fetch_pages, lambda: 6)
+        assert len(result) == 6
+        assert result[5] == {"id": 5}
+        assert [i["id"] for i in result] == list(range(6))
+        assert isinstance(result, list)
+        assert len(self.prefetches) == 1
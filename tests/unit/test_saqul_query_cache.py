@@ -0,0 +1,57 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from lib.core.entities import ProjectEntity
+from lib.core.service_types import ServiceResponse
+from lib.infrastructure.utils import SaqulQueryCache
+
+
+class TestSaqulQueryCache(TestCase):
+    def setUp(self):
+        self.explore = MagicMock()
+        self.explore.validate_saqul_query.side_effect = self._validate
+        self.cache = SaqulQueryCache(self.explore, ttl_seconds=10, max_size=2)
+        self.project = ProjectEntity(id=1, name="p", type=1, team_id=1)
+
+    @staticmethod
+    def _validate(project, query):
+        if query == "broken":
+            return ServiceResponse(status=500, res_error="Failed.")
+        return ServiceResponse(
+            status=200, res_data={"isValidQuery": True, "parsedQuery": query.upper()}
+        )
+
+    def _requested(self):
+        return [c.args[1] for c in self.explore.validate_saqul_query.call_args_list]
+
+    def test_responses_are_reused(self):
+        for _ in range(3):
+            response = self.cache.validate(self.project, "a")
+        assert response.data["parsedQuery"] == "A"
+        assert self._requested() == ["a"]
+        other_project = ProjectEntity(id=2, name="p2", type=1, team_id=1)
+        self.cache.validate(other_project, "a")
+        assert self._requested() == ["a", "a"]
+
+    def test_least_recently_used_are_dropped(self):
+        self.cache.validate(self.project, "a")
+        self.cache.validate(self.project, "b")
+        self.cache.validate(self.project, "a")
+        self.cache.validate(self.project, "c")
+        self.cache.validate(self.project, "a")
+        self.cache.validate(self.project, "b")
+        assert self._requested() == ["a", "b", "c", "b"]
+
+    def test_expiration_and_invalidation(self):
+        self.cache.validate(self.project, "a")
+        with patch("lib.infrastructure.utils.time.time", return_value=10**10):
+            self.cache.validate(self.project, "a")
+        self.cache.invalidate(self.project.id)
+        self.cache.validate(self.project, "a")
+        assert self._requested() == ["a", "a", "a"]
+
+    def test_errors_are_not_kept(self):
+        assert not self.cache.validate(self.project, "broken").ok
+        assert not self.cache.validate(self.project, "broken").ok
+        assert self._requested() == ["broken", "broken"]
@@ -0,0 +1,81 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from lib.core.entities import FolderEntity
+from lib.core.entities import ProjectEntity
+from lib.core.service_types import ServiceResponse
+from lib.core.usecases.items import SetAnnotationStatues
+from lib.core.usecases.items import SetApprovalStatues
+
+
+class TestSetStatuses(TestCase):
+    NAMES = [f"item_{i}" for i in range(2000)]
+
+    def setUp(self):
+        self.threads = set()
+        self.reporter = MagicMock()
+        self.service_provider = MagicMock()
+        self.service_provider.get_items_by_name.side_effect = (
+            lambda project, folder, names: {
+                name: MagicMock() for name in names if name != "missing"
+            }
+        )
+        self.service_provider.items.set_statuses.side_effect = self._set_statuses
+        self.service_provider.items.set_approval_statuses.side_effect = (
+            self._set_statuses
+        )
+
+    def _set_statuses(self, item_names, **kwargs):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        if "item_0" in item_names:
+            return ServiceResponse(status=400, res_error="Failed.")
+        return ServiceResponse(status=200, res_data=item_names)
+
+    def _kwargs(self):
+        return dict(
+            reporter=self.reporter,
+            project=ProjectEntity(id=1, name="p", type=1, team_id=1),
+            folder=FolderEntity(id=1, name="root", project_id=1, team_id=1),
+            service_provider=self.service_provider,
+            item_names=self.NAMES + ["missing"],
+        )
+
+    def test_annotation_statuses_are_set_concurrently(self):
+        response = SetAnnotationStatues(annotation_status=1, **self._kwargs()).execute()
+        assert self.service_provider.items.set_statuses.call_count == 4
+        assert len(self.threads) > 1
+        self.service_provider.get_items_by_name.assert_called_once()
+        # all the names of the failed chunk are in the error
+        message = str(response.errors)
+        assert message.startswith("Failed to change status of the items: item_0, ")
+        assert message.count("item_") == 500 and "item_1999" not in message
+        # only the first names are in the warning
+        (message,), _ = self.reporter.log_warning.call_args
+        assert message.startswith("Failed to update 500/2000 item(s): item_0, ")
+        assert message.endswith(" and 490 more")
+
+    def test_approval_statuses_of_all_chunks_are_set(self):
+        self.NAMES = self.NAMES[1:]
+        response = SetApprovalStatues(
+            approval_status="Approved", **self._kwargs()
+        ).execute()
+        assert not response.errors
+        set_names = [
+            name
+            for call in self.service_provider.items.set_approval_statuses.mock_calls
+            for name in call.kwargs["item_names"]
+        ]
+        assert sorted(set_names) == sorted(self.NAMES)
+
+    def test_approval_status_error_lists_the_failed_items(self):
+        self.NAMES = self.NAMES[:5]
+        response = SetApprovalStatues(
+            approval_status="Approved", **self._kwargs()
+        ).execute()
+        assert str(response.errors).startswith(
+            "Failed to change approval status of the items: "
+        )
+        assert str(response.errors).count("item_") == 5
@@ -0,0 +1,74 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from lib.core import json
+from lib.infrastructure.utils import ANNOTATION_SNIFF_SIZE
+from lib.infrastructure.utils import iter_utf8_parts
+from lib.infrastructure.utils import store_annotation_stream
+
+
+async def _chunks(data: bytes, size: int, fail: bool = False):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]  # noqa: E203
+        if fail:
+            raise ConnectionError("Connection lost.")
+
+
+class TestStoreAnnotationStream(TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "item.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _store(self, data: bytes, size: int = 7, fail: bool = False):
+        return asyncio.run(
+            store_annotation_stream(self.path, _chunks(data, size, fail))
+        )
+
+    def test_big_annotation_is_written_as_received(self):
+        data = json.dumpb(
+            {
+                "metadata": {"name": "item"},
+                "instances": [{"x": i} for i in range(ANNOTATION_SNIFF_SIZE // 5)],
+            }
+        )
+        assert len(data) > ANNOTATION_SNIFF_SIZE
+        size, checksum = self._store(data, size=4096)
+        assert self.path.read_bytes() == data
+        assert size == len(data)
+        assert checksum == hashlib.md5(data).hexdigest()
+        assert os.listdir(self._tmp.name) == ["item.json"]
+
+    def test_invalid_annotations_are_not_stored(self):
+        big_without_metadata = json.dumpb({"instances": "x" * ANNOTATION_SNIFF_SIZE})
+        for data in (b'{"error": "Not found"}', b"[]", b"{", big_without_metadata):
+            assert self._store(data) is None
+            assert os.listdir(self._tmp.name) == []
+
+    def test_interrupted_download_leaves_no_files(self):
+        with self.assertRaises(ConnectionError):
+            self._store(json.dumpb({"metadata": {}}), fail=True)
+        assert os.listdir(self._tmp.name) == []
+
+
+class TestAnnotationBuffer(TestCase):
+    DATA = json.dumpb({"metadata": {"name": "ü€𝄞"}, "comment": "ä" * 100})
+
+    def _split(self, view: memoryview, size: int) -> list[str]:
+        parts = []
+        for start, end in iter_utf8_parts(view, size):
+            with view[start:end] as part:
+                assert len(part) <= size
+                parts.append(str(part, "utf-8"))
+        return parts
+
+    def test_parts_do_not_split_characters(self):
+        with memoryview(self.DATA) as view:
+            for size in range(4, 50):
+                assert "".join(self._split(view, size)) == self.DATA.decode()
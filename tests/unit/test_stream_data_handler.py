@@ -0,0 +1,52 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from lib.core import json
+from lib.infrastructure.stream_data_handler import DelimitedJSONParser
+from lib.infrastructure.stream_data_handler import StreamedAnnotations
+
+DELIMITER = StreamedAnnotations.DELIMITER.encode()
+
+
+class TestDelimitedJSONParser(TestCase):
+    ANNOTATIONS = [
+        {"metadata": {"name": "ü"}, "instances": []},
+        {"metadata": {"name": "b"}, "comment": "tricky \n;)\n text"},
+        {"metadata": {"name": "c"}, "instances": [{"x": 1.5}]},
+    ]
+
+    def _parse(self, data: bytes, chunk_size: int) -> list:
+        parser = DelimitedJSONParser(DELIMITER)
+        result = []
+        for i in range(0, len(data), chunk_size):
+            result.extend(parser.feed(data[i : i + chunk_size]))  # noqa: E203
+        result.extend(parser.close())
+        return result
+
+    def _stream(self, leading=False, trailing=False) -> bytes:
+        data = DELIMITER.join(json.dumpb(i) for i in self.ANNOTATIONS)
+        return (DELIMITER if leading else b"") + data + (DELIMITER if trailing else b"")
+
+    def test_any_chunk_boundaries(self):
+        data = self._stream(trailing=True)
+        assert DELIMITER in json.dumpb(self.ANNOTATIONS[1])
+        for chunk_size in range(1, len(data) + 1):
+            assert self._parse(data, chunk_size) == self.ANNOTATIONS, chunk_size
+
+    def test_leading_and_missing_trailing_delimiter(self):
+        for leading in (True, False):
+            for trailing in (True, False):
+                data = self._stream(leading, trailing)
+                assert self._parse(data, 7) == self.ANNOTATIONS
+
+    def test_standard_library_backend(self):
+        with patch.object(json, "orjson", None):
+            assert self._parse(self._stream(), 5) == self.ANNOTATIONS
+
+    def test_frames_are_yielded_as_soon_as_complete(self):
+        parser = DelimitedJSONParser(DELIMITER)
+        first = json.dumpb(self.ANNOTATIONS[0])
+        assert list(parser.feed(first)) == []
+        assert list(parser.feed(DELIMITER[:2])) == []
+        assert list(parser.feed(DELIMITER[2:])) == [self.ANNOTATIONS[0]]
+        assert list(parser.close()) == []
@@ -0,0 +1,190 @@
+import asyncio
+import io
+import json
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from lib.core.entities import BaseItemEntity
+from lib.core.entities import ProjectEntity
+from lib.core.service_types import ServiceResponse
+from lib.core.usecases.annotations import _get_worker_context
+from lib.core.usecases.annotations import _init_annotation_worker
+from lib.core.usecases.annotations import ItemToUpload
+from lib.core.usecases.annotations import Report
+from lib.core.usecases.annotations import serialize_annotation
+from lib.core.usecases.annotations import upload_big_annotations
+from lib.core.usecases.annotations import UploadAnnotationsFromFolderUseCase
+from lib.core.usecases.annotations import UploadAnnotationsUseCase
+from lib.core.usecases.annotations import ValidateAnnotationUseCase
+from lib.core.utils import run_async
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"instances": {"type": "array"}},
+    "required": ["metadata"],
+}
+
+
+class TestSerializeAnnotation(TestCase):
+    def setUp(self):
+        _init_annotation_worker({ValidateAnnotationUseCase.DEFAULT_VERSION: SCHEMA})
+
+    def test_serialize_and_validate(self):
+        annotation = {"metadata": {"name": "a"}, "instances": []}
+        content, errors = serialize_annotation(annotation, validate=True)
+        assert json.loads(content) == annotation
+        assert errors == []
+
+    def test_validation_errors(self):
+        _, errors = serialize_annotation({"instances": {}}, validate=True)
+        assert len(errors) == 2
+
+    def test_nan_is_not_allowed(self):
+        with self.assertRaises(ValueError):
+            serialize_annotation({"value": float("nan")}, validate=False)
+
+
+class TestUploadAnnotationsDistribution(TestCase):
+    @staticmethod
+    def _distribute(process_count: int, annotations: list[dict]):
+        service_provider = MagicMock()
+        service_provider.annotations.get_schema.return_value = ServiceResponse(
+            status=200, res_data=SCHEMA
+        )
+        use_case = UploadAnnotationsUseCase(
+            reporter=MagicMock(),
+            project=ProjectEntity(id=1, name="p", type=1, team_id=1),
+            folder=MagicMock(),
+            annotations=annotations,
+            service_provider=service_provider,
+            user=MagicMock(),
+            process_count=process_count,
+        )
+        items = [
+            ItemToUpload(
+                item=BaseItemEntity(id=i, name=a["metadata"]["name"]), annotation_json=a
+            )
+            for i, a in enumerate(annotations)
+        ]
+
+        async def _run():
+            use_case._big_files_queue = asyncio.Queue()
+            use_case._small_files_queue = asyncio.Queue()
+            await use_case.distribute_queues(items)
+            queued = []
+            while (item := use_case._small_files_queue.get_nowait()) is not None:
+                queued.append(item)
+            return queued
+
+        queued = asyncio.run(_run())
+        assert use_case._executor is None
+        return queued, use_case._report.failed_annotations
+
+    def test_workers_are_not_forked(self):
+        assert _get_worker_context().get_start_method() in ("forkserver", "spawn")
+
+    def test_process_pool_matches_in_loop(self):
+        annotations = [
+            {"metadata": {"name": f"item_{i}"}, "instances": [{"x": i}]}
+            for i in range(10)
+        ]
+        annotations[3]["instances"] = {}
+        annotations[5]["value"] = float("nan")
+        for process_count in (0, 2):
+            queued, failed = self._distribute(process_count, annotations)
+            assert [i.item.name for i in queued] == [
+                f"item_{i}" for i in range(10) if i not in (3, 5)
+            ]
+            assert all(i.file_size == len(i.content) for i in queued)
+            assert json.loads(queued[0].content) == annotations[0]
+            assert sorted(failed) == ["item_3", "item_5"]
+
+
+class TestUploadBigAnnotations(TestCase):
+    class Service:
+        def __init__(self):
+            self.sent = []
+
+        async def send_big_annotation(self, item_id, data, **kwargs):
+            if item_id == 3:
+                raise ConnectionError("Connection lost.")
+            self.sent.append(json.loads(data))
+            return None if item_id == 4 else f"upload_{item_id}"
+
+        async def wait_big_annotation_sync(self, item_id, upload_id, **kwargs):
+            await asyncio.sleep(0.2)
+            return upload_id == f"upload_{item_id}"
+
+    def test_sync_is_awaited_apart_from_sending(self):
+        service_provider = MagicMock()
+        service_provider.annotations = self.Service()
+        report, reporter, uploaded = Report([], [], [], []), MagicMock(), []
+
+        async def _run():
+            queue = asyncio.Queue()
+            for i in range(6):
+                queue.put_nowait(
+                    ItemToUpload(
+                        item=BaseItemEntity(id=i, name=f"item_{i}"),
+                        annotation_json={"metadata": {"name": f"item_{i}"}},
+                    )
+                )
+            queue.put_nowait(None)
+            await upload_big_annotations(
+                project=MagicMock(),
+                folder=MagicMock(),
+                queue=queue,
+                service_provider=service_provider,
+                reporter=reporter,
+                report=report,
+                callback=lambda i: uploaded.append(i.item.name),
+                workers=1,
+            )
+
+        started_at = time.monotonic()
+        asyncio.run(_run())
+        assert time.monotonic() - started_at < 0.5
+        assert len(service_provider.annotations.sent) == 5
+        assert sorted(uploaded) == ["item_0", "item_1", "item_2", "item_5"]
+        assert report.failed_annotations == ["item_3"]
+        assert reporter.update_progress.call_count == 6
+
+
+class TestBlockingCallsOffTheLoop(TestCase):
+    @staticmethod
+    def _get_annotation_from_s3(bucket, path):
+        time.sleep(0.5)
+        return io.BytesIO(b'{"metadata": {"name": "a"}, "instances": []}')
+
+    def test_s3_read_does_not_stall_other_threads(self):
+        use_case = UploadAnnotationsFromFolderUseCase(
+            reporter=MagicMock(),
+            project=ProjectEntity(id=1, name="p", type=2, team_id=1),
+            folder=MagicMock(),
+            user=MagicMock(email="a@b.c"),
+            annotation_paths=["a.json"],
+            service_provider=MagicMock(),
+            client_s3_bucket="bucket",
+        )
+        results = []
+        with patch.object(
+            UploadAnnotationsFromFolderUseCase,
+            "get_annotation_from_s3",
+            staticmethod(self._get_annotation_from_s3),
+        ):
+            thread = threading.Thread(
+                target=lambda: results.append(
+                    run_async(use_case.get_annotation("a.json"))
+                )
+            )
+            thread.start()
+            time.sleep(0.1)
+            started = time.monotonic()
+            run_async(asyncio.sleep(0))
+            elapsed = time.monotonic() - started
+            thread.join()
+        assert elapsed < 0.3
+        assert results[0][0]["metadata"]["name"] == "a"